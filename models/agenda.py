@@ -0,0 +1,124 @@
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+from models.campeonato import Campeonato
+from models.partida import Jogo
+
+DURACAO_JOGO = timedelta(hours=2)  # Tempo em que o local fica ocupado
+DESCANSO_MINIMO = timedelta(hours=48)  # Intervalo mínimo entre dois jogos da mesma equipe
+
+
+def normalizar_local(local: str) -> str:
+    return " ".join(local.split()).lower()
+
+
+@dataclass
+class Conflito:
+    tipo: str  # local ou descanso
+    alvo: str  # nome do local ou da equipe
+    jogo: Jogo
+    outro: Jogo
+
+    def descricao(self) -> str:
+        horarios = f"{self.jogo.data:%d/%m %H:%M} e {self.outro.data:%d/%m %H:%M}"
+        confronto = f"{self.outro.mandante.nome} x {self.outro.visitante.nome}"
+        if self.tipo == "local":
+            return f"{self.alvo} já está ocupado por {confronto} ({horarios})."
+        return f"{self.alvo} joga duas vezes sem o descanso mínimo ({confronto}; {horarios})."
+
+
+class AgendaJogos:
+    """Índice de horários dos jogos de um campeonato por local e por equipe.
+
+    Cada local e cada equipe guarda uma lista ordenada de (data, jogo_id);
+    `conflitos` encontra os vizinhos de um horário com bisect em O(log n) e
+    `auditar` varre as listas uma vez para apontar todos os conflitos da
+    temporada. Jogos cancelados não ocupam a agenda.
+    """
+
+    def __init__(self, duracao: timedelta = DURACAO_JOGO, descanso: timedelta = DESCANSO_MINIMO):
+        self.duracao = duracao
+        self.descanso = descanso
+        self._por_local: Dict[str, List[Tuple[datetime, str]]] = {}
+        self._por_equipe: Dict[str, List[Tuple[datetime, str]]] = {}
+        self._jogos: Dict[str, Tuple[Jogo, datetime, str]] = {}  # jogo_id -> (jogo, data, local indexados)
+
+    def _listas(self, jogo: Jogo, data: datetime, local: str):
+        return (
+            (self._por_local.setdefault(local, []), "local", jogo.local, self.duracao),
+            (self._por_equipe.setdefault(jogo.mandante.id, []), "descanso", jogo.mandante.nome, self.descanso),
+            (self._por_equipe.setdefault(jogo.visitante.id, []), "descanso", jogo.visitante.nome, self.descanso),
+        )
+
+    def adicionar(self, jogo: Jogo) -> None:
+        if jogo.status == "Cancelada" or jogo.id in self._jogos:
+            return
+        local = normalizar_local(jogo.local)
+        for lista, *_ in self._listas(jogo, jogo.data, local):
+            insort(lista, (jogo.data, jogo.id))
+        self._jogos[jogo.id] = (jogo, jogo.data, local)
+
+    def remover(self, jogo: Jogo) -> None:
+        indexado = self._jogos.pop(jogo.id, None)
+        if indexado is None:
+            return
+        _, data, local = indexado
+        for lista, *_ in self._listas(jogo, data, local):
+            posicao = bisect_left(lista, (data, jogo.id))
+            if posicao < len(lista) and lista[posicao] == (data, jogo.id):
+                del lista[posicao]
+
+    def atualizar(self, jogo: Jogo) -> None:
+        """Reindexa um jogo remarcado, cancelado ou reaberto."""
+        self.remover(jogo)
+        self.adicionar(jogo)
+
+    def reconstruir(self, camp: Campeonato) -> None:
+        self._por_local, self._por_equipe, self._jogos = {}, {}, {}
+        for fase in camp.fases:
+            for jogo in fase.jogos:
+                self.adicionar(jogo)
+
+    def conflitos(self, jogo: Jogo) -> List[Conflito]:
+        """Conflitos de local e de descanso de um jogo (novo ou já indexado) com os demais."""
+        encontrados = []
+        for lista, tipo, alvo, janela in self._listas(jogo, jogo.data, normalizar_local(jogo.local)):
+            posicao = bisect_left(lista, (jogo.data - janela,))
+            while posicao < len(lista) and lista[posicao][0] < jogo.data + janela:
+                outro_id = lista[posicao][1]
+                if outro_id != jogo.id and lista[posicao][0] > jogo.data - janela:
+                    encontrados.append(Conflito(tipo, alvo, jogo, self._jogos[outro_id][0]))
+                posicao += 1
+        return encontrados
+
+    def conflitos_de(self, jogos: Iterable[Jogo]) -> List[Conflito]:
+        """Verifica uma leva de jogos novos (uma rodada gerada) entre si e com a
+        agenda; os jogos ficam indexados só durante a verificação."""
+        encontrados, novos = [], []
+        for jogo in jogos:
+            encontrados += self.conflitos(jogo)
+            if jogo.id not in self._jogos:
+                self.adicionar(jogo)
+                novos.append(jogo)
+        for jogo in novos:
+            self.remover(jogo)
+        return encontrados
+
+    def auditar(self) -> List[Conflito]:
+        """Todos os conflitos da temporada em uma varredura das listas ordenadas."""
+        encontrados = []
+        for indice, tipo, janela in ((self._por_local, "local", self.duracao),
+                                     (self._por_equipe, "descanso", self.descanso)):
+            for chave, lista in indice.items():
+                for i, (data, jogo_id) in enumerate(lista):
+                    jogo = self._jogos[jogo_id][0]
+                    if tipo == "local":
+                        alvo = jogo.local
+                    else:
+                        alvo = jogo.mandante.nome if jogo.mandante.id == chave else jogo.visitante.nome
+                    j = i + 1
+                    while j < len(lista) and lista[j][0] - data < janela:
+                        encontrados.append(Conflito(tipo, alvo, jogo, self._jogos[lista[j][1]][0]))
+                        j += 1
+        return encontrados
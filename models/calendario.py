@@ -0,0 +1,195 @@
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Set, Tuple
+import math
+import random
+from models.campeonato import Fase
+from models.equipe import Equipe
+from models.partida import Jogo
+
+PESO_QUEBRA = 1  # Dois jogos seguidos em casa (ou fora)
+PESO_CONFLITO_ESTADIO = 10  # Equipes do mesmo estádio em casa na mesma rodada
+PESO_DATA_BLOQUEADA = 10  # Jogo em casa numa data em que o estádio não está disponível
+
+
+def datas_rodadas(inicio: date, quantidade: int, intervalo_dias: int = 7,
+                  bloqueadas: Iterable[date] = ()) -> List[date]:
+    """Datas sucessivas a partir de `inicio`, pulando as datas bloqueadas."""
+    bloqueadas = set(bloqueadas)
+    datas, atual = [], inicio
+    while len(datas) < quantidade:
+        if atual not in bloqueadas:
+            datas.append(atual)
+        atual += timedelta(days=intervalo_dias)
+    return datas
+
+
+def rodizio_duplo(n: int) -> List[List[Tuple[int, int]]]:
+    """Turno e returno pelo método do círculo com o mando canônico (n-2 quebras
+    por turno); cada rodada é uma lista de (mandante, visitante) com os índices
+    das equipes. Com n ímpar, quem enfrentaria o pivô folga."""
+    m = n + n % 2
+    pivo = m - 1
+    turno = []
+    for r in range(m - 1):
+        jogos = [(pivo, r) if r % 2 == 0 else (r, pivo)]
+        for k in range(1, m // 2):
+            a, b = (r + k) % (m - 1), (r - k) % (m - 1)
+            jogos.append((a, b) if k % 2 else (b, a))
+        turno.append([(a, b) for a, b in jogos if a < n and b < n])
+    return turno + [[(b, a) for a, b in jogos] for jogos in turno]
+
+
+class OtimizadorTabela:
+    """Tabela de turno e returno com mando equilibrado.
+
+    Parte de um rodízio válido e o melhora por recozimento simulado com dois
+    movimentos que preservam a validade: inverter o mando de um confronto nos
+    dois turnos e trocar duas rodadas de data dentro do mesmo turno. O custo
+    soma quebras de sequência de mando, equipes do mesmo estádio em casa na
+    mesma rodada e jogos em casa em datas bloqueadas do estádio; cada
+    movimento é avaliado só nas equipes e rodadas que ele altera. As quebras
+    são uma restrição: movimentos que passariam das quebras do rodízio
+    inicial são rejeitados, então a tabela final nunca tem mais quebras.
+    """
+
+    def __init__(self, equipes: List[Equipe], datas: List[date],
+                 estadios: Dict[str, str] | None = None,
+                 bloqueios: Dict[str, Iterable[date]] | None = None):
+        self.equipes = list(equipes)
+        n = len(self.equipes)
+        rodadas = rodizio_duplo(n)
+        if len(datas) < len(rodadas):
+            raise ValueError(f"São necessárias {len(rodadas)} datas para {n} equipes.")
+        self.datas = list(datas[:len(rodadas)])
+        self.metade = len(rodadas) // 2
+        estadios = estadios or {}
+        ids = [e.id for e in self.equipes]
+        self._estadio = [estadios.get(i) or f"__{i}" for i in ids]
+        grupos: Dict[str, List[int]] = {}
+        for t, estadio in enumerate(self._estadio):
+            grupos.setdefault(estadio, []).append(t)
+        self._compartilhados = [g for g in grupos.values() if len(g) > 1]
+        bloqueios = bloqueios or {}
+        posicao_da_data = {d: p for p, d in enumerate(self.datas)}
+        self._bloqueio: List[Set[int]] = [
+            {posicao_da_data[d] for d in bloqueios.get(i, ()) if d in posicao_da_data} for i in ids]
+
+        # mando[t][p]: 1 em casa, -1 fora, 0 folga na rodada da posição p
+        self._mando = [[0] * len(rodadas) for _ in range(n)]
+        self._pares: List[Tuple[int, int, int, int]] = []  # (a, b, rodada do turno, rodada do returno)
+        for p, jogos in enumerate(rodadas[:self.metade]):
+            for a, b in jogos:
+                self._mando[a][p], self._mando[b][p] = 1, -1
+                self._mando[a][p + self.metade], self._mando[b][p + self.metade] = -1, 1
+                self._pares.append((a, b, p, p + self.metade))
+        self._posicao = list(range(len(rodadas)))  # rodada -> posição no calendário
+        self._rodada_na_posicao = list(range(len(rodadas)))
+
+    # Custo
+
+    def _quebra(self, t: int, p: int) -> int:
+        mando = self._mando[t]
+        return 1 if 0 <= p < len(mando) - 1 and mando[p] != 0 and mando[p] == mando[p + 1] else 0
+
+    def _conflito(self, p: int) -> int:
+        return sum(max(0, sum(1 for t in grupo if self._mando[t][p] == 1) - 1) for grupo in self._compartilhados)
+
+    def _custo_local(self, equipes: Iterable[int], posicoes: Set[int]) -> Tuple[int, int]:
+        """(quebras, penalidades de estádio e datas bloqueadas) nas equipes e posições dadas."""
+        vizinhas = {q for p in posicoes for q in (p - 1, p)}
+        quebras = penalidades = 0
+        for t in equipes:
+            quebras += sum(self._quebra(t, q) for q in vizinhas)
+            penalidades += PESO_DATA_BLOQUEADA * sum(1 for p in posicoes if self._mando[t][p] == 1 and p in self._bloqueio[t])
+        penalidades += PESO_CONFLITO_ESTADIO * sum(self._conflito(p) for p in posicoes)
+        return quebras, penalidades
+
+    def custo(self) -> int:
+        quebras, penalidades = self._custo_local(range(len(self.equipes)), set(range(len(self.datas))))
+        return PESO_QUEBRA * quebras + penalidades
+
+    def quebras(self) -> int:
+        return sum(self._quebra(t, p) for t in range(len(self.equipes)) for p in range(len(self.datas)))
+
+    # Movimentos (cada um é o próprio inverso)
+
+    def _inverter_mando(self, indice: int) -> None:
+        a, b, r1, r2 = self._pares[indice]
+        p1, p2 = self._posicao[r1], self._posicao[r2]
+        for t in (a, b):
+            self._mando[t][p1] = -self._mando[t][p1]
+            self._mando[t][p2] = -self._mando[t][p2]
+
+    def _trocar_rodadas(self, p: int, q: int) -> None:
+        for mando in self._mando:
+            mando[p], mando[q] = mando[q], mando[p]
+        r, s = self._rodada_na_posicao[p], self._rodada_na_posicao[q]
+        self._rodada_na_posicao[p], self._rodada_na_posicao[q] = s, r
+        self._posicao[r], self._posicao[s] = q, p
+
+    def _afetados(self, movimento: tuple) -> Tuple[Iterable[int], Set[int]]:
+        if movimento[0] == "mando":
+            a, b, r1, r2 = self._pares[movimento[1]]
+            return (a, b), {self._posicao[r1], self._posicao[r2]}
+        return range(len(self.equipes)), {movimento[1], movimento[2]}
+
+    def _aplicar(self, movimento: tuple) -> None:
+        if movimento[0] == "mando":
+            self._inverter_mando(movimento[1])
+        else:
+            self._trocar_rodadas(movimento[1], movimento[2])
+
+    def otimizar(self, iteracoes: int = 20000, temperatura: float = 2.0,
+                 resfriamento: float = 0.9995, semente: int | None = None) -> int:
+        """Recozimento simulado; deixa a tabela no melhor estado visto e retorna seu custo."""
+        rnd = random.Random(semente)
+        atual = melhor = self.custo()
+        quebras = limite_quebras = self.quebras()
+        melhor_estado = self._estado()
+        for _ in range(iteracoes):
+            if not melhor:
+                break
+            if rnd.random() < 0.8 or self.metade < 2:
+                movimento = ("mando", rnd.randrange(len(self._pares)))
+            else:
+                inicio = self.metade * rnd.randrange(2)
+                p, q = rnd.sample(range(inicio, inicio + self.metade), 2)
+                movimento = ("rodadas", p, q)
+            equipes, posicoes = self._afetados(movimento)
+            quebras_antes, penalidades_antes = self._custo_local(equipes, posicoes)
+            self._aplicar(movimento)
+            quebras_depois, penalidades_depois = self._custo_local(equipes, posicoes)
+            delta_quebras = quebras_depois - quebras_antes
+            delta = PESO_QUEBRA * delta_quebras + penalidades_depois - penalidades_antes
+            # Conflitos e datas são reduzidos sem passar das quebras do rodízio inicial
+            permitido = quebras + delta_quebras <= limite_quebras
+            if permitido and (delta <= 0 or rnd.random() < math.exp(-delta / temperatura)):
+                atual += delta
+                quebras += delta_quebras
+                if atual < melhor:
+                    melhor, melhor_estado = atual, self._estado()
+            else:
+                self._aplicar(movimento)
+            temperatura *= resfriamento
+        self._mando, self._posicao, self._rodada_na_posicao = melhor_estado
+        return melhor
+
+    def _estado(self):
+        return [list(m) for m in self._mando], list(self._posicao), list(self._rodada_na_posicao)
+
+    def escrever(self, horario: time, nome_fase: str = "Rodada") -> List[Fase]:
+        """Gera uma `Fase` por rodada, com os jogos no estádio do mandante."""
+        fases = [Fase(nome=f"{nome_fase} {p + 1}", ordem=p + 1, tipo="Corridos") for p in range(len(self.datas))]
+        for a, b, r1, r2 in self._pares:
+            for p, casa, fora in ((self._posicao[r1], a, b), (self._posicao[r2], b, a)):
+                if self._mando[casa][p] != 1:
+                    casa, fora = fora, casa
+                mandante = self.equipes[casa]
+                estadio = self._estadio[casa]
+                fases[p].adicionar_jogo(Jogo(
+                    mandante=mandante,
+                    visitante=self.equipes[fora],
+                    data=datetime.combine(self.datas[p], horario),
+                    local=f"Estádio {mandante.nome}" if estadio.startswith("__") else estadio,
+                ))
+        return fases
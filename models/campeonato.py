@@ -1,10 +1,14 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List
 import uuid
 from models.partida import Jogo
-from models.equipe import Equipe
+from models.equipe import Equipe, FormaEquipe
+from models.serializacao import serializavel
 from utils.exceptions import EquipeNaoEncontrada
 
+CONTADORES = ('vitorias', 'empates', 'derrotas', 'gols_marcados', 'gols_sofridos')
+
+@serializavel()
 @dataclass
 class Fase:
     nome: str
@@ -17,23 +21,7 @@ class Fase:
     def adicionar_jogo(self, jogo: Jogo) -> None:
         self.jogos.append(jogo)
 
-    def to_dict(self) -> dict:
-        return {
-            'nome': self.nome,
-            'ordem': self.ordem,
-            'tipo': self.tipo,
-            'grupo': self.grupo,
-            'jogos': [j.to_dict() for j in self.jogos],
-            'id': self.id
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict):
-        data['jogos'] = [Jogo.from_dict(j_data) for j_data in data.get('jogos', [])]
-        data.setdefault('tipo', 'Corridos')
-        data.setdefault('grupo', '')
-        return cls(**data)
-
+@serializavel()
 @dataclass
 class Campeonato:
     nome: str
@@ -43,6 +31,103 @@ class Campeonato:
     equipes_inscritas: List[Equipe] = field(default_factory=list)
     id: str = field(default_factory=lambda: str(uuid.uuid4()), kw_only=True)
 
+    def __post_init__(self):
+        # Os jogos lidos do JSON trazem cópias das equipes; religa às equipes
+        # inscritas para que resultados e correções atualizem a classificação
+        equipes = {e.id: e for e in self.equipes_inscritas}
+        # Índice de participações (jogador_id -> [(jogo, papel)]), montado na mesma passada
+        self._participacoes: Dict[str, List[tuple]] = {}
+        self._escalados: Dict[str, List[str]] = {}  # jogo_id -> jogadores indexados
+        for fase in self.fases:
+            for jogo in fase.jogos:
+                jogo.mandante = equipes.get(jogo.mandante.id, jogo.mandante)
+                jogo.visitante = equipes.get(jogo.visitante.id, jogo.visitante)
+                self.indexar_escalacao(jogo)
+        self.reconstruir_forma()
+
+    def reconstruir_forma(self) -> None:
+        """Refaz a forma recente das equipes em uma passada pelos jogos finalizados, em ordem de data."""
+        for equipe in self.equipes_inscritas:
+            equipe._forma = FormaEquipe()
+        jogos = [j for f in self.fases for j in f.jogos if j.finalizada]
+        for jogo in sorted(jogos, key=lambda j: j.data):
+            jogo.registrar_forma()
+
+    def contadores_esperados(self) -> Dict[str, Dict[str, int]]:
+        """Vitórias, empates, derrotas e gols de cada equipe inscrita segundo os jogos finalizados."""
+        esperados = {e.id: dict.fromkeys(CONTADORES, 0) for e in self.equipes_inscritas}
+        for fase in self.fases:
+            for jogo in fase.jogos:
+                if not jogo.finalizada:
+                    continue
+                for equipe, pro, contra in ((jogo.mandante, jogo.placar_mandante, jogo.placar_visitante),
+                                            (jogo.visitante, jogo.placar_visitante, jogo.placar_mandante)):
+                    contadores = esperados.get(equipe.id)
+                    if contadores is None:
+                        continue
+                    contadores['gols_marcados'] += pro
+                    contadores['gols_sofridos'] += contra
+                    contadores['vitorias' if pro > contra else 'derrotas' if pro < contra else 'empates'] += 1
+        return esperados
+
+    def recalcular_classificacao(self) -> List[Equipe]:
+        """Refaz os contadores das equipes a partir dos jogos finalizados e a forma
+        recente. Retorna as equipes cujos contadores estavam divergentes."""
+        esperados = self.contadores_esperados()
+        divergentes = []
+        for equipe in self.equipes_inscritas:
+            contadores = esperados[equipe.id]
+            if any(getattr(equipe, k) != v for k, v in contadores.items()):
+                divergentes.append(equipe)
+                for k, v in contadores.items():
+                    setattr(equipe, k, v)
+        self.reconstruir_forma()
+        return divergentes
+
+    def forma(self, equipe: Equipe) -> FormaEquipe:
+        """Forma recente da equipe, refeita antes se algum resultado fora de ordem a invalidou."""
+        if equipe.forma.desatualizada:
+            self.reconstruir_forma()
+        return equipe.forma
+
+    def indexar_escalacao(self, jogo: Jogo) -> None:
+        """Atualiza o índice de participações com a escalação atual do jogo.
+        Deve ser chamado sempre que as escalações de um jogo forem definidas."""
+        for jogador_id in self._escalados.pop(jogo.id, ()):
+            self._participacoes[jogador_id] = [p for p in self._participacoes[jogador_id] if p[0] is not jogo]
+        indexados = []
+        for escalacao in (jogo.escalacao_mandante, jogo.escalacao_visitante):
+            for papel, ids in (("titular", escalacao.titulares), ("reserva", escalacao.reservas)):
+                for jogador_id in ids:
+                    self._participacoes.setdefault(jogador_id, []).append((jogo, papel))
+                    indexados.append(jogador_id)
+        self._escalados[jogo.id] = indexados
+
+    def participacoes(self, jogador_id: str) -> List[tuple]:
+        """Jogos em que o jogador foi escalado, como pares (jogo, 'titular'|'reserva')."""
+        return self._participacoes.get(jogador_id, [])
+
+    def estatisticas_jogador(self, jogador_id: str) -> dict:
+        """Jogos disputados (titular/reserva), gols e média de gols por jogo.
+        Só contam partidas finalizadas; percorre apenas os jogos do jogador."""
+        titular = reserva = gols = 0
+        for jogo, papel in self.participacoes(jogador_id):
+            if not jogo.finalizada:
+                continue
+            if papel == "titular":
+                titular += 1
+            else:
+                reserva += 1
+            gols += sum(1 for g in jogo.gols if g.tipo == "gol" and g.jogador_id == jogador_id)
+        jogos = titular + reserva
+        return {
+            'jogos': jogos,
+            'titular': titular,
+            'reserva': reserva,
+            'gols': gols,
+            'gols_por_jogo': round(gols / jogos, 2) if jogos else 0.0,
+        }
+
     def obter_classificacao(self) -> List[Equipe]:
         """Ordena por Pontos, Vitórias, Saldo de Gols e Gols Marcados."""
         return sorted(
@@ -51,6 +136,29 @@ class Campeonato:
             reverse=True
         )
 
+    def obter_artilharia(self) -> List[dict]:
+        """Ranking de artilheiros a partir dos gols registrados nas partidas."""
+        nomes_equipes = {e.id: e.nome for e in self.equipes_inscritas}
+        artilheiros = {}
+        for fase in self.fases:
+            for jogo in fase.jogos:
+                if jogo.status == "Cancelada":
+                    continue
+                for gol in jogo.gols:
+                    if gol.tipo == "gol_contra" or not gol.jogador_id:
+                        continue
+                    item = artilheiros.get(gol.jogador_id)
+                    if item is None:
+                        item = {
+                            'jogador_id': gol.jogador_id,
+                            'jogador': gol.jogador_nome,
+                            'equipe': nomes_equipes.get(gol.equipe_id, ''),
+                            'gols': 0,
+                        }
+                        artilheiros[gol.jogador_id] = item
+                    item['gols'] += 1
+        return sorted(artilheiros.values(), key=lambda a: (-a['gols'], a['jogador']))
+
     def cadastrar_equipe(self, equipe: Equipe) -> None:
         self.equipes_inscritas.append(equipe)
 
@@ -62,20 +170,3 @@ class Campeonato:
         if not equipe:
             raise EquipeNaoEncontrada(f"Equipe ID {equipe_id} não encontrada.")
         self.equipes_inscritas.remove(equipe)
-
-    def to_dict(self) -> dict:
-        return {
-            'nome': self.nome,
-            'ano': self.ano,
-            'tipo': self.tipo,
-            'fases': [f.to_dict() for f in self.fases],
-            'equipes_inscritas': [e.to_dict() for e in self.equipes_inscritas],
-            'id': self.id
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict):
-        data['fases'] = [Fase.from_dict(f_data) for f_data in data.get('fases', [])]
-        data['equipes_inscritas'] = [Equipe.from_dict(e_data) for e_data in data.get('equipes_inscritas', [])]
-        data.setdefault('tipo', 'Pontos corridos')
-        return cls(**data)
\ No newline at end of file
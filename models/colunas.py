@@ -0,0 +1,120 @@
+from typing import Dict, List
+import numpy as np
+from models.campeonato import Campeonato
+from models.equipe import Equipe
+
+
+class TabelaResultados:
+    """Jogos finalizados de um campeonato em colunas NumPy.
+
+    Cada jogo vira duas linhas, uma por equipe (`casa` indica o mandante), com
+    índices de equipe e adversário, gols pró e contra, data (ordinal) e índice
+    da fase; os gols com minuto ficam em colunas próprias. As consultas são
+    agregações vetorizadas (bincount, add.at) sobre essas colunas, sem
+    percorrer os objetos do modelo.
+    """
+
+    def __init__(self, camp: Campeonato):
+        self.equipes: List[Equipe] = list(camp.equipes_inscritas)
+        self.fases: List[str] = [f.nome for f in camp.fases]
+        indice = {e.id: i for i, e in enumerate(self.equipes)}
+        jogos = [(k, j) for k, f in enumerate(camp.fases) for j in f.jogos
+                 if j.finalizada and j.mandante.id in indice and j.visitante.id in indice]
+        n = len(jogos)
+        mandante = np.fromiter((indice[j.mandante.id] for _, j in jogos), np.int32, n)
+        visitante = np.fromiter((indice[j.visitante.id] for _, j in jogos), np.int32, n)
+        gols_m = np.fromiter((j.placar_mandante for _, j in jogos), np.int32, n)
+        gols_v = np.fromiter((j.placar_visitante for _, j in jogos), np.int32, n)
+        dia = np.fromiter((j.data.toordinal() for _, j in jogos), np.int32, n)
+        fase = np.fromiter((k for k, _ in jogos), np.int32, n)
+
+        self.equipe = np.concatenate([mandante, visitante])
+        self.adversario = np.concatenate([visitante, mandante])
+        self.gols_pro = np.concatenate([gols_m, gols_v])
+        self.gols_contra = np.concatenate([gols_v, gols_m])
+        self.casa = np.concatenate([np.ones(n, bool), np.zeros(n, bool)])
+        self.dia = np.concatenate([dia, dia])
+        self.fase = np.concatenate([fase, fase])
+
+        minutos = [g.minuto for _, j in jogos for g in j.gols if g.minuto > 0]
+        self.gol_minuto = np.array(minutos, np.int32)
+
+    @property
+    def jogos(self) -> int:
+        return len(self.equipe) // 2
+
+    def _resultados(self):
+        return self.gols_pro > self.gols_contra, self.gols_pro == self.gols_contra, self.gols_pro < self.gols_contra
+
+    def totais_por_equipe(self, casa: bool | None = None) -> Dict[str, np.ndarray]:
+        """Jogos, V/E/D, gols e pontos por equipe (na ordem de `equipes`);
+        com `casa` True/False, só os jogos como mandante/visitante."""
+        filtro = np.ones(len(self.equipe), bool) if casa is None else self.casa == casa
+        equipe = self.equipe[filtro]
+        n = len(self.equipes)
+        vitoria, empate, derrota = (r[filtro] for r in self._resultados())
+        totais = {
+            'jogos': np.bincount(equipe, minlength=n),
+            'vitorias': np.bincount(equipe, vitoria, n).astype(int),
+            'empates': np.bincount(equipe, empate, n).astype(int),
+            'derrotas': np.bincount(equipe, derrota, n).astype(int),
+            'gols_pro': np.bincount(equipe, self.gols_pro[filtro], n).astype(int),
+            'gols_contra': np.bincount(equipe, self.gols_contra[filtro], n).astype(int),
+        }
+        totais['pontos'] = 3 * totais['vitorias'] + totais['empates']
+        return totais
+
+    def por_fase(self) -> Dict[str, np.ndarray]:
+        """Jogos, gols e resultado do mandante por fase (na ordem de `fases`)."""
+        casa = self.casa
+        fase = self.fase[casa]
+        n = len(self.fases)
+        vitoria, empate, derrota = (r[casa] for r in self._resultados())
+        jogos = np.bincount(fase, minlength=n)
+        gols = np.bincount(fase, self.gols_pro[casa] + self.gols_contra[casa], n).astype(int)
+        return {
+            'jogos': jogos,
+            'gols': gols,
+            'media_gols': np.divide(gols, jogos, out=np.zeros(n), where=jogos > 0),
+            'vitorias_mandante': np.bincount(fase, vitoria, n).astype(int),
+            'empates': np.bincount(fase, empate, n).astype(int),
+            'vitorias_visitante': np.bincount(fase, derrota, n).astype(int),
+        }
+
+    def gols_por_minuto(self, faixa: int = 15, ate: int = 90) -> Dict[str, np.ndarray]:
+        """Histograma dos gols com minuto registrado em faixas até `ate` (1-15 ... 76-90),
+        mais uma faixa "90+" só com os gols dos acréscimos (minuto acima de `ate`)."""
+        acrescimos = max(ate, int(self.gol_minuto.max(initial=0))) + 1
+        limites = np.append(np.arange(0, ate, faixa), [ate, acrescimos])
+        contagem, _ = np.histogram(self.gol_minuto - 1, bins=limites)  # minuto 15 fica em 1-15
+        rotulos = [f"{inicio + 1}-{fim}" for inicio, fim in zip(limites[:-2], limites[1:-1])] + [f"{ate}+"]
+        return {'faixas': np.array(rotulos), 'gols': contagem}
+
+    def vantagem_mando(self) -> Dict[str, float]:
+        """Aproveitamento e média de gols de mandantes e visitantes."""
+        if not self.jogos:
+            return {'vitorias_mandante': 0.0, 'empates': 0.0, 'vitorias_visitante': 0.0,
+                    'gols_mandante': 0.0, 'gols_visitante': 0.0, 'pontos_mandante': 0.0, 'pontos_visitante': 0.0}
+        casa = self.casa
+        vitoria, empate, derrota = (r[casa] for r in self._resultados())
+        return {
+            'vitorias_mandante': float(vitoria.mean()),
+            'empates': float(empate.mean()),
+            'vitorias_visitante': float(derrota.mean()),
+            'gols_mandante': float(self.gols_pro[casa].mean()),
+            'gols_visitante': float(self.gols_contra[casa].mean()),
+            'pontos_mandante': float((3 * vitoria + empate).mean()),
+            'pontos_visitante': float((3 * derrota + empate).mean()),
+        }
+
+    def confrontos(self) -> Dict[str, np.ndarray]:
+        """Matrizes equipe x adversário de pontos e saldo de gols nos confrontos diretos."""
+        n = len(self.equipes)
+        vitoria, empate, _ = self._resultados()
+        pontos = np.zeros((n, n), int)
+        saldo = np.zeros((n, n), int)
+        jogos = np.zeros((n, n), int)
+        np.add.at(pontos, (self.equipe, self.adversario), 3 * vitoria + empate)
+        np.add.at(saldo, (self.equipe, self.adversario), self.gols_pro - self.gols_contra)
+        np.add.at(jogos, (self.equipe, self.adversario), 1)
+        return {'pontos': pontos, 'saldo': saldo, 'jogos': jogos}
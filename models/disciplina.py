@@ -0,0 +1,89 @@
+from typing import Dict, Set
+from models.campeonato import Campeonato
+from models.partida import Jogo
+
+AMARELOS_PARA_SUSPENSAO = 3
+JOGOS_SUSPENSAO_VERMELHO = 1
+
+
+class ControleDisciplinar:
+    """Livro de suspensões de um campeonato, indexado por jogador.
+
+    Os cartões dos jogos finalizados são aplicados em ordem cronológica: antes
+    de cada jogo, os suspensos das duas equipes cumprem uma partida; depois,
+    vermelho (ou dois amarelos no mesmo jogo) suspende por
+    `JOGOS_SUSPENSAO_VERMELHO` jogos e cada `AMARELOS_PARA_SUSPENSAO` amarelos
+    acumulados suspendem por um. `suspenso` é uma busca em dicionário.
+    """
+
+    def __init__(self, amarelos_para_suspensao: int = AMARELOS_PARA_SUSPENSAO,
+                 jogos_por_vermelho: int = JOGOS_SUSPENSAO_VERMELHO):
+        self.amarelos_para_suspensao = amarelos_para_suspensao
+        self.jogos_por_vermelho = jogos_por_vermelho
+        self._amarelos: Dict[str, int] = {}  # jogador_id -> amarelos acumulados
+        self._suspensoes: Dict[str, int] = {}  # jogador_id -> jogos a cumprir
+        self._suspensos_da_equipe: Dict[str, Set[str]] = {}  # equipe_id -> jogador_ids
+        self._aplicados: set = set()  # ids dos jogos já aplicados
+        self._ultima_data = None
+
+    def _suspender(self, equipe_id: str, jogador_id: str, jogos: int) -> None:
+        self._suspensoes[jogador_id] = self._suspensoes.get(jogador_id, 0) + jogos
+        self._suspensos_da_equipe.setdefault(equipe_id, set()).add(jogador_id)
+
+    def _aplicar(self, jogo: Jogo) -> None:
+        for equipe in (jogo.mandante, jogo.visitante):
+            suspensos = self._suspensos_da_equipe.get(equipe.id, set())
+            for jogador_id in list(suspensos):
+                self._suspensoes[jogador_id] -= 1
+                if not self._suspensoes[jogador_id]:
+                    del self._suspensoes[jogador_id]
+                    suspensos.discard(jogador_id)
+
+        amarelos_no_jogo: Dict[str, int] = {}
+        expulsos = {}  # jogador_id -> equipe do jogador
+        for cartao in jogo.cartoes:
+            if cartao.tipo == "vermelho":
+                expulsos[cartao.jogador_id] = cartao.equipe_id
+            else:
+                amarelos_no_jogo[cartao.jogador_id] = amarelos_no_jogo.get(cartao.jogador_id, 0) + 1
+                if amarelos_no_jogo[cartao.jogador_id] == 2:
+                    expulsos[cartao.jogador_id] = cartao.equipe_id
+        for jogador_id, equipe_id in expulsos.items():
+            self._suspender(equipe_id, jogador_id, self.jogos_por_vermelho)
+        for cartao in jogo.cartoes:
+            if cartao.tipo != "amarelo" or cartao.jogador_id in expulsos:
+                continue
+            acumulados = self._amarelos.get(cartao.jogador_id, 0) + 1
+            if acumulados >= self.amarelos_para_suspensao:
+                self._suspender(cartao.equipe_id, cartao.jogador_id, 1)
+                acumulados = 0
+            self._amarelos[cartao.jogador_id] = acumulados
+
+        self._aplicados.add(jogo.id)
+        self._ultima_data = jogo.data
+
+    def registrar_partida(self, camp: Campeonato, jogo: Jogo) -> None:
+        """Aplica os cartões de um jogo recém-finalizado. Um jogo fora da ordem
+        cronológica, corrigido, reaberto ou cancelado reconstrói o livro."""
+        if (jogo.finalizada and jogo.id not in self._aplicados
+                and (self._ultima_data is None or jogo.data >= self._ultima_data)):
+            self._aplicar(jogo)
+        else:
+            self.reconstruir(camp)
+
+    def reconstruir(self, camp: Campeonato) -> None:
+        """Refaz o livro em uma passada pelos jogos finalizados do campeonato."""
+        self._amarelos, self._suspensoes, self._suspensos_da_equipe = {}, {}, {}
+        self._aplicados, self._ultima_data = set(), None
+        jogos = [j for f in camp.fases for j in f.jogos if j.finalizada]
+        for jogo in sorted(jogos, key=lambda j: j.data):
+            self._aplicar(jogo)
+
+    def suspenso(self, jogador_id: str) -> bool:
+        return jogador_id in self._suspensoes
+
+    def jogos_suspensao(self, jogador_id: str) -> int:
+        return self._suspensoes.get(jogador_id, 0)
+
+    def amarelos(self, jogador_id: str) -> int:
+        return self._amarelos.get(jogador_id, 0)
@@ -1,9 +1,62 @@
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import List
 import uuid
 from models.jogador import Jogador
+from models.serializacao import serializavel
 from utils.exceptions import JogadorNaoEncontrado
 
+JANELA_FORMA = 5
+
+
+class FormaEquipe:
+    """Forma recente de uma equipe: últimos resultados em um buffer circular,
+    sequências atuais e desempenho como mandante e como visitante.
+
+    `registrar` é O(1). Desfazer o jogo mais recente (correção de placar)
+    restaura as sequências guardadas na entrada; qualquer outro caso marca a
+    forma como desatualizada, e o campeonato a refaz no próximo acesso.
+    """
+
+    def __init__(self):
+        # (jogo_id, data, resultado, sequência de vitórias e invicta antes do jogo)
+        self.ultimos: deque = deque(maxlen=2 * JANELA_FORMA)
+        self.sequencia_vitorias = 0
+        self.sequencia_invicta = 0
+        self.como_mandante = dict.fromkeys(('V', 'E', 'D', 'gols_pro', 'gols_contra'), 0)
+        self.como_visitante = dict.fromkeys(('V', 'E', 'D', 'gols_pro', 'gols_contra'), 0)
+        self.jogos = 0
+        self.desatualizada = False
+
+    def registrar(self, jogo_id: str, data: datetime, casa: bool, gols_pro: int, gols_contra: int,
+                  sinal: int = 1) -> None:
+        resultado = 'V' if gols_pro > gols_contra else 'D' if gols_pro < gols_contra else 'E'
+        lado = self.como_mandante if casa else self.como_visitante
+        lado[resultado] += sinal
+        lado['gols_pro'] += sinal * gols_pro
+        lado['gols_contra'] += sinal * gols_contra
+        self.jogos += sinal
+        if sinal > 0:
+            if self.ultimos and data < self.ultimos[-1][1]:
+                self.desatualizada = True  # jogo anterior ao último registrado
+            self.ultimos.append((jogo_id, data, resultado, self.sequencia_vitorias, self.sequencia_invicta))
+            self.sequencia_vitorias = self.sequencia_vitorias + 1 if resultado == 'V' else 0
+            self.sequencia_invicta = self.sequencia_invicta + 1 if resultado != 'D' else 0
+        elif self.ultimos and self.ultimos[-1][0] == jogo_id:
+            _, _, _, self.sequencia_vitorias, self.sequencia_invicta = self.ultimos.pop()
+            if len(self.ultimos) < JANELA_FORMA and self.jogos > len(self.ultimos):
+                self.desatualizada = True  # resultados mais antigos já saíram do buffer
+        else:
+            self.desatualizada = True
+
+    def ultimos_resultados(self) -> List[str]:
+        """Até `JANELA_FORMA` resultados ('V', 'E', 'D'), do mais antigo ao mais recente."""
+        return [r for _, _, r, _, _ in list(self.ultimos)[-JANELA_FORMA:]]
+
+
+# Propriedades calculadas vão no dict para visualização no JSON e são ignoradas na leitura
+@serializavel(extras=('pontos', 'saldo_gols'))
 @dataclass
 class Equipe:
     nome: str
@@ -24,6 +77,14 @@ class Equipe:
     def saldo_gols(self) -> int:
         return self.gols_marcados - self.gols_sofridos
 
+    @property
+    def forma(self) -> FormaEquipe:
+        """Forma recente (não serializada); o campeonato a monta ao carregar."""
+        forma = self.__dict__.get('_forma')
+        if forma is None:
+            forma = self._forma = FormaEquipe()
+        return forma
+
     @property
     def elenco_dict(self) -> dict:
         """Retorna dicionário de jogadores indexados por ID"""
@@ -39,20 +100,4 @@ class Equipe:
         jogador = self.buscar_jogador_por_id(jogador_id)
         if not jogador:
             raise JogadorNaoEncontrado(f"Jogador com ID {jogador_id} não encontrado.")
-        self.elenco.remove(jogador)
-
-    def to_dict(self) -> dict:
-        d = asdict(self)
-        # Adicionamos propriedades calculadas no dict para visualização no JSON
-        d['pontos'] = self.pontos
-        d['saldo_gols'] = self.saldo_gols
-        return d
-
-    @classmethod
-    def from_dict(cls, data: dict):
-        # Removemos chaves calculadas para não dar erro no construtor
-        data.pop('pontos', None)
-        data.pop('saldo_gols', None)
-        elenco = [Jogador.from_dict(j_data) for j_data in data.get('elenco', [])]
-        data['elenco'] = elenco
-        return cls(**data)
\ No newline at end of file
+        self.elenco.remove(jogador)
\ No newline at end of file
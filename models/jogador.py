@@ -1,20 +1,16 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 import uuid
+from models.serializacao import serializavel
 
+@serializavel()
 @dataclass
 class Jogador:
     nome: str
     numero: int
     posicao: str
     gols: int = 0
+    pessoa_id: str = ""  # Identidade global do jogador entre campeonatos
     id: str = field(default_factory=lambda: str(uuid.uuid4()), kw_only=True)
 
     def get_dados(self) -> str:
-        return f"{self.numero} - {self.nome} ({self.posicao}) - Gols: {self.gols}"
-
-    def to_dict(self) -> dict:
-        return asdict(self)
-
-    @classmethod
-    def from_dict(cls, data: dict):
-        return cls(**data)
\ No newline at end of file
+        return f"{self.numero} - {self.nome} ({self.posicao}) - Gols: {self.gols}"
\ No newline at end of file
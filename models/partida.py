@@ -1,9 +1,13 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import List
 import uuid
 from models.equipe import Equipe
 from models.jogador import Jogador
+from models.serializacao import serializavel
+from utils.exceptions import PartidaNaoFinalizada, PlacarInconsistente
 
+@serializavel()
 @dataclass
 class Escalacao:
     """Escalação de uma equipe em um jogo"""
@@ -11,41 +15,50 @@ class Escalacao:
     reservas: list = field(default_factory=list)   # Lista de IDs de jogadores
     id: str = field(default_factory=lambda: str(uuid.uuid4()), kw_only=True)
 
-    def to_dict(self) -> dict:
-        return {
-            'titulares': self.titulares,
-            'reservas': self.reservas,
-            'id': self.id
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict):
-        return cls(**data)
+TIPOS_GOL = ("gol", "gol_contra")
+TIPOS_CARTAO = ("amarelo", "vermelho")
 
+@serializavel()
 @dataclass
-class Gol:
-    """Registro de um gol marcado"""
-    jogador_id: str
-    jogador_nome: str
-    equipe_id: str
-    minuto: int
+class EventoJogo:
+    """Evento do registro de uma partida: gol, gol contra, cartão ou mudança de status.
+
+    Em gols, `equipe_id` é a equipe que ganha o gol no placar; no gol contra,
+    o jogador é da equipe adversária. Gols sem `jogador_id` não têm autor
+    (placar digitado sem registrar quem marcou). Em cartões, `equipe_id` é a
+    equipe do jogador."""
+    tipo: str  # gol, gol_contra, amarelo, vermelho, status
+    minuto: int = 0
+    equipe_id: str = ""
+    jogador_id: str = ""
+    jogador_nome: str = ""
+    status: str = ""
     id: str = field(default_factory=lambda: str(uuid.uuid4()), kw_only=True)
 
-    def to_dict(self) -> dict:
-        return {
-            'jogador_id': self.jogador_id,
-            'jogador_nome': self.jogador_nome,
-            'equipe_id': self.equipe_id,
-            'minuto': self.minuto,
-            'id': self.id
-        }
+def _escalacao_gravada(chave: str):
+    """Escalações ausentes ou vazias viram escalações novas."""
+    return lambda data: Escalacao.from_dict(e) if (e := data.get(chave)) else Escalacao()
 
-    @classmethod
-    def from_dict(cls, data: dict):
-        return cls(**data)
+def _eventos_gravados(data: dict) -> list:
+    if 'eventos' in data:
+        return [EventoJogo.from_dict(e) for e in data['eventos']]
+    # Arquivos anteriores ao registro de eventos guardavam só a lista 'gols'
+    return [EventoJogo.from_dict(dict(g, tipo='gol')) for g in data.get('gols', [])]
 
+@serializavel(
+    decodificar={
+        # Compatibilidade com dados antigos
+        'status': lambda data: data['status'] if 'status' in data else ('Finalizada' if data.get('finalizada') else 'Agendada'),
+        'escalacao_mandante': _escalacao_gravada('escalacao_mandante'),
+        'escalacao_visitante': _escalacao_gravada('escalacao_visitante'),
+        'eventos': _eventos_gravados,
+    }
+)
 @dataclass
 class Jogo:
+    """Partida. O placar é a projeção dos gols do registro de eventos: toda
+    alteração passa por `registrar_evento`, que atualiza placar, lista de gols
+    e, se a partida já estiver finalizada, as estatísticas das equipes."""
     mandante: Equipe
     visitante: Equipe
     data: datetime
@@ -58,70 +71,181 @@ class Jogo:
     observacoes: str = ""
     escalacao_mandante: Escalacao = field(default_factory=Escalacao)
     escalacao_visitante: Escalacao = field(default_factory=Escalacao)
-    gols: list = field(default_factory=list)  # Lista de Gol
+    eventos: List[EventoJogo] = field(default_factory=list)  # Em ordem de registro
     id: str = field(default_factory=lambda: str(uuid.uuid4()), kw_only=True)
 
-    def finalizar_partida(self, g_mandante: int, g_visitante: int) -> None:
-        if self.finalizada:
+    def __post_init__(self):
+        self._gols = [e for e in self.eventos if e.tipo in TIPOS_GOL]
+        g_mandante = sum(1 for g in self._gols if g.equipe_id == self.mandante.id)
+        g_visitante = len(self._gols) - g_mandante
+        if not self.finalizada:
+            self.placar_mandante, self.placar_visitante = g_mandante, g_visitante
             return
-            
-        self.placar_mandante = g_mandante
-        self.placar_visitante = g_visitante
-        
-        # Atualiza estatísticas das equipes
-        self.mandante.gols_marcados += g_mandante
-        self.mandante.gols_sofridos += g_visitante
-        self.visitante.gols_marcados += g_visitante
-        self.visitante.gols_sofridos += g_mandante
+        # Dados antigos: placar final digitado sem os gols vira gols sem autor
+        for equipe, faltam in ((self.mandante, self.placar_mandante - g_mandante),
+                               (self.visitante, self.placar_visitante - g_visitante)):
+            for _ in range(faltam):
+                gol = EventoJogo("gol", equipe_id=equipe.id)
+                self.eventos.append(gol)
+                self._gols.append(gol)
+
+    @property
+    def gols(self) -> List[EventoJogo]:
+        """Gols (e gols contra) na ordem em que foram registrados."""
+        return self._gols
+
+    def _somar_gol(self, gol: EventoJogo, sinal: int) -> None:
+        if gol.equipe_id == self.mandante.id:
+            self.placar_mandante += sinal
+        else:
+            self.placar_visitante += sinal
+
+    def registrar_evento(self, evento: EventoJogo) -> EventoJogo:
+        """Único caminho de escrita do registro; atualiza as projeções em O(1)."""
+        if evento.tipo in TIPOS_GOL:
+            if self.finalizada:
+                self._aplicar_resultado(-1)
+            self._somar_gol(evento, 1)
+            self._gols.append(evento)
+            if self.finalizada:
+                self._aplicar_resultado(1)
+        elif evento.tipo == "status":
+            self.status = evento.status
+        elif evento.tipo not in TIPOS_CARTAO:
+            raise ValueError(f"Tipo de evento inválido: {evento.tipo}")
+        self.eventos.append(evento)
+        return evento
+
+    def registrar_gol(self, equipe_id: str, jogador: Jogador | None = None, minuto: int = 0,
+                     contra: bool = False) -> EventoJogo:
+        """Gol para `equipe_id`; com `contra`, o jogador é da equipe adversária."""
+        return self.registrar_evento(EventoJogo(
+            "gol_contra" if contra else "gol",
+            minuto=minuto,
+            equipe_id=equipe_id,
+            jogador_id=jogador.id if jogador else "",
+            jogador_nome=jogador.nome if jogador else "",
+        ))
+
+    def registrar_cartao(self, equipe_id: str, jogador: Jogador, minuto: int = 0,
+                         vermelho: bool = False) -> EventoJogo:
+        return self.registrar_evento(EventoJogo(
+            "vermelho" if vermelho else "amarelo",
+            minuto=minuto,
+            equipe_id=equipe_id,
+            jogador_id=jogador.id,
+            jogador_nome=jogador.nome,
+        ))
+
+    @property
+    def cartoes(self) -> List[EventoJogo]:
+        return [e for e in self.eventos if e.tipo in TIPOS_CARTAO]
+
+    def remover_evento(self, evento_id: str) -> None:
+        """Remove um evento registrado por engano, desfazendo seu efeito no placar."""
+        evento = next((e for e in self.eventos if e.id == evento_id), None)
+        if evento is None:
+            return
+        if evento.tipo in TIPOS_GOL:
+            if self.finalizada:
+                self._aplicar_resultado(-1)
+            self._somar_gol(evento, -1)
+            self._gols.remove(evento)
+            if self.finalizada:
+                self._aplicar_resultado(1)
+        self.eventos.remove(evento)
+
+    def alterar_status(self, status: str, minuto: int = 0) -> None:
+        self.registrar_evento(EventoJogo("status", minuto=minuto, status=status))
+
+    def _ajustar_gols_sem_autor(self, g_mandante: int, g_visitante: int) -> None:
+        """Leva o placar ao valor informado incluindo ou removendo gols sem autor.
+        Gols com autor registrado nunca são removidos."""
+        ajustes = []
+        for equipe_id, atual, alvo in ((self.mandante.id, self.placar_mandante, g_mandante),
+                                       (self.visitante.id, self.placar_visitante, g_visitante)):
+            sem_autor = [g for g in self._gols if g.equipe_id == equipe_id and not g.jogador_id]
+            if atual - alvo > len(sem_autor):
+                raise PlacarInconsistente(
+                    f"Há {atual - len(sem_autor)} gol(s) com autor registrados; "
+                    f"remova-os antes de informar o placar {g_mandante} x {g_visitante}."
+                )
+            ajustes.append((equipe_id, alvo - atual, sem_autor))
+        for equipe_id, diferenca, sem_autor in ajustes:
+            for _ in range(diferenca):
+                self.registrar_gol(equipe_id)
+            for gol in sem_autor[len(sem_autor) + diferenca:] if diferenca < 0 else []:
+                self.remover_evento(gol.id)
+
+    def _aplicar_resultado(self, sinal: int) -> None:
+        """Soma (sinal=1) ou desfaz (sinal=-1) o efeito do placar atual nas estatísticas das equipes."""
+        g_mandante, g_visitante = self.placar_mandante, self.placar_visitante
+        self.registrar_forma(sinal)
+        self.mandante.gols_marcados += sinal * g_mandante
+        self.mandante.gols_sofridos += sinal * g_visitante
+        self.visitante.gols_marcados += sinal * g_visitante
+        self.visitante.gols_sofridos += sinal * g_mandante
 
         if g_mandante > g_visitante:
-            self.mandante.vitorias += 1
-            self.visitante.derrotas += 1
+            self.mandante.vitorias += sinal
+            self.visitante.derrotas += sinal
         elif g_visitante > g_mandante:
-            self.visitante.vitorias += 1
-            self.mandante.derrotas += 1
+            self.visitante.vitorias += sinal
+            self.mandante.derrotas += sinal
         else:
-            self.mandante.empates += 1
-            self.visitante.empates += 1
-        
-        self.finalizada = True
-        self.status = "Finalizada"
-
-    def to_dict(self) -> dict:
-        return {
-            'mandante': self.mandante.to_dict(),
-            'visitante': self.visitante.to_dict(),
-            'data': self.data.isoformat(),
-            'local': self.local,
-            'placar_mandante': self.placar_mandante,
-            'placar_visitante': self.placar_visitante,
-            'finalizada': self.finalizada,
-            'status': self.status,
-            'publico': self.publico,
-            'observacoes': self.observacoes,
-            'escalacao_mandante': self.escalacao_mandante.to_dict(),
-            'escalacao_visitante': self.escalacao_visitante.to_dict(),
-            'gols': [g.to_dict() for g in self.gols],
-            'id': self.id
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict):
-        data['mandante'] = Equipe.from_dict(data['mandante'])
-        data['visitante'] = Equipe.from_dict(data['visitante'])
-        data['data'] = datetime.fromisoformat(data['data'])
-        # Compatibilidade com dados antigos
-        data.setdefault('status', 'Finalizada' if data.get('finalizada') else 'Agendada')
-        data.setdefault('publico', 0)
-        data.setdefault('observacoes', '')
-        
-        # Escalações
-        escal_mand = data.get('escalacao_mandante', {})
-        escal_visit = data.get('escalacao_visitante', {})
-        data['escalacao_mandante'] = Escalacao.from_dict(escal_mand) if escal_mand else Escalacao()
-        data['escalacao_visitante'] = Escalacao.from_dict(escal_visit) if escal_visit else Escalacao()
+            self.mandante.empates += sinal
+            self.visitante.empates += sinal
+
+    def registrar_forma(self, sinal: int = 1) -> None:
+        """Leva (ou, com sinal=-1, retira) o resultado à forma recente das duas equipes."""
+        g_mandante, g_visitante = self.placar_mandante, self.placar_visitante
+        self.mandante.forma.registrar(self.id, self.data, True, g_mandante, g_visitante, sinal)
+        self.visitante.forma.registrar(self.id, self.data, False, g_visitante, g_mandante, sinal)
+
+    def finalizar_partida(self, g_mandante: int | None = None, g_visitante: int | None = None) -> None:
+        """Encerra a partida. Sem placar, vale o dos gols registrados; um placar
+        maior que o registrado completa com gols sem autor."""
+        if self.finalizada:
+            return
+
+        if g_mandante is not None and g_visitante is not None:
+            self._ajustar_gols_sem_autor(g_mandante, g_visitante)
         
-        # Gols
-        data['gols'] = [Gol.from_dict(g) for g in data.get('gols', [])]
+        # Atualiza estatísticas das equipes
+        self._aplicar_resultado(1)
         
-        return cls(**data)
\ No newline at end of file
+        self.finalizada = True
+        self.alterar_status("Finalizada")
+
+    def corrigir_resultado(self, g_mandante: int, g_visitante: int) -> None:
+        """Troca o placar de uma partida finalizada: desfaz o resultado anterior
+        nas equipes e aplica o novo, sem recalcular a classificação."""
+        if not self.finalizada:
+            raise PartidaNaoFinalizada(f"A partida {self.id} ainda não foi finalizada.")
+        self._ajustar_gols_sem_autor(g_mandante, g_visitante)
+
+    def reprojetar_placar(self) -> bool:
+        """Refaz o placar a partir dos gols registrados, levando a diferença às
+        equipes se a partida já estiver finalizada. Retorna se o placar mudou."""
+        g_mandante = sum(1 for g in self._gols if g.equipe_id == self.mandante.id)
+        placar = (g_mandante, len(self._gols) - g_mandante)
+        if (self.placar_mandante, self.placar_visitante) == placar:
+            return False
+        if self.finalizada:
+            self._aplicar_resultado(-1)
+        self.placar_mandante, self.placar_visitante = placar
+        if self.finalizada:
+            self._aplicar_resultado(1)
+        return True
+
+    def reabrir(self, status: str = "Agendada") -> None:
+        """Desfaz o resultado nas equipes e volta a partida para o status indicado.
+        Os gols registrados são mantidos."""
+        if self.finalizada:
+            self._aplicar_resultado(-1)
+        self.finalizada = False
+        self.alterar_status(status)
+
+    def cancelar(self) -> None:
+        """Cancela a partida; um resultado já registrado deixa de contar."""
+        self.reabrir("Cancelada")
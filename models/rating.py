@@ -0,0 +1,196 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+import bisect
+from models.campeonato import Campeonato
+from models.equipe import Equipe
+from models.partida import Jogo
+
+ELO_INICIAL = 1500.0
+FATOR_K = 20.0
+VANTAGEM_MANDO = 60.0
+
+
+def chave_equipe(equipe: Equipe) -> str:
+    """Identidade da equipe entre temporadas (nome normalizado)."""
+    return " ".join(equipe.nome.split()).lower()
+
+
+@dataclass
+class RatingEquipe:
+    """Rating acumulado de uma equipe ao longo de todas as temporadas."""
+    nome: str
+    elo: float = ELO_INICIAL
+    jogos: int = 0
+    gols_marcados: int = 0
+    gols_sofridos: int = 0
+    historico: List[Tuple[datetime, float]] = field(default_factory=list)
+
+
+@dataclass
+class _Aplicado:
+    """Efeito de um jogo registrado no motor, guardado para desfazê-lo."""
+    jogo: Jogo
+    data: datetime
+    placar: Tuple[int, int]
+    mandante: RatingEquipe
+    visitante: RatingEquipe
+    delta: float
+    indices: Tuple[int, int]  # Posição do ponto no histórico do mandante e do visitante
+
+
+class MotorRating:
+    """Mantém Elo e parâmetros de Poisson (ataque/defesa) por equipe.
+
+    Os jogos são aplicados em ordem cronológica e o efeito de cada um é
+    guardado. `registrar_partida` de um jogo posterior aos demais é O(1);
+    corrigir, cancelar ou inserir um jogo no meio da sequência desfaz os jogos
+    seguintes, aplica a mudança e os refaz, de modo que Elo e histórico ficam
+    iguais aos de `reconstruir`, que refaz tudo em uma única passada.
+    """
+
+    def __init__(self, k: float = FATOR_K, vantagem_mando: float = VANTAGEM_MANDO):
+        self.k = k
+        self.vantagem_mando = vantagem_mando
+        self._ratings: Dict[str, RatingEquipe] = {}
+        self._total_gols = 0
+        self._total_jogos = 0
+        self._aplicados: Dict[str, _Aplicado] = {}
+        self._cronologia: List[Tuple[datetime, str]] = []  # (data, jogo_id) na ordem de aplicação
+
+    def _obter(self, equipe: Equipe) -> RatingEquipe:
+        chave = chave_equipe(equipe)
+        rating = self._ratings.get(chave)
+        if rating is None:
+            rating = RatingEquipe(nome=equipe.nome)
+            self._ratings[chave] = rating
+        return rating
+
+    @staticmethod
+    def _multiplicador_saldo(saldo: int) -> float:
+        """Peso pela diferença de gols (padrão do World Football Elo)."""
+        if saldo <= 1:
+            return 1.0
+        if saldo == 2:
+            return 1.5
+        return (11 + saldo) / 8
+
+    def _aplicar(self, jogo: Jogo, g_m: int, g_v: int) -> None:
+        """Aplica o jogo depois de todos os já aplicados."""
+        mand = self._obter(jogo.mandante)
+        visit = self._obter(jogo.visitante)
+        esperado_m = 1 / (1 + 10 ** ((visit.elo - mand.elo - self.vantagem_mando) / 400))
+        resultado_m = 1.0 if g_m > g_v else 0.0 if g_m < g_v else 0.5
+        delta = self.k * self._multiplicador_saldo(abs(g_m - g_v)) * (resultado_m - esperado_m)
+
+        indices = []
+        for rating, ajuste, marcados, sofridos in ((mand, delta, g_m, g_v), (visit, -delta, g_v, g_m)):
+            rating.elo += ajuste
+            rating.jogos += 1
+            rating.gols_marcados += marcados
+            rating.gols_sofridos += sofridos
+            rating.historico.append((jogo.data, rating.elo))
+            indices.append(len(rating.historico) - 1)
+
+        self._total_gols += g_m + g_v
+        self._total_jogos += 1
+        self._aplicados[jogo.id] = _Aplicado(jogo, jogo.data, (g_m, g_v), mand, visit, delta, tuple(indices))
+        self._cronologia.append((jogo.data, jogo.id))
+
+    def _recuar(self, posicao: int) -> List[Tuple[Jogo, int, int]]:
+        """Desfaz, do último para trás, os jogos da cronologia a partir de
+        `posicao`; retorna-os em ordem cronológica, com o placar aplicado."""
+        desfeitos = []
+        while len(self._cronologia) > posicao:
+            _, jogo_id = self._cronologia.pop()
+            aplicado = self._aplicados.pop(jogo_id)
+            g_m, g_v = aplicado.placar
+            for rating, ajuste, marcados, sofridos, indice in (
+                    (aplicado.mandante, aplicado.delta, g_m, g_v, aplicado.indices[0]),
+                    (aplicado.visitante, -aplicado.delta, g_v, g_m, aplicado.indices[1])):
+                rating.elo -= ajuste
+                rating.jogos -= 1
+                rating.gols_marcados -= marcados
+                rating.gols_sofridos -= sofridos
+                del rating.historico[indice]  # Sempre o último ponto: os posteriores já foram desfeitos
+                if not rating.jogos:
+                    self._ratings.pop(chave_equipe(rating), None)
+            self._total_gols -= g_m + g_v
+            self._total_jogos -= 1
+            desfeitos.append((aplicado.jogo, g_m, g_v))
+        return desfeitos[::-1]
+
+    def _refazer(self, jogos: List[Tuple[Jogo, int, int]]) -> None:
+        for jogo, g_m, g_v in jogos:
+            self._aplicar(jogo, g_m, g_v)
+
+    def _posicao(self, jogo_id: str) -> int:
+        aplicado = self._aplicados[jogo_id]
+        posicao = bisect.bisect_left(self._cronologia, aplicado.data, key=lambda p: p[0])
+        while self._cronologia[posicao][1] != jogo_id:  # Jogos no mesmo horário
+            posicao += 1
+        return posicao
+
+    def registrar_partida(self, jogo: Jogo) -> None:
+        """Aplica o resultado do jogo; um jogo já registrado (placar corrigido) é
+        substituído na mesma posição, se a data não mudou."""
+        aplicado = self._aplicados.get(jogo.id)
+        if aplicado is not None and aplicado.data == jogo.data:
+            posicao = self._posicao(jogo.id)
+            posteriores = self._recuar(posicao + 1)
+            self._recuar(posicao)
+        else:
+            self.remover_partida(jogo)
+            posteriores = self._recuar(bisect.bisect_right(self._cronologia, jogo.data, key=lambda p: p[0]))
+        if jogo.finalizada:
+            posteriores.insert(0, (jogo, jogo.placar_mandante, jogo.placar_visitante))
+        self._refazer(posteriores)
+
+    def remover_partida(self, jogo: Jogo) -> None:
+        """Desfaz o efeito registrado do jogo e refaz os jogos posteriores a ele."""
+        if jogo.id not in self._aplicados:
+            return
+        posicao = self._posicao(jogo.id)
+        posteriores = self._recuar(posicao + 1)
+        self._recuar(posicao)
+        self._refazer(posteriores)
+
+    def reconstruir(self, campeonatos: Iterable[Campeonato]) -> None:
+        """Recalcula todos os ratings a partir dos jogos finalizados de todas as temporadas."""
+        self._ratings = {}
+        self._total_gols = 0
+        self._total_jogos = 0
+        self._aplicados = {}
+        self._cronologia = []
+        jogos = [j for c in campeonatos for f in c.fases for j in f.jogos if j.finalizada]
+        jogos.sort(key=lambda j: j.data)
+        for jogo in jogos:
+            self.registrar_partida(jogo)
+
+    def elo(self, equipe: Equipe) -> float:
+        rating = self._ratings.get(chave_equipe(equipe))
+        return rating.elo if rating else ELO_INICIAL
+
+    def forca_poisson(self, equipe: Equipe) -> Tuple[float, float]:
+        """Retorna (ataque, defesa) relativos à média de gols por equipe por jogo."""
+        rating = self._ratings.get(chave_equipe(equipe))
+        if not rating or not rating.jogos or not self._total_gols:
+            return 1.0, 1.0
+        media = self._total_gols / (2 * self._total_jogos)
+        return (rating.gols_marcados / rating.jogos) / media, (rating.gols_sofridos / rating.jogos) / media
+
+    def gols_esperados(self, mandante: Equipe, visitante: Equipe) -> Tuple[float, float]:
+        """Médias de Poisson (lambda) de gols de mandante e visitante em um confronto."""
+        if not self._total_jogos:
+            return 0.0, 0.0
+        media = self._total_gols / (2 * self._total_jogos)
+        ataque_m, defesa_m = self.forca_poisson(mandante)
+        ataque_v, defesa_v = self.forca_poisson(visitante)
+        return ataque_m * defesa_v * media, ataque_v * defesa_m * media
+
+    def historico(self, equipe: Equipe) -> List[Tuple[datetime, float]]:
+        rating = self._ratings.get(chave_equipe(equipe))
+        return list(rating.historico) if rating else []
+
+    def ranking(self) -> List[RatingEquipe]:
+        return sorted(self._ratings.values(), key=lambda r: r.elo, reverse=True)
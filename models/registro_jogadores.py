@@ -0,0 +1,191 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+import unicodedata
+import uuid
+from models.campeonato import Campeonato
+from models.jogador import Jogador
+from models.partida import Jogo
+
+
+def normalizar_nome(nome: str) -> str:
+    """Nome sem acentos, em minúsculas e com espaços simples."""
+    sem_acento = unicodedata.normalize('NFKD', nome).encode('ascii', 'ignore').decode('ascii')
+    return " ".join(sem_acento.split()).lower()
+
+
+@dataclass
+class TemporadaJogador:
+    """Estatísticas de um jogador em um campeonato."""
+    campeonato_id: str
+    campeonato: str
+    ano: int
+    equipe: str
+    jogos: int = 0
+    titular: int = 0
+    reserva: int = 0
+    gols: int = 0
+
+
+@dataclass
+class Pessoa:
+    """Jogador único entre campeonatos, com os totais da carreira já agregados."""
+    id: str
+    nome: str
+    jogador_ids: set = field(default_factory=set)
+    temporadas: Dict[str, TemporadaJogador] = field(default_factory=dict)
+    jogos: int = 0
+    titular: int = 0
+    reserva: int = 0
+    gols: int = 0
+
+
+class RegistroJogadores:
+    """Registro global de jogadores.
+
+    Cada `Jogador` de cada campeonato é ligado a uma `Pessoa` pelo campo
+    `pessoa_id`; registros sem `pessoa_id` ganham uma pessoa nova. Homônimos
+    (mesmo nome normalizado) não são unidos automaticamente: aparecem em
+    `sugestoes` e só viram a mesma pessoa por `unificar`. Jogos (a partir da `Escalacao`) e gols (a partir dos eventos de gol)
+    são agregados por pessoa e temporada, então consultas de carreira são
+    buscas em dicionário.
+    """
+
+    def __init__(self):
+        self._pessoas: Dict[str, Pessoa] = {}
+        self._por_nome: Dict[str, set] = {}  # nome normalizado -> ids das pessoas
+        self._por_jogador: Dict[str, str] = {}
+        self._equipe_de: Dict[str, tuple] = {}  # jogador_id -> (campeonato, nome da equipe)
+        self._contabilizados: set = set()  # ids dos jogos já somados
+
+    def vincular(self, jogador: Jogador) -> bool:
+        """Liga o jogador à sua pessoa, criando-a se preciso (nunca pelo nome).
+        Retorna True se o `pessoa_id` do jogador foi alterado."""
+        alterado = not jogador.pessoa_id
+        pessoa_id = jogador.pessoa_id or str(uuid.uuid4())
+        pessoa = self._pessoas.get(pessoa_id)
+        if pessoa is None:
+            pessoa = Pessoa(id=pessoa_id, nome=jogador.nome)
+            self._pessoas[pessoa_id] = pessoa
+        self._por_nome.setdefault(normalizar_nome(jogador.nome), set()).add(pessoa_id)
+        pessoa.jogador_ids.add(jogador.id)
+        self._por_jogador[jogador.id] = pessoa_id
+        jogador.pessoa_id = pessoa_id
+        return alterado
+
+    def _temporada(self, pessoa: Pessoa, camp: Campeonato, jogador_id: str) -> TemporadaJogador:
+        temporada = pessoa.temporadas.get(camp.id)
+        if temporada is None:
+            temporada = TemporadaJogador(camp.id, camp.nome, camp.ano, self._equipe_de.get(jogador_id, ('', ''))[1])
+            pessoa.temporadas[camp.id] = temporada
+        return temporada
+
+    def registrar_partida(self, camp: Campeonato, jogo: Jogo, sinal: int = 1) -> None:
+        """Soma (ou, com sinal=-1, desfaz) as participações e gols de um jogo finalizado.
+        Cada jogo é somado uma única vez e só é desfeito se tiver sido somado."""
+        if sinal > 0:
+            if not jogo.finalizada or jogo.id in self._contabilizados:
+                return
+            self._contabilizados.add(jogo.id)
+        else:
+            if jogo.id not in self._contabilizados:
+                return
+            self._contabilizados.discard(jogo.id)
+        for escalacao in (jogo.escalacao_mandante, jogo.escalacao_visitante):
+            for papel, ids in (('titular', escalacao.titulares), ('reserva', escalacao.reservas)):
+                for jogador_id in ids:
+                    pessoa = self._pessoas.get(self._por_jogador.get(jogador_id))
+                    if pessoa is None:
+                        continue
+                    temporada = self._temporada(pessoa, camp, jogador_id)
+                    for alvo in (pessoa, temporada):
+                        alvo.jogos += sinal
+                        setattr(alvo, papel, getattr(alvo, papel) + sinal)
+        for gol in jogo.gols:
+            if gol.tipo == "gol_contra":
+                continue
+            pessoa = self._pessoas.get(self._por_jogador.get(gol.jogador_id))
+            if pessoa is None:
+                continue
+            self._temporada(pessoa, camp, gol.jogador_id).gols += sinal
+            pessoa.gols += sinal
+
+    def remover_partida(self, camp: Campeonato, jogo: Jogo) -> None:
+        """Desfaz um jogo somado que foi reaberto ou cancelado."""
+        self.registrar_partida(camp, jogo, -1)
+
+    def reconstruir(self, campeonatos: Iterable[Campeonato]) -> List[Campeonato]:
+        """Reconstrói o registro em uma passada. Retorna os campeonatos cujos
+        jogadores receberam `pessoa_id` e precisam ser salvos."""
+        self._pessoas, self._por_nome, self._por_jogador, self._equipe_de = {}, {}, {}, {}
+        self._contabilizados = set()
+        campeonatos = list(campeonatos)
+        alterados = []
+        for camp in sorted(campeonatos, key=lambda c: c.ano):
+            alterou = False
+            for equipe in camp.equipes_inscritas:
+                for jogador in equipe.elenco:
+                    alterou |= self.vincular(jogador)
+                    self._equipe_de[jogador.id] = (camp.id, equipe.nome)
+            if alterou:
+                alterados.append(camp)
+        for camp in campeonatos:
+            for fase in camp.fases:
+                for jogo in fase.jogos:
+                    self.registrar_partida(camp, jogo)
+        return alterados
+
+    def adicionar_jogador(self, camp: Campeonato, equipe_nome: str, jogador: Jogador) -> None:
+        self.vincular(jogador)
+        self._equipe_de[jogador.id] = (camp.id, equipe_nome)
+
+    def sugestoes(self, pessoa_id: str) -> List[Pessoa]:
+        """Outras pessoas com o mesmo nome normalizado: candidatas a `unificar`."""
+        pessoa = self._pessoas.get(pessoa_id)
+        if pessoa is None:
+            return []
+        ids = self._por_nome.get(normalizar_nome(pessoa.nome), set()) - {pessoa_id}
+        return [self._pessoas[i] for i in sorted(ids) if i in self._pessoas]
+
+    def unificar(self, pessoa_id: str, outra_id: str, campeonatos: Iterable[Campeonato]) -> List[Campeonato]:
+        """Funde duas pessoas (mesmo jogador em registros diferentes). Retorna
+        os campeonatos cujos jogadores tiveram o `pessoa_id` alterado."""
+        if pessoa_id == outra_id or outra_id not in self._pessoas or pessoa_id not in self._pessoas:
+            return []
+        outra = self._pessoas[outra_id]
+        alterados = []
+        for camp in campeonatos:
+            alterou = False
+            for equipe in camp.equipes_inscritas:
+                for jogador in equipe.elenco:
+                    if jogador.pessoa_id == outra_id:
+                        jogador.pessoa_id = pessoa_id
+                        alterou = True
+            if alterou:
+                alterados.append(camp)
+        for ids in self._por_nome.values():
+            if outra_id in ids:
+                ids.discard(outra_id)
+                ids.add(pessoa_id)
+        for jogador_id in outra.jogador_ids:
+            self._por_jogador[jogador_id] = pessoa_id
+        pessoa = self._pessoas[pessoa_id]
+        pessoa.jogador_ids |= outra.jogador_ids
+        for camp_id, temporada in outra.temporadas.items():
+            atual = pessoa.temporadas.setdefault(camp_id, temporada)
+            if atual is not temporada:
+                for campo in ('jogos', 'titular', 'reserva', 'gols'):
+                    setattr(atual, campo, getattr(atual, campo) + getattr(temporada, campo))
+        for campo in ('jogos', 'titular', 'reserva', 'gols'):
+            setattr(pessoa, campo, getattr(pessoa, campo) + getattr(outra, campo))
+        del self._pessoas[outra_id]
+        return alterados
+
+    def pessoa_do_jogador(self, jogador_id: str) -> Pessoa | None:
+        return self._pessoas.get(self._por_jogador.get(jogador_id))
+
+    def carreira(self, pessoa_id: str) -> Pessoa | None:
+        return self._pessoas.get(pessoa_id)
+
+    def buscar(self, termo: str) -> List[Pessoa]:
+        termo = normalizar_nome(termo)
+        return [p for p in self._pessoas.values() if termo in normalizar_nome(p.nome)]
@@ -0,0 +1,117 @@
+"""Geração dos métodos to_dict/from_dict das dataclasses do modelo.
+
+O decorador `serializavel` monta, uma única vez na importação, o código-fonte
+de um codificador e de um decodificador específicos para a classe, a partir
+dos campos e das anotações de tipo. O codificador lê os atributos diretamente
+(sem a cópia profunda recursiva de `dataclasses.asdict`) e o decodificador
+aplica os valores padrão em uma passada, sem alterar o dicionário recebido.
+"""
+from dataclasses import MISSING, fields
+from datetime import datetime
+from typing import Callable, Dict, List, get_args, get_origin, get_type_hints
+import re
+
+# Namespace compartilhado pelas funções geradas: os codificadores de uma classe
+# chamam os das classes aninhadas pelo nome qualificado (_cod_models_jogador_Jogador, ...)
+_NS: dict = {'_datetime': datetime, '_novo': object.__new__}
+_REGISTRADAS: set = set()
+
+
+def _chave(cls) -> str:
+    """Identificador da classe nos nomes gerados, único por módulo e classe."""
+    return re.sub(r'\W', '_', f"{cls.__module__}.{cls.__qualname__}")
+
+
+def _lista_de(tipo):
+    if tipo is list:
+        return None, True
+    if get_origin(tipo) in (list, List):
+        args = get_args(tipo)
+        return (args[0] if args else None), True
+    return None, False
+
+
+def _expr_codificar(tipo, valor: str) -> str:
+    if tipo in _REGISTRADAS:
+        return f"_cod_{_chave(tipo)}({valor})"
+    item, eh_lista = _lista_de(tipo)
+    if eh_lista:
+        if item in _REGISTRADAS:
+            return f"[_cod_{_chave(item)}(x) for x in {valor}]"
+        return f"list({valor})"
+    if tipo is datetime:
+        return f"{valor}.isoformat()"
+    return valor
+
+
+def _expr_decodificar(tipo, valor: str) -> str:
+    if tipo in _REGISTRADAS:
+        return f"_dec_{_chave(tipo)}(_cls_{_chave(tipo)}, {valor})"
+    item, eh_lista = _lista_de(tipo)
+    if eh_lista:
+        if item in _REGISTRADAS:
+            return f"[_dec_{_chave(item)}(_cls_{_chave(item)}, x) for x in {valor}]"
+        return f"list({valor})"
+    if tipo is datetime:
+        return f"_datetime.fromisoformat({valor})"
+    return valor
+
+
+def serializavel(extras=(), tipos: Dict[str, object] | None = None,
+                 decodificar: Dict[str, Callable[[dict], object]] | None = None):
+    """Gera `to_dict` e `from_dict` para a dataclass decorada.
+
+    extras: propriedades calculadas incluídas no dict (apenas para leitura do JSON).
+    tipos: anotações que substituem as da classe (ex.: `gols: list` que contém `Gol`).
+    decodificar: função que recebe o dict e devolve o valor do campo, no lugar da leitura padrão.
+    """
+    tipos = tipos or {}
+    decodificar = decodificar or {}
+
+    def decorar(cls):
+        nome = _chave(cls)
+        anotacoes = get_type_hints(cls)
+        anotacoes.update(tipos)
+
+        itens_cod = [f"{f.name!r}: {_expr_codificar(anotacoes[f.name], 'obj.' + f.name)}" for f in fields(cls)]
+        itens_cod += [f"{e!r}: obj.{e}" for e in extras]
+        codigo = f"def _cod_{nome}(obj):\n    return {{{', '.join(itens_cod)}}}\n"
+
+        itens_dec = []
+        for f in fields(cls):
+            chave = repr(f.name)
+            conversao = _expr_decodificar(anotacoes[f.name], f"data[{chave}]")
+            if f.name in decodificar:
+                _NS[f"_regra_{nome}_{f.name}"] = decodificar[f.name]
+                itens_dec.append(f"{chave}: _regra_{nome}_{f.name}(data)")
+            elif f.default is not MISSING:
+                padrao = repr(f.default)
+                if conversao == f"data[{chave}]":
+                    itens_dec.append(f"{chave}: data.get({chave}, {padrao})")
+                else:
+                    itens_dec.append(f"{chave}: {conversao} if {chave} in data else {padrao}")
+            elif f.default_factory is not MISSING:
+                # Sem o valor no dict, usa a default_factory da classe (ex.: novo UUID)
+                _NS[f"_fab_{nome}_{f.name}"] = f.default_factory
+                itens_dec.append(f"{chave}: {conversao} if {chave} in data else _fab_{nome}_{f.name}()")
+            else:
+                itens_dec.append(f"{chave}: {conversao}")
+        if hasattr(cls, '__post_init__'):
+            codigo += f"def _dec_{nome}(cls, data):\n    return cls(**{{{', '.join(itens_dec)}}})\n"
+        else:
+            # Sem __post_init__, o __init__ só atribuiria os campos: preenche o __dict__ direto
+            codigo += (
+                f"def _dec_{nome}(cls, data):\n"
+                f"    obj = _novo(cls)\n"
+                f"    obj.__dict__ = {{{', '.join(itens_dec)}}}\n"
+                f"    return obj\n"
+            )
+
+        _NS[f"_cls_{nome}"] = cls
+        exec(compile(codigo, f"<serializacao {cls.__module__}.{cls.__qualname__}>", "exec"), _NS)
+        _REGISTRADAS.add(cls)
+        cls.to_dict = _NS[f"_cod_{nome}"]
+        cls.from_dict = classmethod(_NS[f"_dec_{nome}"])
+        return cls
+
+    return decorar
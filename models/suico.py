@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Set, Tuple
+from models.agenda import DURACAO_JOGO
+from models.campeonato import Campeonato, Fase
+from models.equipe import Equipe
+from models.partida import Jogo
+from utils.exceptions import PareamentoImpossivel, RodadaPendente
+
+TIPO_SUICO = "Suíço"
+LIMITE_TENTATIVAS = 20_000  # Adversários testados na busca de uma rodada sem revanches
+
+
+class PareamentoSuico:
+    """Gera as rodadas de um campeonato no sistema suíço.
+
+    Cada rodada é uma `Fase` do tipo "Suíço". As equipes são ordenadas pela
+    classificação e separadas em grupos de pontuação; dentro do grupo a equipe
+    da metade de cima enfrenta a da metade de baixo, e quem não tiver adversário
+    inédito no grupo desce para o seguinte. O índice de adversários (conjunto
+    por equipe) torna a checagem de revanche O(1); o emparelhamento volta atrás
+    só quando uma escolha deixa o restante sem solução. Com número ímpar de
+    equipes, a pior colocada que ainda não folgou fica de fora da rodada.
+
+    Sem revanches, n equipes comportam no máximo n - 1 rodadas (n com número
+    ímpar), e nas últimas delas pode já não haver pareamento inédito. Nesse
+    caso, ou se a busca passar de `LIMITE_TENTATIVAS` adversários testados,
+    `parear` lança `PareamentoImpossivel`; com `permitir_revanche`, pareia
+    pela mesma ordem, aceitando revanche só para quem não tem adversário
+    inédito entre os que restam.
+    """
+
+    def __init__(self, camp: Campeonato):
+        self.camp = camp
+        self._adversarios: Dict[str, Set[str]] = {e.id: set() for e in camp.equipes_inscritas}
+        self._mando: Dict[str, int] = {e.id: 0 for e in camp.equipes_inscritas}  # jogos em casa - fora
+        self._folgas: Set[str] = set()
+        self._tentativas = 0
+        self._rodadas = [f for f in camp.fases if f.tipo == TIPO_SUICO]
+        for fase in self._rodadas:
+            presentes = set()
+            for jogo in fase.jogos:
+                if jogo.status == "Cancelada":
+                    continue
+                mand, visit = jogo.mandante.id, jogo.visitante.id
+                self._adversarios.setdefault(mand, set()).add(visit)
+                self._adversarios.setdefault(visit, set()).add(mand)
+                self._mando[mand] = self._mando.get(mand, 0) + 1
+                self._mando[visit] = self._mando.get(visit, 0) - 1
+                presentes |= {mand, visit}
+            self._folgas |= {e.id for e in camp.equipes_inscritas} - presentes
+
+    def ja_se_enfrentaram(self, equipe: Equipe, outra: Equipe) -> bool:
+        return outra.id in self._adversarios.get(equipe.id, ())
+
+    def _classificacao(self) -> List[Equipe]:
+        return sorted(self.camp.equipes_inscritas,
+                      key=lambda e: (-e.pontos, -e.saldo_gols, -e.gols_marcados, e.nome))
+
+    @staticmethod
+    def _candidatos(equipe: Equipe, resto: List[Equipe]) -> List[Equipe]:
+        """Metade de cima x metade de baixo do grupo; depois as equipes abaixo, em ordem."""
+        mesmo_grupo = [e for e in resto if e.pontos == equipe.pontos]
+        meio = len(mesmo_grupo) // 2
+        return mesmo_grupo[meio:] + mesmo_grupo[:meio][::-1] + resto[len(mesmo_grupo):]
+
+    def _parear(self, restantes: List[Equipe]) -> List[Tuple[Equipe, Equipe]] | None:
+        if not restantes:
+            return []
+        equipe, resto = restantes[0], restantes[1:]
+        for adversario in self._candidatos(equipe, resto):
+            if self.ja_se_enfrentaram(equipe, adversario):
+                continue
+            self._tentativas += 1
+            if self._tentativas > LIMITE_TENTATIVAS:
+                return None
+            pares = self._parear([e for e in resto if e is not adversario])
+            if pares is not None:
+                return [(equipe, adversario)] + pares
+        return None
+
+    def _parear_com_revanche(self, restantes: List[Equipe]) -> List[Tuple[Equipe, Equipe]]:
+        pares = []
+        while restantes:
+            equipe, resto = restantes[0], restantes[1:]
+            candidatos = self._candidatos(equipe, resto)
+            adversario = next((e for e in candidatos if not self.ja_se_enfrentaram(equipe, e)), candidatos[0])
+            pares.append((equipe, adversario))
+            restantes = [e for e in resto if e is not adversario]
+        return pares
+
+    def _mandante(self, a: Equipe, b: Equipe) -> Tuple[Equipe, Equipe]:
+        """Joga em casa quem tem menos jogos como mandante que como visitante."""
+        return (b, a) if self._mando.get(b.id, 0) < self._mando.get(a.id, 0) else (a, b)
+
+    def parear(self, permitir_revanche: bool = False) -> Tuple[List[Tuple[Equipe, Equipe]], Equipe | None]:
+        """Confrontos (mandante, visitante) da próxima rodada e a equipe que folga."""
+        classificacao = self._classificacao()
+        folga = None
+        if len(classificacao) % 2:
+            folga = next((e for e in reversed(classificacao) if e.id not in self._folgas), classificacao[-1])
+            classificacao.remove(folga)
+        self._tentativas = 0
+        pares = self._parear(classificacao)
+        if pares is None and permitir_revanche:
+            pares = self._parear_com_revanche(classificacao)
+        if pares is None:
+            raise PareamentoImpossivel("Não há como parear a rodada sem repetir confrontos.")
+        return [self._mandante(a, b) for a, b in pares], folga
+
+    def gerar_rodada(self, inicio: datetime, locais: List[str], intervalo: timedelta = DURACAO_JOGO,
+                     permitir_revanche: bool = False) -> Tuple[Fase, Equipe | None]:
+        """Monta a próxima rodada (sem adicioná-la ao campeonato). Os jogos são
+        distribuídos pelos locais em horários sucessivos a partir de `inicio`."""
+        pendentes = [j for f in self._rodadas for j in f.jogos if not j.finalizada and j.status != "Cancelada"]
+        if pendentes:
+            raise RodadaPendente(f"Há {len(pendentes)} jogo(s) da rodada anterior sem resultado.")
+        pares, folga = self.parear(permitir_revanche)
+        numero = len(self._rodadas) + 1
+        fase = Fase(nome=f"Rodada {numero}", ordem=numero, tipo=TIPO_SUICO)
+        for i, (mandante, visitante) in enumerate(pares):
+            horario, quadra = divmod(i, len(locais))
+            fase.adicionar_jogo(Jogo(mandante=mandante, visitante=visitante,
+                                     data=inicio + horario * intervalo, local=locais[quadra]))
+        return fase, folga
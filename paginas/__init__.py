@@ -0,0 +1,21 @@
+"""Páginas do app Streamlit, uma por item do menu.
+
+Cada módulo expõe `render(camp)` e só é importado na primeira vez que a
+página é aberta; bibliotecas pesadas (ex.: plotly) ficam nos módulos que as usam.
+"""
+import importlib
+
+PAGINAS = {
+    "Classificação": "classificacao",
+    "Estatísticas": "estatisticas",
+    "Pesquisa": "pesquisa",
+    "Equipes": "equipes",
+    "Jogadores": "jogadores",
+    "Gerenciar Partidas": "partidas",
+    "Fases/Grupos": "fases",
+    "Campeonatos": "campeonatos",
+}
+
+
+def renderizar(nome: str, camp) -> None:
+    importlib.import_module(f"{__name__}.{PAGINAS[nome]}").render(camp)
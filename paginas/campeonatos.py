@@ -0,0 +1,164 @@
+"""Página "Campeonatos"."""
+from datetime import datetime
+
+import streamlit as st
+
+from models.campeonato import Campeonato
+from paginas.comum import FORMATOS, config, get_backup_store, get_dao, get_camp_tipo, invalidar_indices
+
+
+def render(camp: Campeonato):
+    dao = get_dao()
+    st.subheader("Gerenciar Campeonatos")
+    tab_listar, tab_criar, tab_editar, tab_excluir, tab_backup = st.tabs(["Listar", "Criar", "Editar", "Excluir", "Backups"])
+    
+    with tab_listar:
+        todos = dao.listar_todos()
+        if not todos:
+            st.info("Nenhum campeonato cadastrado.")
+        else:
+            for c in todos:
+                ativo = "✅" if c.id == camp.id else ""
+                st.write(f"{ativo} **{c.nome}** - {c.ano} - {get_camp_tipo(c)} (ID: {c.id[:8]}...)")
+    
+    with tab_criar:
+        nome_novo = st.text_input("Nome do campeonato", key="camp_nome", max_chars=100)
+        ano_novo = st.number_input("Ano", min_value=2000, max_value=2100, value=datetime.now().year, step=1, key="camp_ano")
+        tipo_novo = st.selectbox("Formato", FORMATOS, key="camp_tipo")
+        if st.button("Criar campeonato", key="camp_criar"):
+            # Validações
+            if not nome_novo.strip():
+                st.error("⚠️ O nome do campeonato é obrigatório.")
+            elif len(nome_novo.strip()) < 3:
+                st.error("⚠️ O nome deve ter pelo menos 3 caracteres.")
+            elif any(c.nome.lower() == nome_novo.strip().lower() and c.ano == ano_novo for c in dao.listar_todos()):
+                st.error(f"⚠️ Já existe um campeonato '{nome_novo.strip()}' em {ano_novo}.")
+            else:
+                try:
+                    novo_camp = Campeonato(nome=nome_novo.strip(), ano=int(ano_novo), tipo=tipo_novo)
+                    with dao.transacao():
+                        dao.salvar(novo_camp)
+                    st.session_state.campeonato_id = novo_camp.id
+                    st.success(f"✅ Campeonato '{nome_novo.strip()}' criado e selecionado!")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Erro ao criar campeonato: {e}")
+    
+    with tab_editar:
+        if not dao.listar_todos():
+            st.info("Nenhum campeonato para editar.")
+        else:
+            camp_edit = st.selectbox(
+                "Selecione o campeonato",
+                dao.listar_todos(),
+                format_func=lambda c: f"{c.nome} ({c.ano}) - {get_camp_tipo(c)}",
+                key="camp_edit_select"
+            )
+            novo_nome = st.text_input("Novo nome", value=camp_edit.nome, key="camp_edit_nome")
+            novo_ano = st.number_input("Novo ano", min_value=2000, max_value=2100, value=camp_edit.ano, step=1, key="camp_edit_ano")
+            novo_tipo = st.selectbox(
+                "Formato",
+                FORMATOS,
+                index=FORMATOS.index(camp_edit.tipo) if camp_edit.tipo in FORMATOS else 0,
+                key="camp_edit_tipo"
+            )
+            if st.button("Salvar alterações", key="camp_edit_salvar"):
+                if not novo_nome.strip():
+                    st.error("Informe o nome do campeonato.")
+                else:
+                    with dao.transacao(camp_edit):
+                        camp_edit.nome = novo_nome.strip()
+                        camp_edit.ano = int(novo_ano)
+                        camp_edit.tipo = novo_tipo
+                        dao.salvar(camp_edit)
+                    st.success("Campeonato atualizado.")
+                    st.rerun()
+    
+    with tab_excluir:
+        if not dao.listar_todos():
+            st.info("Nenhum campeonato para excluir.")
+        else:
+            camp_del = st.selectbox(
+                "Selecione o campeonato",
+                dao.listar_todos(),
+                format_func=lambda c: f"{c.nome} ({c.ano})",
+                key="camp_del_select"
+            )
+            
+            # Mostrar informações do campeonato
+            st.warning(f"⚠️ **ATENÇÃO:** Você está prestes a excluir:")
+            st.write(f"- **Campeonato:** {camp_del.nome} ({camp_del.ano})")
+            st.write(f"- **Equipes:** {len(camp_del.equipes_inscritas)}")
+            total_jogos = sum(len(f.jogos) for f in camp_del.fases)
+            st.write(f"- **Jogos:** {total_jogos}")
+            st.write("")
+            st.error("Esta ação não pode ser desfeita!")
+            
+            # Confirmação dupla
+            confirma = st.checkbox("Sim, quero excluir este campeonato", key="confirm_del")
+            
+            if st.button("🗑️ EXCLUIR DEFINITIVAMENTE", key="camp_del_confirm", disabled=not confirma, type="primary"):
+                try:
+                    with dao.transacao():
+                        excluido = dao.excluir(camp_del.id)
+                    if excluido:
+                        # Recarregar dados do arquivo para sincronizar
+                        dao.reload()
+                        invalidar_indices()
+                        # Limpar o campeonato ativo se foi o excluído
+                        if camp_del.id == st.session_state.campeonato_id:
+                            st.session_state.campeonato_id = None
+                        st.success(f"✅ Campeonato '{camp_del.nome}' excluído com sucesso.")
+                        st.rerun()
+                    else:
+                        st.error("❌ Erro: Campeonato não encontrado.")
+                except Exception as e:
+                    st.error(f"❌ Erro ao excluir campeonato: {e}")
+
+    with tab_backup:
+        if not config.get('backup', {}).get('ativo'):
+            st.info("Backups desativados em config.json.")
+        else:
+            store = get_backup_store()
+            todos = dao.listar_todos()
+            ids_ativos = {c.id for c in todos}
+            opcoes = [(c.id, f"{c.nome} ({c.ano})") for c in todos]
+            # Campeonatos excluídos continuam restauráveis a partir dos snapshots
+            for snapshot in store.listar_snapshots():
+                for camp_id, nome in snapshot.nomes.items():
+                    if camp_id not in ids_ativos and camp_id in snapshot.campeonatos:
+                        opcoes.append((camp_id, f"{nome} [excluído]"))
+                        ids_ativos.add(camp_id)
+
+            if not opcoes:
+                st.info("Nenhum backup disponível.")
+            else:
+                camp_bkp_id, _ = st.selectbox(
+                    "Campeonato",
+                    opcoes,
+                    format_func=lambda o: o[1],
+                    key="bkp_camp_select"
+                )
+                snapshots = store.listar_snapshots(camp_bkp_id)
+                if not snapshots:
+                    st.info("Nenhum snapshot deste campeonato.")
+                else:
+                    snapshot_sel = st.selectbox(
+                        "Snapshot",
+                        snapshots,
+                        format_func=lambda s: s.momento.strftime('%d/%m/%Y %H:%M:%S'),
+                        key="bkp_snapshot_select"
+                    )
+                    st.warning("⚠️ O estado atual deste campeonato será substituído pelo do snapshot.")
+                    confirma_bkp = st.checkbox("Sim, restaurar este snapshot", key="bkp_confirm")
+                    if st.button("♻️ Restaurar", key="bkp_restaurar", disabled=not confirma_bkp, type="primary"):
+                        try:
+                            restaurado = store.restaurar(camp_bkp_id, snapshot_sel.id)
+                            with dao.transacao():
+                                dao.salvar(restaurado)
+                            invalidar_indices()
+                            st.session_state.campeonato_id = restaurado.id
+                            st.success(f"✅ Campeonato '{restaurado.nome}' restaurado.")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Erro ao restaurar: {e}")
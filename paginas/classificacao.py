@@ -0,0 +1,45 @@
+"""Página "Classificação"."""
+import streamlit as st
+
+from models.campeonato import Campeonato
+from paginas.comum import get_camp_tipo, exibir_bracket_mmata_mata
+
+
+def render(camp: Campeonato):
+    st.subheader("📊 Tabela de Classificação")
+    st.caption("Critérios: pontos, vitórias, saldo de gols e gols marcados.")
+    
+    # Se for mata-mata, exibir bracket
+    if get_camp_tipo(camp) == "Mata-mata":
+        exibir_bracket_mmata_mata(camp)
+    else:
+        # Exibir tabela de pontos corridos
+        equipes = camp.obter_classificacao()
+        if not equipes:
+            st.warning("Nenhuma equipe cadastrada.")
+        else:
+            # Gráfico de pontos
+            col1, col2 = st.columns([2, 1])
+        
+            with col1:
+                data = [
+                    {
+                        "Posição": i,
+                        "Equipe": e.nome,
+                        "Pontos": e.pontos,
+                        "Vitórias": e.vitorias,
+                        "Empates": e.empates,
+                        "Derrotas": e.derrotas,
+                        "Saldo de Gols": e.saldo_gols,
+                        # Últimos resultados, do mais antigo ao mais recente
+                        "Forma": " ".join(camp.forma(e).ultimos_resultados()),
+                    }
+                    for i, e in enumerate(equipes, 1)
+                ]
+                st.dataframe(data, use_container_width=True, hide_index=True)
+        
+            with col2:
+                st.metric("Total de Equipes", len(equipes))
+                if equipes:
+                    st.metric("Líder", equipes[0].nome)
+                    st.metric("Pontos do Líder", equipes[0].pontos)
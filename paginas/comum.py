@@ -0,0 +1,306 @@
+"""Configuração, DAO da sessão e funções compartilhadas pelas páginas do app."""
+import json
+import os
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+from models.agenda import AgendaJogos
+from models.campeonato import Campeonato
+from models.disciplina import ControleDisciplinar
+from models.equipe import Equipe
+from models.partida import Jogo
+from models.rating import MotorRating
+from models.registro_jogadores import RegistroJogadores
+from models.suico import TIPO_SUICO
+from persistence.backup import BackupStore
+from persistence.dao import CampeonatoFileDAO, abrir_dao
+from persistence.escrita_assincrona import EscritaAssincrona
+from services.eventos import canal_partidas
+from utils import perfil
+
+with open('config.json', 'r', encoding='utf-8') as f:
+    config = json.load(f)
+
+@st.cache_resource
+def get_backup_store() -> BackupStore:
+    """Repositório de backups único por processo, compartilhado entre as sessões."""
+    params = {k: v for k, v in config['backup'].items() if k != 'ativo'}
+    return BackupStore(**params)
+
+@st.cache_resource
+def get_escrita_assincrona() -> EscritaAssincrona:
+    """Thread de gravação em segundo plano única por processo, compartilhada entre as sessões."""
+    return EscritaAssincrona(config.get('armazenamento', {}).get('intervalo_escrita', 1.0))
+
+@st.cache_resource
+def get_gerador_site():
+    """Gerador do site estático único por processo: um só manifesto de hashes por destino."""
+    from services.site_estatico import GeradorSite
+    return GeradorSite(config['site_estatico'].get('destino', 'data/site'))
+
+def get_dao() -> CampeonatoFileDAO:
+    """DAO da sessão (sem cache para evitar problemas com exclusões), criado no primeiro acesso."""
+    if 'dao' not in st.session_state:
+        armazenamento = config.get('armazenamento', {})
+        st.session_state.dao = abrir_dao(armazenamento.get('caminho', 'data/campeonatos.json'))
+        st.session_state.dao.adicionar_ouvinte_reversao(lambda restaurados: invalidar_indices())
+        if not canal_partidas.semeado:  # Jogos que já estavam ao vivo antes de o processo subir
+            canal_partidas.semear(st.session_state.dao.listar_todos())
+        if armazenamento.get('escrita_assincrona'):
+            st.session_state.dao.ativar_escrita_assincrona(escrita=get_escrita_assincrona())
+        if config.get('backup', {}).get('ativo'):
+            store = get_backup_store()
+            if not store.sincronizado:  # Uma vez por processo: as sessões seguintes só registram alterações
+                store.registrar_todos(st.session_state.dao.listar_todos())
+            st.session_state.dao.adicionar_ouvinte(store.registrar)
+        if config.get('site_estatico', {}).get('ativo'):
+            get_gerador_site().conectar(st.session_state.dao)
+    return st.session_state.dao
+
+FORMATOS = ["Pontos corridos", "Mata-mata", TIPO_SUICO]
+
+def get_camp_tipo(camp_obj):
+    return getattr(camp_obj, "tipo", "Pontos corridos")
+
+def ensure_campeonato_tipo():
+    dao = get_dao()
+    with dao.transacao():
+        for c in dao.listar_todos():
+            if not hasattr(c, "tipo") or not c.tipo:
+                c.tipo = "Pontos corridos"
+                dao.salvar(c)
+
+def exibir_bracket_mmata_mata(camp):
+    """Exibe a estrutura de eliminatória (bracket) para campeonatos mata-mata."""
+    if not camp.fases:
+        st.info("Nenhuma fase criada.")
+        return
+    
+    # Ordenar fases por ordem
+    fases = sorted(camp.fases, key=lambda f: f.ordem)
+    
+    st.subheader("🏆 Tabela de Eliminatória")
+    
+    for fase in fases:
+        st.write(f"#### {fase.nome}")
+        
+        if not fase.jogos:
+            st.info(f"Nenhum jogo em {fase.nome}")
+            continue
+        
+        # Criar colunas para exibir os jogos
+        cols = st.columns(len(fase.jogos) if len(fase.jogos) <= 4 else 4)
+        
+        for idx, jogo in enumerate(fase.jogos):
+            col = cols[idx % len(cols)]
+            with col:
+                # Container para cada jogo
+                with st.container(border=True):
+                    st.write(f"**{jogo.mandante.nome}**")
+                    
+                    if jogo.finalizada:
+                        st.write(f"**{jogo.placar_mandante} x {jogo.placar_visitante}**")
+                        # Destaque ao vencedor
+                        if jogo.placar_mandante > jogo.placar_visitante:
+                            st.success(f"✅ {jogo.mandante.nome} avançou")
+                        elif jogo.placar_visitante > jogo.placar_mandante:
+                            st.success(f"✅ {jogo.visitante.nome} avançou")
+                        else:
+                            st.warning("⚠️ Jogo empatado")
+                    else:
+                        st.write("vs")
+                        st.caption("⏳ Pendente")
+                    
+                    st.write(f"**{jogo.visitante.nome}**")
+                    st.caption(f"📍 {jogo.local}")
+        
+        st.divider()
+
+REGRAS_ESCALACAO = {
+    "titulares_exatos": 11,
+    "reservas_max": 12,
+    "total_max": 23,
+    "goleiro_min_titular": 1,
+}
+
+def validar_escalacao(equipe: Equipe, titulares: list, reservas: list, rotulo: str,
+                      controle: ControleDisciplinar | None = None) -> list:
+    erros = []
+    if len(titulares) != REGRAS_ESCALACAO["titulares_exatos"]:
+        erros.append(f"⚠️ {rotulo}: é obrigatório ter exatamente {REGRAS_ESCALACAO['titulares_exatos']} titulares.")
+    if len(reservas) > REGRAS_ESCALACAO["reservas_max"]:
+        erros.append(f"⚠️ {rotulo}: no máximo {REGRAS_ESCALACAO['reservas_max']} reservas.")
+    if len(titulares) + len(reservas) > REGRAS_ESCALACAO["total_max"]:
+        erros.append(f"⚠️ {rotulo}: total de relacionados não pode passar de {REGRAS_ESCALACAO['total_max']}.")
+    goleiros_titulares = [j for j in titulares if j.posicao == "Goleiro"]
+    if len(goleiros_titulares) < REGRAS_ESCALACAO["goleiro_min_titular"]:
+        erros.append(f"⚠️ {rotulo}: é obrigatório 1 goleiro entre os titulares.")
+    if len(set(j.id for j in titulares + reservas)) != (len(titulares) + len(reservas)):
+        erros.append(f"⚠️ {rotulo}: há jogadores duplicados na escalação.")
+    if controle is not None:
+        for j in titulares + reservas:
+            if controle.suspenso(j.id):
+                erros.append(f"⚠️ {rotulo}: {j.nome} está suspenso ({controle.jogos_suspensao(j.id)} jogo(s) a cumprir).")
+    return erros
+
+def reexecutar_fragmento():
+    """Reexecuta só o fragmento atual. Quando a interação chega numa execução
+    completa (não de fragmento), em que o escopo "fragment" não é aceito,
+    reexecuta o script inteiro."""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+INTERVALO_AO_VIVO_SEG = 3
+
+@st.fragment(run_every=INTERVALO_AO_VIVO_SEG)
+def exibir_jogos_ao_vivo(camp_id: str):
+    """Painel de jogos ao vivo. Só este trecho é reexecutado no intervalo, e a lista
+    só é refeita quando a versão do campeonato no canal de eventos muda."""
+    versao = canal_partidas.versao_campeonato(camp_id)
+    cache = st.session_state.setdefault('ao_vivo_cache', {})
+    if camp_id not in cache or cache[camp_id][0] != versao:
+        cache[camp_id] = (versao, canal_partidas.ao_vivo(camp_id))
+    jogos = cache[camp_id][1]
+    if not jogos:
+        return
+
+    st.subheader("🔴 Ao vivo")
+    cols = st.columns(min(len(jogos), 4))
+    for idx, evento in enumerate(jogos):
+        with cols[idx % len(cols)]:
+            with st.container(border=True):
+                st.write(f"**{evento.mandante}** {evento.placar_mandante} x {evento.placar_visitante} **{evento.visitante}**")
+                st.caption(f"Atualizado às {evento.momento.strftime('%H:%M:%S')}")
+
+def get_motor_rating() -> MotorRating:
+    """Motor de rating da sessão, reconstruído a partir de todas as temporadas na primeira chamada."""
+    if 'motor_rating' not in st.session_state:
+        motor = MotorRating()
+        motor.reconstruir(get_dao().listar_todos())
+        st.session_state.motor_rating = motor
+    return st.session_state.motor_rating
+
+def get_registro_jogadores() -> RegistroJogadores:
+    """Registro global de jogadores da sessão; na primeira chamada unifica os
+    jogadores de todos os campeonatos e grava os que receberam identidade."""
+    if 'registro_jogadores' not in st.session_state:
+        registro = RegistroJogadores()
+        dao = get_dao()
+        with dao.transacao():
+            for c in registro.reconstruir(dao.listar_todos()):
+                dao.salvar(c)
+        st.session_state.registro_jogadores = registro
+    return st.session_state.registro_jogadores
+
+def get_controle_disciplinar(camp_obj: Campeonato) -> ControleDisciplinar:
+    """Livro de suspensões do campeonato na sessão, montado no primeiro acesso."""
+    controles = st.session_state.setdefault('controle_disciplinar', {})
+    if camp_obj.id not in controles:
+        controle = ControleDisciplinar()
+        controle.reconstruir(camp_obj)
+        controles[camp_obj.id] = controle
+    return controles[camp_obj.id]
+
+def get_agenda(camp_obj: Campeonato) -> AgendaJogos:
+    """Agenda (horários por local e por equipe) do campeonato na sessão."""
+    agendas = st.session_state.setdefault('agenda_jogos', {})
+    if camp_obj.id not in agendas:
+        agenda = AgendaJogos()
+        agenda.reconstruir(camp_obj)
+        agendas[camp_obj.id] = agenda
+    return agendas[camp_obj.id]
+
+def get_tabela_resultados(camp_obj: Campeonato):
+    """Resultados do campeonato em colunas, remontados quando a versão dos dados muda."""
+    from models.colunas import TabelaResultados  # NumPy só é carregado por quem consulta as colunas
+    versao = get_dao().versao
+    tabelas = st.session_state.setdefault('tabela_resultados', {})
+    if camp_obj.id not in tabelas or tabelas[camp_obj.id][0] != versao:
+        tabelas[camp_obj.id] = (versao, TabelaResultados(camp_obj))
+    return tabelas[camp_obj.id][1]
+
+def invalidar_indices():
+    """Descarta os índices derivados da sessão; são reconstruídos no próximo uso."""
+    for chave in ('motor_rating', 'registro_jogadores', 'controle_disciplinar', 'agenda_jogos', 'tabela_resultados'):
+        st.session_state.pop(chave, None)
+
+def obter_jogos_com_fase(camp_obj: Campeonato):
+    jogos = []
+    for fase in camp_obj.fases:
+        for jogo in fase.jogos:
+            jogos.append((fase, jogo))
+    return jogos
+
+def buscar_jogo(camp_obj: Campeonato, jogo_id: str) -> Jogo | None:
+    return next((j for f in camp_obj.fases for j in f.jogos if j.id == jogo_id), None)
+
+def is_admin():
+    return st.session_state.get('user_role') == 'admin'
+
+def diretorio_perfis() -> str:
+    return config.get('perfil', {}).get('diretorio', 'data/perfis')
+
+@contextmanager
+def perfilar_execucao():
+    """Perfila a execução inteira do script (DAO, normalização, dashboard, painel
+    ao vivo e página) enquanto houver execuções pedidas pelo admin (no painel
+    da barra lateral ou com ?perfil=N na URL). Entrega as etiquetas da captura,
+    completadas por `etiquetar_perfil` quando a página é escolhida."""
+    if is_admin() and 'perfil' in st.query_params:
+        try:
+            st.session_state.perfil_restantes = max(0, int(st.query_params['perfil']))
+            st.session_state.perfil_memoria = st.query_params.get('memoria') == '1'
+        except ValueError:
+            pass
+        del st.query_params['perfil']
+    etiquetas = {'pagina': "-", 'campeonato': "", 'equipes': 0, 'jogos': 0}
+    restantes = st.session_state.get('perfil_restantes', 0)
+    if not restantes or not is_admin():
+        yield etiquetas
+        return
+    st.session_state.perfil_restantes = restantes - 1
+    with perfil.capturar(diretorio_perfis(),
+                         lambda: f"{etiquetas['pagina']}_{etiquetas['equipes']}eq_{etiquetas['jogos']}j",
+                         etiquetas, st.session_state.get('perfil_memoria', False)):
+        yield etiquetas
+
+def etiquetar_perfil(etiquetas: dict, pagina: str, camp_obj: Campeonato) -> None:
+    etiquetas.update(pagina=pagina, campeonato=camp_obj.nome, equipes=len(camp_obj.equipes_inscritas),
+                     jogos=sum(len(f.jogos) for f in camp_obj.fases))
+
+def exibir_controle_perfil():
+    """Painel do admin para perfilar as próximas execuções e baixar as capturas."""
+    if not is_admin():
+        return
+    with st.sidebar.expander("🔬 Perfil de desempenho"):
+        restantes = st.session_state.get('perfil_restantes', 0)
+        if restantes:
+            st.caption(f"Perfilando: faltam {restantes} execução(ões).")
+        execucoes = st.number_input("Execuções", min_value=1, max_value=20, value=3, key="perfil_execucoes")
+        memoria = st.checkbox("Medir memória (tracemalloc)", key="perfil_tracemalloc")
+        if st.button("Perfilar próximas execuções", key="perfil_iniciar"):
+            st.session_state.perfil_restantes = int(execucoes)
+            st.session_state.perfil_memoria = memoria
+            st.caption(f"As próximas {int(execucoes)} execuções serão perfiladas.")
+
+        capturas = perfil.listar(diretorio_perfis())
+        if not capturas:
+            st.caption("Nenhuma captura.")
+            return
+        captura = st.selectbox(
+            "Capturas",
+            capturas,
+            format_func=lambda c: f"{c['momento'][5:].replace('T', ' ')} {c['pagina']} "
+                                  f"({c['equipes']} eq., {c['jogos']} jogos) {c['duracao']:.2f}s",
+            key="perfil_captura",
+        )
+        for chave, rotulo, tipo in (('prof', "⬇️ .prof", "application/octet-stream"),
+                                    ('resumo', "⬇️ Resumo", "text/plain")):
+            if os.path.exists(captura[chave]):
+                with open(captura[chave], 'rb') as f:
+                    st.download_button(rotulo, f.read(), file_name=os.path.basename(captura[chave]),
+                                       mime=tipo, key=f"perfil_baixar_{chave}")
@@ -0,0 +1,177 @@
+"""Página "Equipes"."""
+import csv
+import io
+
+import streamlit as st
+
+from models.campeonato import Campeonato
+from models.equipe import Equipe
+from paginas.comum import get_dao, is_admin
+
+
+def render(camp: Campeonato):
+    dao = get_dao()
+    st.subheader("⚽ Equipes")
+    
+    if is_admin():
+        tab_listar, tab_criar, tab_upload, tab_editar, tab_remover = st.tabs(["Listar", "Cadastrar", "Upload em massa", "Editar", "Remover"])
+    else:
+        tab_listar = st.tabs(["Listar"])[0]
+
+    with tab_listar:
+        if not camp.equipes_inscritas:
+            st.info("Nenhuma equipe cadastrada.")
+        else:
+            for e in camp.equipes_inscritas:
+                with st.container():
+                    col1, col2, col3 = st.columns([2, 1, 1])
+                    with col1:
+                        st.write(f"### {e.nome}")
+                        st.caption(f"Técnico: {e.tecnico}")
+                    with col2:
+                        st.metric("Pontos", e.pontos)
+                        st.metric("Jogadores", len(e.elenco))
+                    with col3:
+                        st.metric("Vitórias", e.vitorias)
+                        st.metric("Saldo", e.saldo_gols)
+                    st.divider()
+
+    if is_admin():
+        with tab_criar:
+            nome = st.text_input("Nome da equipe", key="eq_nome", max_chars=50)
+            tecnico = st.text_input("Técnico", key="eq_tecnico", max_chars=50)
+            if st.button("Salvar equipe", key="eq_salvar"):
+                # Validações
+                if not nome.strip():
+                    st.error("⚠️ O nome da equipe é obrigatório.")
+                elif len(nome.strip()) < 3:
+                    st.error("⚠️ O nome da equipe deve ter pelo menos 3 caracteres.")
+                elif any(e.nome.lower() == nome.strip().lower() for e in camp.equipes_inscritas):
+                    st.error("⚠️ Já existe uma equipe com este nome.")
+                else:
+                    try:
+                        with dao.transacao(camp):
+                            camp.cadastrar_equipe(Equipe(nome=nome.strip(), tecnico=tecnico.strip() or "Sem técnico"))
+                            dao.salvar(camp)
+                        st.success(f"✅ Equipe '{nome.strip()}' cadastrada com sucesso!")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Erro ao cadastrar equipe: {e}")
+
+        with tab_upload:
+            st.subheader("📥 Upload em massa de equipes (CSV)")
+            st.caption("Colunas: nome (obrigatório), tecnico (opcional). Ex.: nome,tecnico")
+            arquivo = st.file_uploader("Selecione o arquivo CSV", type=["csv"], key="eq_upload_file")
+
+            if arquivo:
+                try:
+                    conteudo = arquivo.getvalue().decode("utf-8")
+                    leitor = csv.DictReader(io.StringIO(conteudo))
+                    linhas = list(leitor)
+
+                    if not linhas:
+                        st.error("⚠️ O arquivo está vazio.")
+                    else:
+                        colunas = [c.strip().lower() for c in (leitor.fieldnames or [])]
+                        if "nome" not in colunas:
+                            st.error("⚠️ Coluna obrigatória ausente: nome")
+                        else:
+                            st.dataframe(linhas, use_container_width=True)
+                            confirma = st.checkbox("Confirmo a importação dessas equipes", key="eq_upload_confirm")
+
+                            if st.button("Importar equipes", disabled=not confirma, key="eq_upload_btn"):
+                                with dao.transacao(camp):
+                                    inseridas = 0
+                                    ignoradas = 0
+                                    erros = []
+
+                                    existentes = {e.nome.strip().lower() for e in camp.equipes_inscritas}
+
+                                    def get_valor(row, chave):
+                                        for k, v in row.items():
+                                            if k.strip().lower() == chave:
+                                                return v
+                                        return ""
+
+                                    for row in linhas:
+                                        nome_row = (get_valor(row, "nome") or "").strip()
+                                        tecnico_row = (get_valor(row, "tecnico") or "").strip() or "Sem técnico"
+
+                                        if not nome_row or len(nome_row) < 3:
+                                            erros.append(f"Nome inválido: '{nome_row}'")
+                                            ignoradas += 1
+                                            continue
+
+                                        if nome_row.lower() in existentes:
+                                            ignoradas += 1
+                                            continue
+
+                                        camp.cadastrar_equipe(Equipe(nome=nome_row, tecnico=tecnico_row))
+                                        existentes.add(nome_row.lower())
+                                        inseridas += 1
+
+                                    dao.salvar(camp)
+                                if inseridas:
+                                    st.success(f"✅ {inseridas} equipes importadas com sucesso!")
+                                if ignoradas:
+                                    st.warning(f"⚠️ {ignoradas} linhas ignoradas (duplicadas ou inválidas).")
+                                if erros:
+                                    st.info("Detalhes das linhas inválidas:")
+                                    for msg in erros[:10]:
+                                        st.write(f"- {msg}")
+                                st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Erro ao ler o CSV: {e}")
+
+        with tab_editar:
+            if not camp.equipes_inscritas:
+                st.info("Nenhuma equipe para editar.")
+            else:
+                equipe_edit = st.selectbox(
+                    "Selecione a equipe",
+                    camp.equipes_inscritas,
+                    format_func=lambda e: e.nome,
+                    key="eq_edit_sel"
+                )
+                novo_nome = st.text_input("Novo nome", value=equipe_edit.nome, key="eq_edit_nome")
+                novo_tecnico = st.text_input("Novo técnico", value=equipe_edit.tecnico, key="eq_edit_tecnico")
+                
+                if st.button("Salvar alterações", key="eq_edit_salvar"):
+                    if not novo_nome.strip():
+                        st.error("⚠️ O nome é obrigatório.")
+                    else:
+                        try:
+                            with dao.transacao(camp):
+                                equipe_edit.nome = novo_nome.strip()
+                                equipe_edit.tecnico = novo_tecnico.strip()
+                                dao.salvar(camp)
+                            st.success("✅ Equipe atualizada com sucesso!")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Erro: {e}")
+
+        with tab_remover:
+            if not camp.equipes_inscritas:
+                st.info("Nenhuma equipe para remover.")
+            else:
+                equipe_rem = st.selectbox(
+                    "Selecione a equipe",
+                    camp.equipes_inscritas,
+                    format_func=lambda e: e.nome,
+                    key="eq_rem_sel"
+                )
+                
+                st.warning(f"⚠️ Tem certeza que deseja remover **{equipe_rem.nome}**?")
+                st.info(f"Esta equipe tem {len(equipe_rem.elenco)} jogadores")
+                
+                confirma = st.checkbox("Sim, remover esta equipe", key="eq_rem_confirm")
+                
+                if st.button("🗑️ Remover Equipe", key="eq_rem_btn", disabled=not confirma, type="primary"):
+                    try:
+                        with dao.transacao(camp):
+                            camp.remover_equipe(equipe_rem.id)
+                            dao.salvar(camp)
+                        st.success(f"✅ Equipe '{equipe_rem.nome}' removida!")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Erro: {e}")
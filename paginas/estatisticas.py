@@ -0,0 +1,363 @@
+"""Página "Estatísticas"."""
+from datetime import date
+
+import numpy as np
+import streamlit as st
+import plotly.graph_objects as go
+
+from models.campeonato import Campeonato
+from paginas.comum import (
+    get_camp_tipo,
+    exibir_bracket_mmata_mata,
+    get_motor_rating,
+    get_tabela_resultados,
+    obter_jogos_com_fase,
+)
+
+
+def exibir_analises(camp: Campeonato):
+    """Recortes por fase, minuto dos gols, mando de campo e confrontos diretos."""
+    tabela = get_tabela_resultados(camp)
+    if not tabela.jogos:
+        st.info("Nenhuma partida finalizada.")
+        return
+
+    st.subheader("🏠 Vantagem de jogar em casa")
+    mando = tabela.vantagem_mando()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Vitórias do mandante", f"{mando['vitorias_mandante']:.0%}")
+    with col2:
+        st.metric("Empates", f"{mando['empates']:.0%}")
+    with col3:
+        st.metric("Vitórias do visitante", f"{mando['vitorias_visitante']:.0%}")
+    with col4:
+        st.metric("Gols/jogo (casa x fora)", f"{mando['gols_mandante']:.2f} x {mando['gols_visitante']:.2f}")
+    st.caption(f"Pontos por jogo: {mando['pontos_mandante']:.2f} em casa, {mando['pontos_visitante']:.2f} fora.")
+
+    st.subheader("📋 Por fase")
+    fases = tabela.por_fase()
+    st.dataframe(
+        [
+            {
+                "Fase": nome,
+                "Jogos": int(fases['jogos'][i]),
+                "Gols": int(fases['gols'][i]),
+                "Média Gols/Jogo": round(float(fases['media_gols'][i]), 2),
+                "Mandante venceu": int(fases['vitorias_mandante'][i]),
+                "Empates": int(fases['empates'][i]),
+                "Visitante venceu": int(fases['vitorias_visitante'][i]),
+            }
+            for i, nome in enumerate(tabela.fases) if fases['jogos'][i]
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    st.subheader("⏱️ Gols por minuto")
+    minutos = tabela.gols_por_minuto()
+    if minutos['gols'].sum():
+        fig = go.Figure(data=[go.Bar(x=minutos['faixas'], y=minutos['gols'], marker_color='steelblue')])
+        fig.update_layout(xaxis_title="Minuto", yaxis_title="Gols")
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("Nenhum gol com minuto registrado.")
+
+    st.subheader("⚔️ Confrontos diretos")
+    st.caption("Pontos da equipe da linha contra a da coluna; a dica mostra o saldo de gols.")
+    confrontos = tabela.confrontos()
+    jogaram = confrontos['jogos'] > 0
+    nomes = [e.nome for e in tabela.equipes]
+    fig = go.Figure(data=go.Heatmap(
+        z=np.where(jogaram, confrontos['pontos'], np.nan),
+        x=nomes,
+        y=nomes,
+        customdata=confrontos['saldo'],
+        hovertemplate="%{y} x %{x}<br>Pontos: %{z}<br>Saldo: %{customdata}<extra></extra>",
+        colorscale='RdYlGn',
+    ))
+    fig.update_layout(yaxis_autorange='reversed', height=max(400, 20 * len(nomes)))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render(camp: Campeonato):
+    st.subheader("📈 Estatísticas do Campeonato")
+    
+    if not camp.equipes_inscritas:
+        st.info("Nenhum dado disponível.")
+    else:
+        # Ajustar abas se for mata-mata
+        if get_camp_tipo(camp) == "Mata-mata":
+            tab1, tab2, tab_analises = st.tabs(["Geral", "Calendário", "Análises"])
+        else:
+            tab1, tab2, tab3, tab4, tab5, tab6, tab_analises = st.tabs(
+                ["Geral", "Ataque", "Defesa", "Desempenho", "Calendário", "Forma", "Análises"])
+        tabela = get_tabela_resultados(camp)
+        totais = tabela.totais_por_equipe()
+        equipes = tabela.equipes
+
+        with tab_analises:
+            exibir_analises(camp)
+        
+        with tab1:
+            col1, col2, col3, col4 = st.columns(4)
+            total_jogos = sum(len(f.jogos) for f in camp.fases)
+            jogos_finalizados = tabela.jogos
+            total_gols = int(totais['gols_pro'].sum())
+            
+            with col1:
+                st.metric("Total de Jogos", total_jogos)
+            with col2:
+                st.metric("Jogos Finalizados", jogos_finalizados)
+            with col3:
+                st.metric("Gols Marcados", total_gols)
+            with col4:
+                media_gols = round(total_gols / jogos_finalizados, 2) if jogos_finalizados > 0 else 0
+                st.metric("Média Gols/Jogo", media_gols)
+
+            st.subheader("📐 Rating Elo")
+            motor = get_motor_rating()
+            ratings = sorted(camp.equipes_inscritas, key=motor.elo, reverse=True)
+            st.dataframe(
+                [
+                    {
+                        "Equipe": e.nome,
+                        "Elo": round(motor.elo(e)),
+                        "Ataque": round(motor.forca_poisson(e)[0], 2),
+                        "Defesa": round(motor.forca_poisson(e)[1], 2),
+                    }
+                    for e in ratings
+                ],
+                use_container_width=True,
+                hide_index=True,
+            )
+            fig = go.Figure()
+            for e in ratings[:10]:
+                historico = motor.historico(e)
+                if historico:
+                    fig.add_trace(go.Scatter(
+                        name=e.nome,
+                        x=[d for d, _ in historico],
+                        y=[r for _, r in historico],
+                        mode='lines+markers'
+                    ))
+            if fig.data:
+                fig.update_layout(title="Evolução do Elo", xaxis_title="Data", yaxis_title="Elo")
+                st.plotly_chart(fig, use_container_width=True)
+        
+        if get_camp_tipo(camp) != "Mata-mata":
+            with tab2:
+                st.subheader("Melhores Ataques")
+                ataque = np.argsort(-totais['gols_pro'], kind='stable')[:5]
+                for i, k in enumerate(ataque, 1):
+                    st.write(f"{i}. **{equipes[k].nome}** - {totais['gols_pro'][k]} gols")
+                
+                # Gráfico
+                fig = go.Figure(data=[
+                    go.Bar(x=[equipes[k].nome for k in ataque], y=totais['gols_pro'][ataque],
+                           marker_color='lightgreen')
+                ])
+                fig.update_layout(title="Top 5 - Gols Marcados", xaxis_title="Equipe", yaxis_title="Gols")
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with tab3:
+                st.subheader("Melhores Defesas")
+                defesa = np.argsort(totais['gols_contra'], kind='stable')[:5]
+                for i, k in enumerate(defesa, 1):
+                    st.write(f"{i}. **{equipes[k].nome}** - {totais['gols_contra'][k]} gols sofridos")
+                
+                # Gráfico
+                fig = go.Figure(data=[
+                    go.Bar(x=[equipes[k].nome for k in defesa], y=totais['gols_contra'][defesa],
+                           marker_color='lightcoral')
+                ])
+                fig.update_layout(title="Top 5 - Menos Gols Sofridos", xaxis_title="Equipe", yaxis_title="Gols Sofridos")
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with tab4:
+                st.subheader("Comparação Gols Marcados vs Sofridos")
+                fig = go.Figure()
+                nomes_graf = [e.nome for e in equipes[:10]]  # Top 10
+                
+                fig.add_trace(go.Bar(
+                    name='Gols Marcados',
+                    x=nomes_graf,
+                    y=totais['gols_pro'][:10],
+                    marker_color='green'
+                ))
+                fig.add_trace(go.Bar(
+                    name='Gols Sofridos',
+                    x=nomes_graf,
+                    y=totais['gols_contra'][:10],
+                    marker_color='red'
+                ))
+                
+                fig.update_layout(barmode='group', xaxis_title="Equipe", yaxis_title="Gols")
+                st.plotly_chart(fig, use_container_width=True)
+
+            with tab6:
+                st.subheader("Forma recente")
+                st.caption("Últimos 5 resultados (do mais antigo ao mais recente), sequências atuais e campanha em casa e fora.")
+                linhas = []
+                for e in camp.obter_classificacao():
+                    forma = camp.forma(e)
+                    casa, fora = forma.como_mandante, forma.como_visitante
+                    linhas.append({
+                        "Equipe": e.nome,
+                        "Últimos 5": " ".join(forma.ultimos_resultados()),
+                        "Vitórias seguidas": forma.sequencia_vitorias,
+                        "Invicto há": forma.sequencia_invicta,
+                        "Casa (V-E-D)": f"{casa['V']}-{casa['E']}-{casa['D']}",
+                        "Gols em casa": f"{casa['gols_pro']}:{casa['gols_contra']}",
+                        "Fora (V-E-D)": f"{fora['V']}-{fora['E']}-{fora['D']}",
+                        "Gols fora": f"{fora['gols_pro']}:{fora['gols_contra']}",
+                    })
+                st.dataframe(linhas, use_container_width=True, hide_index=True)
+        
+        if get_camp_tipo(camp) == "Mata-mata":
+            with tab2:
+                st.subheader("📅 Calendário de Eliminatória")
+
+                jogos_com_fase = obter_jogos_com_fase(camp)
+                if not jogos_com_fase:
+                    st.info("Nenhuma partida criada.")
+                else:
+                    datas = [j.data.date() for _, j in jogos_com_fase]
+                    data_min = min(datas) if datas else date.today()
+                    data_max = max(datas) if datas else date.today()
+
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        fases_disponiveis = ["Todas"] + [f.nome for f in camp.fases]
+                        fase_filtro = st.selectbox("Fase", fases_disponiveis, key="cal_mm_fase")
+                    with col2:
+                        status_filtro = st.selectbox("Status", ["Todos", "Finalizadas", "Pendentes", "Ao vivo", "Canceladas"], key="cal_mm_status")
+                    with col3:
+                        equipe_filtro = st.selectbox(
+                            "Equipe",
+                            ["Todas"] + camp.equipes_inscritas,
+                            format_func=lambda e: e if isinstance(e, str) else e.nome,
+                            key="cal_mm_equipe"
+                        )
+                    with col4:
+                        periodo = st.date_input("Período", value=(data_min, data_max), key="cal_mm_periodo")
+
+                    if isinstance(periodo, date):
+                        data_ini, data_fim = periodo, periodo
+                    else:
+                        data_ini, data_fim = periodo
+
+                    jogos_filtrados = []
+                    for fase, jogo in jogos_com_fase:
+                        if fase_filtro != "Todas" and fase.nome != fase_filtro:
+                            continue
+                        if status_filtro == "Finalizadas" and not jogo.finalizada:
+                            continue
+                        if status_filtro == "Pendentes" and jogo.finalizada:
+                            continue
+                        if status_filtro == "Ao vivo" and jogo.status != "Ao vivo":
+                            continue
+                        if status_filtro == "Canceladas" and jogo.status != "Cancelada":
+                            continue
+                        if equipe_filtro != "Todas" and jogo.mandante.id != equipe_filtro.id and jogo.visitante.id != equipe_filtro.id:
+                            continue
+                        data_jogo = jogo.data.date()
+                        if data_jogo < data_ini or data_jogo > data_fim:
+                            continue
+                        jogos_filtrados.append((fase, jogo))
+
+                    if not jogos_filtrados:
+                        st.info("Nenhuma partida encontrada com os filtros selecionados.")
+                    else:
+                        for fase, jogo in sorted(jogos_filtrados, key=lambda x: x[1].data):
+                            with st.container():
+                                col1, col2, col3 = st.columns([2, 1, 2])
+                                with col1:
+                                    st.markdown(f"### {jogo.mandante.nome}")
+                                with col2:
+                                    if jogo.finalizada:
+                                        st.markdown(f"### **{jogo.placar_mandante} x {jogo.placar_visitante}**")
+                                        st.caption("✅ Finalizada")
+                                    else:
+                                        st.markdown("### **vs**")
+                                        st.caption("⏳ Pendente")
+                                with col3:
+                                    st.markdown(f"### {jogo.visitante.nome}")
+                                st.caption(f"📍 {jogo.local} | 📆 {jogo.data.strftime('%d/%m/%Y')}")
+                                st.caption(f"🏟️ Fase: {fase.nome}")
+                                st.divider()
+
+                st.subheader("🔰 Chaveamento")
+                exibir_bracket_mmata_mata(camp)
+        else:
+            with tab5:
+                st.subheader("📅 Calendário de Jogos")
+
+                jogos_com_fase = obter_jogos_com_fase(camp)
+                if not jogos_com_fase:
+                    st.info("Nenhuma partida criada.")
+                else:
+                    datas = [j.data.date() for _, j in jogos_com_fase]
+                    data_min = min(datas) if datas else date.today()
+                    data_max = max(datas) if datas else date.today()
+
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        fases_disponiveis = ["Todas"] + [f.nome for f in camp.fases]
+                        fase_filtro = st.selectbox("Fase", fases_disponiveis, key="cal_fase")
+                    with col2:
+                        status_filtro = st.selectbox("Status", ["Todos", "Finalizadas", "Pendentes", "Ao vivo", "Canceladas"], key="cal_status")
+                    with col3:
+                        equipe_filtro = st.selectbox(
+                            "Equipe",
+                            ["Todas"] + camp.equipes_inscritas,
+                            format_func=lambda e: e if isinstance(e, str) else e.nome,
+                            key="cal_equipe"
+                        )
+                    with col4:
+                        periodo = st.date_input("Período", value=(data_min, data_max), key="cal_periodo")
+
+                    if isinstance(periodo, date):
+                        data_ini, data_fim = periodo, periodo
+                    else:
+                        data_ini, data_fim = periodo
+
+                    jogos_filtrados = []
+                    for fase, jogo in jogos_com_fase:
+                        if fase_filtro != "Todas" and fase.nome != fase_filtro:
+                            continue
+                        if status_filtro == "Finalizadas" and not jogo.finalizada:
+                            continue
+                        if status_filtro == "Pendentes" and jogo.finalizada:
+                            continue
+                        if status_filtro == "Ao vivo" and jogo.status != "Ao vivo":
+                            continue
+                        if status_filtro == "Canceladas" and jogo.status != "Cancelada":
+                            continue
+                        if equipe_filtro != "Todas" and jogo.mandante.id != equipe_filtro.id and jogo.visitante.id != equipe_filtro.id:
+                            continue
+                        data_jogo = jogo.data.date()
+                        if data_jogo < data_ini or data_jogo > data_fim:
+                            continue
+                        jogos_filtrados.append((fase, jogo))
+
+                    if not jogos_filtrados:
+                        st.info("Nenhuma partida encontrada com os filtros selecionados.")
+                    else:
+                        for fase, jogo in sorted(jogos_filtrados, key=lambda x: x[1].data):
+                            with st.container():
+                                col1, col2, col3 = st.columns([2, 1, 2])
+                                with col1:
+                                    st.markdown(f"### {jogo.mandante.nome}")
+                                with col2:
+                                    if jogo.finalizada:
+                                        st.markdown(f"### **{jogo.placar_mandante} x {jogo.placar_visitante}**")
+                                        st.caption("✅ Finalizada")
+                                    else:
+                                        st.markdown("### **vs**")
+                                        st.caption("⏳ Pendente")
+                                with col3:
+                                    st.markdown(f"### {jogo.visitante.nome}")
+                                st.caption(f"📍 {jogo.local} | 📆 {jogo.data.strftime('%d/%m/%Y')}")
+                                st.caption(f"🏟️ Fase: {fase.nome}")
+                                st.divider()
@@ -0,0 +1,235 @@
+"""Página "Fases/Grupos"."""
+from datetime import datetime
+
+import streamlit as st
+
+from models.calendario import OtimizadorTabela, datas_rodadas, rodizio_duplo
+from models.campeonato import Campeonato, Fase
+from models.suico import TIPO_SUICO, PareamentoSuico
+from paginas.comum import get_dao, get_camp_tipo, get_agenda
+from utils.exceptions import AppError, PareamentoImpossivel
+
+TIPOS_FASE = ["Corridos", "Mata-mata", TIPO_SUICO]
+BADGES_FASE = {"Corridos": "📊 Corridos", "Mata-mata": "⚔️ Mata-Mata", TIPO_SUICO: "♟️ Suíço"}
+
+
+def gerar_rodada_suica(camp: Campeonato):
+    """Pareia a próxima rodada suíça e a adiciona como fase."""
+    dao = get_dao()
+    col1, col2 = st.columns(2)
+    with col1:
+        data_rodada = st.date_input("Data da rodada", value=datetime.now(), key="suico_data")
+    with col2:
+        hora_rodada = st.time_input("Primeiro horário", value=datetime.now().time().replace(second=0, microsecond=0),
+                                    key="suico_hora")
+    locais = st.text_area("Locais/Quadras (um por linha)", value="Quadra 1", key="suico_locais")
+    locais = [l.strip() for l in locais.splitlines() if l.strip()]
+    ignorar_conflitos = st.checkbox("Gerar mesmo com conflitos de agenda", key="suico_ignorar")
+    permitir_revanche = st.checkbox("Permitir revanche se não houver pareamento inédito", key="suico_revanche",
+                                    help=f"Sem revanches, {len(camp.equipes_inscritas)} equipes comportam no máximo "
+                                         f"{len(camp.equipes_inscritas) - 1 + len(camp.equipes_inscritas) % 2} rodadas, "
+                                         "e as últimas podem já não ter pareamento inédito.")
+
+    if st.button("♟️ Gerar próxima rodada", key="suico_gerar", type="primary"):
+        if len(camp.equipes_inscritas) < 2:
+            st.error("⚠️ Cadastre pelo menos duas equipes.")
+            return
+        if not locais:
+            st.error("⚠️ Informe ao menos um local.")
+            return
+        try:
+            fase, folga = PareamentoSuico(camp).gerar_rodada(datetime.combine(data_rodada, hora_rodada), locais,
+                                                             permitir_revanche=permitir_revanche)
+        except PareamentoImpossivel as e:
+            st.error(f"⚠️ {e} Marque \"Permitir revanche\" para gerar a rodada mesmo assim.")
+            return
+        except AppError as e:
+            st.error(f"⚠️ {e}")
+            return
+        conflitos = get_agenda(camp).conflitos_de(fase.jogos)
+        if conflitos and not ignorar_conflitos:
+            for c in conflitos[:10]:
+                st.error(f"⚠️ Agenda: {c.descricao()}")
+            if len(conflitos) > 10:
+                st.error(f"⚠️ ... e mais {len(conflitos) - 10} conflito(s).")
+            return
+        try:
+            with dao.transacao(camp):
+                camp.adicionar_fase(fase)
+                dao.salvar(camp)
+        except Exception as e:
+            st.error(f"❌ Erro ao gerar rodada: {e}")
+            return
+        for jogo in fase.jogos:
+            get_agenda(camp).adicionar(jogo)
+        st.success(f"✅ {fase.nome} gerada com {len(fase.jogos)} jogo(s)."
+                   + (f" Folga: {folga.nome}." if folga else ""))
+        st.rerun()
+
+
+def ler_datas(texto: str) -> list:
+    """Datas no formato dd/mm/aaaa separadas por vírgula."""
+    return [datetime.strptime(d.strip(), "%d/%m/%Y").date() for d in texto.split(",") if d.strip()]
+
+
+def gerar_tabela_turno_returno(camp: Campeonato):
+    """Gera e otimiza a tabela de turno e returno do campeonato."""
+    dao = get_dao()
+    if any(f.jogos for f in camp.fases):
+        st.info("O campeonato já tem jogos; a tabela só pode ser gerada em um campeonato sem partidas.")
+        return
+    if len(camp.equipes_inscritas) < 3:
+        st.info("Cadastre pelo menos três equipes para gerar a tabela.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        inicio = st.date_input("Primeira rodada", value=datetime.now(), key="tabela_inicio")
+    with col2:
+        intervalo = st.number_input("Dias entre rodadas", min_value=1, max_value=30, value=7, key="tabela_intervalo")
+    with col3:
+        horario = st.time_input("Horário", value=datetime.now().time().replace(hour=16, minute=0, second=0, microsecond=0),
+                                key="tabela_horario")
+    bloqueadas = st.text_input("Datas sem rodada (dd/mm/aaaa, separadas por vírgula)", key="tabela_bloqueadas")
+    st.caption("Equipes com o mesmo estádio não jogam em casa na mesma rodada; "
+               "datas bloqueadas da equipe são datas em que seu estádio não está disponível.")
+    equipes = st.data_editor(
+        [{"Equipe": e.nome, "Estádio": f"Estádio {e.nome}", "Datas bloqueadas": ""} for e in camp.equipes_inscritas],
+        disabled=["Equipe"],
+        hide_index=True,
+        use_container_width=True,
+        key="tabela_equipes",
+    )
+    iteracoes = st.number_input("Iterações da otimização", min_value=0, max_value=200000, value=20000, step=5000,
+                                key="tabela_iteracoes")
+    ignorar_conflitos = st.checkbox("Gerar mesmo com conflitos de agenda", key="tabela_ignorar")
+
+    if st.button("📅 Gerar tabela", key="tabela_gerar", type="primary"):
+        try:
+            datas = datas_rodadas(inicio, len(rodizio_duplo(len(camp.equipes_inscritas))), int(intervalo),
+                                  ler_datas(bloqueadas))
+            estadios, bloqueios = {}, {}
+            for equipe, linha in zip(camp.equipes_inscritas, equipes):
+                estadios[equipe.id] = linha["Estádio"].strip()
+                bloqueios[equipe.id] = ler_datas(linha["Datas bloqueadas"] or "")
+        except ValueError:
+            st.error("⚠️ Use datas no formato dd/mm/aaaa.")
+            return
+        otimizador = OtimizadorTabela(camp.equipes_inscritas, datas, estadios, bloqueios)
+        custo_inicial = otimizador.custo()
+        custo = otimizador.otimizar(int(iteracoes))
+        fases = otimizador.escrever(horario)
+        conflitos = get_agenda(camp).conflitos_de(j for f in fases for j in f.jogos)
+        if conflitos and not ignorar_conflitos:
+            for c in conflitos[:10]:
+                st.error(f"⚠️ Agenda: {c.descricao()}")
+            if len(conflitos) > 10:
+                st.error(f"⚠️ ... e mais {len(conflitos) - 10} conflito(s).")
+            return
+        try:
+            with dao.transacao(camp):
+                for fase in fases:
+                    camp.adicionar_fase(fase)
+                dao.salvar(camp)
+        except Exception as e:
+            st.error(f"❌ Erro ao gerar tabela: {e}")
+            return
+        for fase in fases:
+            for jogo in fase.jogos:
+                get_agenda(camp).adicionar(jogo)
+        st.success(f"✅ Tabela gerada: {len(fases)} rodadas até {datas[-1]:%d/%m/%Y}, "
+                   f"{otimizador.quebras()} quebra(s) de mando, custo {custo_inicial} → {custo}.")
+
+
+def render(camp: Campeonato):
+    dao = get_dao()
+    st.subheader("📋 Gerenciar Fases e Grupos")
+    
+    if not camp.fases:
+        st.info("Nenhuma fase criada ainda.")
+    
+    if get_camp_tipo(camp) == TIPO_SUICO:
+        tab_listar, tab_criar, tab_editar, tab_suico = st.tabs(["Listar", "Criar Fase", "Editar", "Rodada Suíça"])
+        with tab_suico:
+            gerar_rodada_suica(camp)
+    elif get_camp_tipo(camp) == "Pontos corridos":
+        tab_listar, tab_criar, tab_editar, tab_tabela = st.tabs(["Listar", "Criar Fase", "Editar", "Gerar Tabela"])
+        with tab_tabela:
+            gerar_tabela_turno_returno(camp)
+    else:
+        tab_listar, tab_criar, tab_editar = st.tabs(["Listar", "Criar Fase", "Editar"])
+    
+    with tab_listar:
+        if not camp.fases:
+            st.info("Nenhuma fase cadastrada.")
+        else:
+            for fase in camp.fases:
+                with st.container():
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        tipo_badge = BADGES_FASE.get(fase.tipo, fase.tipo)
+                        st.write(f"### {fase.nome}")
+                        st.caption(tipo_badge)
+                    with col2:
+                        if fase.grupo:
+                            st.metric("Grupo", fase.grupo)
+                        st.metric("Ordem", fase.ordem)
+                    with col3:
+                        st.metric("Jogos", len(fase.jogos))
+                    st.divider()
+    
+    with tab_criar:
+        nome_fase = st.text_input("Nome da Fase", key="fase_nome", max_chars=50, placeholder="Ex: Primeira Rodada")
+        ordem = st.number_input("Ordem", min_value=1, step=1, key="fase_ordem")
+        tipo_fase = st.selectbox("Tipo", TIPOS_FASE, key="fase_tipo")
+        usar_grupo = st.checkbox("Usar grupos?", key="usar_grupo")
+        grupo_fase = ""
+        
+        if usar_grupo:
+            grupo_fase = st.text_input("Letra do Grupo", key="grupo_letra", max_chars=1, placeholder="A").upper()
+        
+        if st.button("Criar Fase", key="criar_fase"):
+            if not nome_fase.strip():
+                st.error("⚠️ Informe o nome da fase.")
+            elif usar_grupo and (not grupo_fase or grupo_fase not in "ABCDEFGH"):
+                st.error("⚠️ Informe uma letra de A a H para o grupo.")
+            else:
+                try:
+                    with dao.transacao(camp):
+                        nova_fase = Fase(nome=nome_fase.strip(), ordem=int(ordem), tipo=tipo_fase, grupo=grupo_fase)
+                        camp.adicionar_fase(nova_fase)
+                        dao.salvar(camp)
+                    st.success(f"✅ Fase '{nome_fase.strip()}' criada!")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Erro: {e}")
+    
+    with tab_editar:
+        if not camp.fases:
+            st.info("Nenhuma fase para editar.")
+        else:
+            fase_edit = st.selectbox(
+                "Selecione a fase",
+                camp.fases,
+                format_func=lambda f: f.nome,
+                key="fase_edit_sel"
+            )
+            
+            novo_nome = st.text_input("Novo nome", value=fase_edit.nome, key="fase_edit_nome")
+            novo_tipo = st.selectbox("Tipo", TIPOS_FASE,
+                                    index=TIPOS_FASE.index(fase_edit.tipo) if fase_edit.tipo in TIPOS_FASE else 0,
+                                    key="fase_edit_tipo")
+            
+            if st.button("Salvar alterações", key="fase_edit_salvar"):
+                if not novo_nome.strip():
+                    st.error("⚠️ O nome é obrigatório.")
+                else:
+                    try:
+                        with dao.transacao(camp):
+                            fase_edit.nome = novo_nome.strip()
+                            fase_edit.tipo = novo_tipo
+                            dao.salvar(camp)
+                        st.success("✅ Fase atualizada!")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Erro: {e}")
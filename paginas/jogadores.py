@@ -0,0 +1,146 @@
+"""Página "Jogadores"."""
+import streamlit as st
+
+from models.campeonato import Campeonato
+from models.jogador import Jogador
+from paginas.comum import get_dao, get_registro_jogadores, is_admin
+
+
+def render(camp: Campeonato):
+    dao = get_dao()
+    st.subheader("👥 Jogadores")
+    if not camp.equipes_inscritas:
+        st.info("Cadastre uma equipe antes de adicionar jogadores.")
+    else:
+        if is_admin():
+            tab_listar, tab_criar, tab_editar, tab_remover = st.tabs(["Listar", "Cadastrar", "Editar", "Remover"])
+        else:
+            tab_listar = st.tabs(["Listar"])[0]
+
+        with tab_listar:
+            equipe_sel = st.selectbox(
+                "Selecione a equipe",
+                camp.equipes_inscritas,
+                format_func=lambda e: e.nome,
+                key="jog_list_eq",
+            )
+            if equipe_sel.elenco:
+                linhas = []
+                for j in equipe_sel.elenco:
+                    est = camp.estatisticas_jogador(j.id)
+                    linhas.append({
+                        "Nº": j.numero,
+                        "Jogador": j.nome,
+                        "Posição": j.posicao,
+                        "Jogos": est['jogos'],
+                        "Titular": est['titular'],
+                        "Reserva": est['reserva'],
+                        "Gols": est['gols'],
+                        "Gols/Jogo": est['gols_por_jogo'],
+                    })
+                st.dataframe(linhas, use_container_width=True, hide_index=True)
+            else:
+                st.info("Equipe sem jogadores.")
+
+        if is_admin():
+            with tab_criar:
+                equipe_sel = st.selectbox(
+                    "Equipe",
+                    camp.equipes_inscritas,
+                    format_func=lambda e: e.nome,
+                    key="jog_add_eq",
+                )
+                nome = st.text_input("Nome do jogador", key="jog_nome", max_chars=50)
+                numero = st.number_input("Número", min_value=1, max_value=99, step=1, key="jog_num")
+                posicao = st.selectbox("Posição", ["Goleiro", "Zagueiro", "Lateral", "Volante", "Meia", "Atacante"], key="jog_pos")
+                if st.button("Salvar jogador", key="jog_salvar"):
+                    # Validações
+                    if not nome.strip():
+                        st.error("⚠️ O nome do jogador é obrigatório.")
+                    elif len(nome.strip()) < 3:
+                        st.error("⚠️ O nome deve ter pelo menos 3 caracteres.")
+                    elif any(j.numero == numero for j in equipe_sel.elenco):
+                        st.error(f"⚠️ O número {numero} já está sendo usado nesta equipe.")
+                    else:
+                        try:
+                            with dao.transacao(camp):
+                                # Encontra a equipe correta no campeonato
+                                for equipe in camp.equipes_inscritas:
+                                    if equipe.id == equipe_sel.id:
+                                        novo_jogador = Jogador(nome=nome.strip(), numero=int(numero), posicao=posicao)
+                                        get_registro_jogadores().adicionar_jogador(camp, equipe.nome, novo_jogador)
+                                        equipe.contratar_jogador(novo_jogador)
+                                        break
+                                dao.salvar(camp)
+                            st.success(f"✅ Jogador '{nome.strip()}' cadastrado com sucesso!")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Erro ao cadastrar jogador: {e}")
+
+            with tab_editar:
+                equipe_edit = st.selectbox(
+                    "Selecione a equipe",
+                    [e for e in camp.equipes_inscritas if e.elenco],
+                    format_func=lambda e: e.nome,
+                    key="jog_edit_eq"
+                )
+                if equipe_edit and equipe_edit.elenco:
+                    jogador_edit = st.selectbox(
+                        "Selecione o jogador",
+                        equipe_edit.elenco,
+                        format_func=lambda j: f"{j.nome} (#{j.numero})",
+                        key="jog_edit_sel"
+                    )
+                    novo_nome = st.text_input("Novo nome", value=jogador_edit.nome, key="jog_edit_nome")
+                    novo_numero = st.number_input("Novo número", value=jogador_edit.numero, min_value=1, max_value=99, key="jog_edit_num")
+                    nova_posicao = st.selectbox("Nova posição", ["Goleiro", "Zagueiro", "Lateral", "Volante", "Meia", "Atacante"], 
+                                               index=["Goleiro", "Zagueiro", "Lateral", "Volante", "Meia", "Atacante"].index(jogador_edit.posicao),
+                                               key="jog_edit_pos")
+                    
+                    if st.button("Salvar alterações", key="jog_edit_salvar"):
+                        if not novo_nome.strip():
+                            st.error("⚠️ O nome é obrigatório.")
+                        else:
+                            try:
+                                with dao.transacao(camp):
+                                    jogador_edit.nome = novo_nome.strip()
+                                    jogador_edit.numero = int(novo_numero)
+                                    jogador_edit.posicao = nova_posicao
+                                    dao.salvar(camp)
+                                st.success("✅ Jogador atualizado com sucesso!")
+                                st.rerun()
+                            except Exception as e:
+                                st.error(f"❌ Erro: {e}")
+                else:
+                    st.info("Nenhuma equipe com jogadores.")
+
+            with tab_remover:
+                equipes_com_jogadores = [e for e in camp.equipes_inscritas if e.elenco]
+                if not equipes_com_jogadores:
+                    st.info("Nenhuma equipe com jogadores.")
+                else:
+                    equipe_rem = st.selectbox(
+                        "Selecione a equipe",
+                        equipes_com_jogadores,
+                        format_func=lambda e: e.nome,
+                        key="jog_rem_eq"
+                    )
+                    jogador_rem = st.selectbox(
+                        "Selecione o jogador",
+                        equipe_rem.elenco,
+                        format_func=lambda j: f"{j.nome} (#{j.numero})",
+                        key="jog_rem_sel"
+                    )
+
+                    st.warning(f"⚠️ Tem certeza que deseja remover **{jogador_rem.nome}**?")
+                    confirma = st.checkbox("Sim, remover este jogador", key="jog_rem_confirm")
+
+                    if st.button("🗑️ Remover Jogador", key="jog_rem_btn", disabled=not confirma, type="primary"):
+                        try:
+                            with dao.transacao(camp):
+                                equipe_rem.remover_jogador(jogador_rem.id)
+                                dao.salvar(camp)
+                            st.success(f"✅ Jogador '{jogador_rem.nome}' removido!")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Erro: {e}")
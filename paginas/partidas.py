@@ -0,0 +1,592 @@
+"""Página "Gerenciar Partidas"."""
+from datetime import datetime
+
+import streamlit as st
+
+from models.campeonato import Campeonato, Fase
+from models.partida import Jogo, Escalacao
+from services.eventos import canal_partidas
+from paginas.comum import (
+    get_dao,
+    get_camp_tipo,
+    REGRAS_ESCALACAO,
+    validar_escalacao,
+    get_motor_rating,
+    get_registro_jogadores,
+    get_controle_disciplinar,
+    get_agenda,
+    buscar_jogo,
+    reexecutar_fragmento,
+)
+
+
+def pendente(jogo: Jogo) -> bool:
+    return not jogo.finalizada and jogo.status != "Cancelada"
+
+def atualizar_indices(camp: Campeonato, jogo: Jogo):
+    """Repassa aos índices o novo estado do jogo (finalizado, corrigido, reaberto ou cancelado)."""
+    get_motor_rating().registrar_partida(jogo)
+    registro = get_registro_jogadores()
+    if jogo.finalizada:
+        registro.registrar_partida(camp, jogo)
+    else:
+        registro.remover_partida(camp, jogo)
+    get_controle_disciplinar(camp).registrar_partida(camp, jogo)
+    get_agenda(camp).atualizar(jogo)
+    canal_partidas.publicar("status", camp.id, jogo)
+
+# Formulários de partida como fragmentos: cada interação reexecuta apenas o
+# próprio trecho, sem recarregar o dashboard nem o restante da página.
+
+@st.fragment
+def formulario_criar_jogo(camp_id: str):
+    """Criação de jogo com seleção das escalações."""
+    dao = get_dao()
+    camp = dao.buscar_por_id(camp_id)
+    if camp is None:
+        return
+    col1, col2 = st.columns(2)
+    with col1:
+        mandante = st.selectbox(
+            "Mandante",
+            camp.equipes_inscritas,
+            format_func=lambda x: x.nome,
+            key="jogo_mandante",
+        )
+    with col2:
+        visitante = st.selectbox(
+            "Visitante",
+            camp.equipes_inscritas,
+            format_func=lambda x: x.nome,
+            key="jogo_visitante",
+        )
+
+    # Selecionar fase para Mata-mata
+    if get_camp_tipo(camp) == "Mata-mata" and camp.fases:
+        fase_selecionada = st.selectbox(
+            "Fase",
+            camp.fases,
+            format_func=lambda f: f.nome,
+            key="jogo_fase",
+        )
+    else:
+        if get_camp_tipo(camp) == "Mata-mata" and not camp.fases:
+            st.info("Crie fases de mata-mata antes de cadastrar partidas.")
+        fase_selecionada = None
+
+    col3, col4 = st.columns(2)
+    with col3:
+        data_jogo = st.date_input("Data do jogo", value=datetime.now(), key="jogo_data")
+    with col4:
+        hora_jogo = st.time_input("Horário", value=datetime.now().time(), key="jogo_hora")
+
+    local_jogo = st.text_input("Local/Estádio", value="Estádio Central", key="jogo_local", max_chars=100)
+
+    # Escalação: suspensos não aparecem nas listas
+    st.subheader("Escalação")
+    st.caption("Regras: 11 titulares obrigatórios, até 12 reservas, total máx. 23 relacionados e 1 goleiro entre os titulares.")
+    controle = get_controle_disciplinar(camp)
+    elegiveis_mand = [j for j in mandante.elenco if not controle.suspenso(j.id)]
+    elegiveis_visit = [j for j in visitante.elenco if not controle.suspenso(j.id)]
+    col_mand, col_visit = st.columns(2)
+
+    with col_mand:
+        st.write(f"**{mandante.nome}**")
+        suspensos = [j.nome for j in mandante.elenco if controle.suspenso(j.id)]
+        if suspensos:
+            st.caption(f"🟥 Suspensos: {', '.join(suspensos)}")
+        titulares_mand = st.multiselect(
+            "Titulares",
+            elegiveis_mand,
+            format_func=lambda j: f"#{j.numero} - {j.nome}",
+            key="tit_mandante"
+        )
+        reservas_mand = st.multiselect(
+            "Reservas",
+            [j for j in elegiveis_mand if j not in titulares_mand],
+            format_func=lambda j: f"#{j.numero} - {j.nome}",
+            key="res_mandante"
+        )
+
+    with col_visit:
+        st.write(f"**{visitante.nome}**")
+        suspensos = [j.nome for j in visitante.elenco if controle.suspenso(j.id)]
+        if suspensos:
+            st.caption(f"🟥 Suspensos: {', '.join(suspensos)}")
+        titulares_visit = st.multiselect(
+            "Titulares",
+            elegiveis_visit,
+            format_func=lambda j: f"#{j.numero} - {j.nome}",
+            key="tit_visitante"
+        )
+        reservas_visit = st.multiselect(
+            "Reservas",
+            [j for j in elegiveis_visit if j not in titulares_visit],
+            format_func=lambda j: f"#{j.numero} - {j.nome}",
+            key="res_visitante"
+        )
+
+    if st.button("Criar jogo"):
+        # Validações
+        if mandante.id == visitante.id:
+            st.error("⚠️ Escolha equipes diferentes para o jogo.")
+        elif not local_jogo.strip():
+            st.error("⚠️ Informe o local do jogo.")
+        elif get_camp_tipo(camp) == "Mata-mata" and not fase_selecionada:
+            st.error("⚠️ Selecione uma fase para um campeonato Mata-mata.")
+        else:
+            erros = []
+            if len(mandante.elenco) < REGRAS_ESCALACAO["titulares_exatos"]:
+                erros.append(f"⚠️ {mandante.nome}: elenco insuficiente para escalação (mínimo {REGRAS_ESCALACAO['titulares_exatos']}).")
+            if len(visitante.elenco) < REGRAS_ESCALACAO["titulares_exatos"]:
+                erros.append(f"⚠️ {visitante.nome}: elenco insuficiente para escalação (mínimo {REGRAS_ESCALACAO['titulares_exatos']}).")
+
+            erros += validar_escalacao(mandante, titulares_mand, reservas_mand, "Mandante", controle)
+            erros += validar_escalacao(visitante, titulares_visit, reservas_visit, "Visitante", controle)
+
+            # Local ocupado ou equipe sem o descanso mínimo
+            candidato = Jogo(mandante=mandante, visitante=visitante,
+                             data=datetime.combine(data_jogo, hora_jogo), local=local_jogo.strip())
+            erros += [f"⚠️ Agenda: {c.descricao()}" for c in get_agenda(camp).conflitos(candidato)]
+
+            if erros:
+                for msg in erros:
+                    st.error(msg)
+            else:
+                try:
+                    # Encontra as equipes corretas no campeonato
+                    equipe_mandante = next(e for e in camp.equipes_inscritas if e.id == mandante.id)
+                    equipe_visitante = next(e for e in camp.equipes_inscritas if e.id == visitante.id)
+
+                    # Combina data e hora
+                    data_hora = datetime.combine(data_jogo, hora_jogo)
+
+                    novo_jogo = Jogo(
+                        mandante=equipe_mandante,
+                        visitante=equipe_visitante,
+                        data=data_hora,
+                        local=local_jogo.strip(),
+                    )
+
+                    # Define escalações
+                    novo_jogo.escalacao_mandante = Escalacao(
+                        titulares=[j.id for j in titulares_mand],
+                        reservas=[j.id for j in reservas_mand]
+                    )
+                    novo_jogo.escalacao_visitante = Escalacao(
+                        titulares=[j.id for j in titulares_visit],
+                        reservas=[j.id for j in reservas_visit]
+                    )
+
+                    with dao.transacao(camp):
+                        # Adiciona jogo à fase correta
+                        if get_camp_tipo(camp) == "Mata-mata":
+                            next(f for f in camp.fases if f.id == fase_selecionada.id).adicionar_jogo(novo_jogo)
+                        else:
+                            if not camp.fases:
+                                camp.adicionar_fase(Fase("Fase Única", 1))
+                            camp.fases[0].adicionar_jogo(novo_jogo)
+                        camp.indexar_escalacao(novo_jogo)
+
+                        dao.salvar(camp)
+                    get_agenda(camp).adicionar(novo_jogo)
+                    if get_camp_tipo(camp) == "Mata-mata":
+                        st.success(f"✅ Jogo criado na fase '{fase_selecionada.nome}': {mandante.nome} x {visitante.nome}")
+                    else:
+                        st.success(f"✅ Jogo criado: {mandante.nome} x {visitante.nome}")
+                except Exception as e:
+                    st.error(f"❌ Erro ao criar jogo: {e}")
+                else:
+                    # O novo jogo precisa aparecer nas demais partes da página
+                    st.rerun()
+
+@st.fragment
+def formulario_placar(camp_id: str, jogo_id: str):
+    """Placar final da partida; só a finalização reexecuta a página inteira."""
+    dao = get_dao()
+    camp = dao.buscar_por_id(camp_id)
+    jogo_sel = buscar_jogo(camp, jogo_id) if camp else None
+    if jogo_sel is None:
+        return
+    col1, col2 = st.columns(2)
+    with col1:
+        g_m = st.number_input(
+            f"Gols {jogo_sel.mandante.nome}",
+            min_value=0,
+            max_value=50,
+            step=1,
+            value=jogo_sel.placar_mandante,
+            key=f"g_m_{jogo_sel.id}_{jogo_sel.placar_mandante}",
+        )
+    with col2:
+        g_v = st.number_input(
+            f"Gols {jogo_sel.visitante.nome}",
+            min_value=0,
+            max_value=50,
+            step=1,
+            value=jogo_sel.placar_visitante,
+            key=f"g_v_{jogo_sel.id}_{jogo_sel.placar_visitante}",
+        )
+
+    st.caption("O placar parte dos gols registrados; gols a mais entram sem autor.")
+    st.info(f"📊 Resultado: {jogo_sel.mandante.nome} {g_m} x {g_v} {jogo_sel.visitante.nome}")
+
+    if st.button("✅ Finalizar partida", type="primary"):
+        if get_camp_tipo(camp) == "Mata-mata" and int(g_m) == int(g_v):
+            st.error("⚠️ Em mata-mata não pode haver empate. Registre o vencedor (prorrogação/pênaltis).")
+        else:
+            try:
+                with dao.transacao(camp):
+                    jogo_sel.finalizar_partida(int(g_m), int(g_v))
+                    dao.salvar(camp)
+                atualizar_indices(camp, jogo_sel)
+                st.success(f"✅ Partida finalizada: {jogo_sel.mandante.nome} {g_m} x {g_v} {jogo_sel.visitante.nome}")
+                st.balloons()
+            except Exception as e:
+                st.error(f"❌ Erro ao finalizar partida: {e}")
+            else:
+                st.rerun()
+
+@st.fragment
+def formulario_gols(camp_id: str, jogo_id: str, lado: str):
+    """Registro de gols de um lado da partida ('mandante' ou 'visitante').
+    A lista de jogadores escalados só é montada com o formulário aberto."""
+    dao = get_dao()
+    camp = dao.buscar_por_id(camp_id)
+    jogo_sel = buscar_jogo(camp, jogo_id) if camp else None
+    if jogo_sel is None:
+        return
+    adversario = "visitante" if lado == "mandante" else "mandante"
+    equipe = getattr(jogo_sel, lado)
+    sufixo = lado[0]
+    aberto = f"adding_gol_{lado}"
+
+    st.subheader(f"{equipe.nome}")
+    if st.button("➕ Adicionar Gol", key=f"add_gol_{sufixo}"):
+        st.session_state[aberto] = True
+
+    if st.session_state.get(aberto):
+        contra = st.checkbox("Gol contra (marcado por jogador adversário)", key=f"contra_gol_{sufixo}")
+        origem = adversario if contra else lado
+        escalacao = getattr(jogo_sel, f"escalacao_{origem}")
+        elenco = getattr(jogo_sel, origem).elenco_dict
+        jogadores = [elenco[jid] for jid in escalacao.titulares + escalacao.reservas if jid in elenco]
+
+        if jogadores:
+            jogador_gol = st.selectbox(
+                "Quem marcou?",
+                jogadores,
+                format_func=lambda j: f"#{j.numero} - {j.nome}",
+                key=f"jog_gol_{sufixo}"
+            )
+            minuto = st.number_input("Minuto", min_value=0, max_value=120, key=f"min_gol_{sufixo}")
+
+            if st.button("Confirmar Gol", key=f"conf_gol_{sufixo}"):
+                with dao.transacao(camp):
+                    jogo_sel.registrar_gol(equipe.id, jogador_gol, int(minuto), contra=contra)
+                    dao.salvar(camp)
+                canal_partidas.publicar("gol", camp.id, jogo_sel)
+                st.session_state[aberto] = False
+                # Só o formulário é refeito; o placar das outras áreas chega pelo painel ao vivo
+                reexecutar_fragmento()
+        else:
+            st.warning("Nenhum jogador escalado para este time")
+
+    st.write("**Gols marcados:**")
+    gols = [g for g in jogo_sel.gols if g.equipe_id == equipe.id]
+    if gols:
+        for gol in gols:
+            col_gol, col_remover = st.columns([4, 1])
+            autor = gol.jogador_nome or "Sem autor"
+            col_gol.write(f"⚽ {autor}{' (contra)' if gol.tipo == 'gol_contra' else ''} ({gol.minuto}')")
+            if col_remover.button("🗑️", key=f"rem_gol_{gol.id}", help="Remover gol registrado por engano"):
+                with dao.transacao(camp):
+                    jogo_sel.remover_evento(gol.id)
+                    dao.salvar(camp)
+                canal_partidas.publicar("gol", camp.id, jogo_sel)
+                reexecutar_fragmento()
+    else:
+        st.info("Nenhum gol registrado")
+
+@st.fragment
+def formulario_cartoes(camp_id: str, jogo_id: str):
+    """Cartões da partida; contam para suspensões quando ela é finalizada."""
+    dao = get_dao()
+    camp = dao.buscar_por_id(camp_id)
+    jogo_sel = buscar_jogo(camp, jogo_id) if camp else None
+    if jogo_sel is None:
+        return
+    col1, col2, col3, col4 = st.columns([2, 3, 1, 1])
+    with col1:
+        lado = st.radio("Equipe", ["mandante", "visitante"], key="cartao_lado",
+                        format_func=lambda l: getattr(jogo_sel, l).nome)
+    equipe = getattr(jogo_sel, lado)
+    escalacao = getattr(jogo_sel, f"escalacao_{lado}")
+    jogadores = [equipe.elenco_dict[jid] for jid in escalacao.titulares + escalacao.reservas
+                 if jid in equipe.elenco_dict]
+    if not jogadores:
+        st.warning("Nenhum jogador escalado para este time")
+        return
+    with col2:
+        jogador_id = st.selectbox("Jogador", [j.id for j in jogadores], key="cartao_jogador",
+                                  format_func=lambda i: f"#{equipe.elenco_dict[i].numero} - {equipe.elenco_dict[i].nome}")
+    with col3:
+        cor = st.radio("Cartão", ["🟨 Amarelo", "🟥 Vermelho"], key="cartao_cor")
+    with col4:
+        minuto = st.number_input("Minuto", min_value=0, max_value=120, key="cartao_minuto")
+
+    if st.button("Registrar cartão", key="cartao_registrar"):
+        with dao.transacao(camp):
+            jogo_sel.registrar_cartao(equipe.id, equipe.elenco_dict[jogador_id], int(minuto),
+                                      vermelho=cor.endswith("Vermelho"))
+            dao.salvar(camp)
+
+    nomes = {jogo_sel.mandante.id: jogo_sel.mandante.nome, jogo_sel.visitante.id: jogo_sel.visitante.nome}
+    for cartao in jogo_sel.cartoes:
+        col_cartao, col_remover = st.columns([4, 1])
+        icone = "🟥" if cartao.tipo == "vermelho" else "🟨"
+        col_cartao.write(f"{icone} {cartao.jogador_nome} ({nomes.get(cartao.equipe_id, '')}) {cartao.minuto}'")
+        if col_remover.button("🗑️", key=f"rem_cartao_{cartao.id}", help="Remover cartão registrado por engano"):
+            with dao.transacao(camp):
+                jogo_sel.remover_evento(cartao.id)
+                dao.salvar(camp)
+            st.rerun()
+
+@st.fragment
+def formulario_lote(camp_id: str):
+    """Resultados de várias partidas de uma vez: valida todos os placares, finaliza
+    em uma única transação (uma gravação) e só então atualiza os índices."""
+    dao = get_dao()
+    camp = dao.buscar_por_id(camp_id)
+    if camp is None:
+        return
+    pendentes = [(f, j) for f in camp.fases for j in f.jogos if pendente(j)]
+    if not pendentes:
+        st.info("Não há partidas pendentes.")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        fases = [None] + [f for f in camp.fases if any(pendente(j) for j in f.jogos)]
+        fase_filtro = st.selectbox("Fase/Rodada", fases, format_func=lambda f: f.nome if f else "Todas",
+                                   key="lote_fase")
+    with col2:
+        dias = sorted(j.data.date() for _, j in pendentes)
+        periodo = st.date_input("Período", value=(dias[0], dias[-1]), key="lote_periodo")
+    inicio, fim = (periodo[0], periodo[-1]) if periodo else (dias[0], dias[-1])
+
+    selecionados = sorted(
+        ((f, j) for f, j in pendentes
+         if (fase_filtro is None or f.id == fase_filtro.id) and inicio <= j.data.date() <= fim),
+        key=lambda p: p[1].data
+    )
+    if not selecionados:
+        st.info("Nenhuma partida pendente no filtro.")
+        return
+
+    st.caption("Preencha os dois placares das partidas encerradas; linhas em branco são ignoradas.")
+    linhas = [
+        {
+            "Data": j.data.strftime('%d/%m/%Y %H:%M'),
+            "Fase": f.nome,
+            "Mandante": j.mandante.nome,
+            "Gols mandante": None,
+            "Gols visitante": None,
+            "Visitante": j.visitante.nome,
+        }
+        for f, j in selecionados
+    ]
+    placar = st.column_config.NumberColumn(min_value=0, max_value=50, step=1)
+    editado = st.data_editor(
+        linhas,
+        column_config={"Gols mandante": placar, "Gols visitante": placar},
+        disabled=["Data", "Fase", "Mandante", "Visitante"],
+        num_rows="fixed",
+        hide_index=True,
+        use_container_width=True,
+        key=f"lote_editor_{st.session_state.get('lote_versao', 0)}",
+    )
+
+    if st.button("✅ Finalizar partidas preenchidas", type="primary", key="lote_finalizar"):
+        erros, resultados = [], []
+        for (fase, jogo), linha in zip(selecionados, editado):
+            g_m, g_v = linha["Gols mandante"], linha["Gols visitante"]
+            vazio_m, vazio_v = g_m is None or g_m != g_m, g_v is None or g_v != g_v  # None ou NaN
+            if vazio_m and vazio_v:
+                continue
+            rotulo = f"{jogo.mandante.nome} x {jogo.visitante.nome} ({linha['Data']})"
+            if vazio_m or vazio_v:
+                erros.append(f"⚠️ {rotulo}: informe os dois placares.")
+            elif int(g_m) < jogo.placar_mandante or int(g_v) < jogo.placar_visitante:
+                erros.append(f"⚠️ {rotulo}: já há {jogo.placar_mandante} x {jogo.placar_visitante} em gols registrados.")
+            elif get_camp_tipo(camp) == "Mata-mata" and int(g_m) == int(g_v):
+                erros.append(f"⚠️ {rotulo}: em mata-mata não pode haver empate.")
+            else:
+                resultados.append((jogo, int(g_m), int(g_v)))
+
+        if erros:
+            for msg in erros:
+                st.error(msg)
+        elif not resultados:
+            st.warning("Nenhum placar preenchido.")
+        else:
+            try:
+                with dao.transacao(camp):
+                    for jogo, g_m, g_v in resultados:
+                        jogo.finalizar_partida(g_m, g_v)
+                    dao.salvar(camp)
+            except Exception as e:
+                st.error(f"❌ Erro ao finalizar partidas: {e}")
+            else:
+                for jogo, _, _ in resultados:
+                    atualizar_indices(camp, jogo)
+                st.session_state.lote_versao = st.session_state.get('lote_versao', 0) + 1
+                st.success(f"✅ {len(resultados)} partidas finalizadas.")
+                st.rerun()
+
+@st.fragment
+def formulario_correcao(camp_id: str):
+    """Correção de placar, reabertura e cancelamento. As estatísticas das equipes
+    e os índices recebem só a diferença; nada é recalculado do zero."""
+    dao = get_dao()
+    camp = dao.buscar_por_id(camp_id)
+    if camp is None:
+        return
+    jogos = sorted((j for f in camp.fases for j in f.jogos), key=lambda j: j.data)
+    if not jogos:
+        st.info("Nenhuma partida cadastrada.")
+        return
+
+    def rotulo(j: Jogo) -> str:
+        placar = f"{j.placar_mandante} x {j.placar_visitante}" if j.finalizada else "x"
+        return f"{j.mandante.nome} {placar} {j.visitante.nome} - {j.data.strftime('%d/%m/%Y %H:%M')} [{j.status}]"
+
+    por_id = {j.id: j for j in jogos}
+    jogo_sel = por_id[st.selectbox("Partida", list(por_id), format_func=lambda i: rotulo(por_id[i]), key="corr_jogo")]
+    acao, g_m, g_v = None, None, None
+
+    if jogo_sel.finalizada:
+        col1, col2 = st.columns(2)
+        with col1:
+            g_m = st.number_input(f"Gols {jogo_sel.mandante.nome}", min_value=0, max_value=50, step=1,
+                                  value=jogo_sel.placar_mandante, key=f"corr_g_m_{jogo_sel.id}")
+        with col2:
+            g_v = st.number_input(f"Gols {jogo_sel.visitante.nome}", min_value=0, max_value=50, step=1,
+                                  value=jogo_sel.placar_visitante, key=f"corr_g_v_{jogo_sel.id}")
+        if st.button("💾 Salvar correção", type="primary", key="corr_salvar"):
+            acao = "corrigir"
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if jogo_sel.finalizada or jogo_sel.status == "Cancelada":
+            if st.button("↩️ Reabrir partida", key="corr_reabrir"):
+                acao = "reabrir"
+    with col2:
+        if jogo_sel.status != "Cancelada":
+            if st.button("⛔ Cancelar partida", key="corr_cancelar"):
+                acao = "cancelar"
+
+    if acao is None:
+        return
+    if acao == "corrigir" and get_camp_tipo(camp) == "Mata-mata" and int(g_m) == int(g_v):
+        st.error("⚠️ Em mata-mata não pode haver empate. Registre o vencedor (prorrogação/pênaltis).")
+        return
+    try:
+        with dao.transacao(camp):
+            if acao == "corrigir":
+                jogo_sel.corrigir_resultado(int(g_m), int(g_v))
+            elif acao == "reabrir":
+                jogo_sel.reabrir()
+            else:
+                jogo_sel.cancelar()
+            dao.salvar(camp)
+    except Exception as e:
+        st.error(f"❌ Erro ao atualizar partida: {e}")
+    else:
+        atualizar_indices(camp, jogo_sel)
+        st.rerun()
+
+def exibir_auditoria_agenda(camp: Campeonato):
+    """Todos os conflitos de local e de descanso da temporada."""
+    st.caption("Local ocupado: jogos no mesmo local com menos de 2h de intervalo. "
+               "Descanso: jogos da mesma equipe com menos de 48h de intervalo.")
+    conflitos = get_agenda(camp).auditar()
+    if not conflitos:
+        st.success("✅ Nenhum conflito de agenda.")
+        return
+    st.warning(f"⚠️ {len(conflitos)} conflito(s) encontrado(s).")
+    st.dataframe(
+        [
+            {
+                "Tipo": "Local ocupado" if c.tipo == "local" else "Descanso",
+                "Local/Equipe": c.alvo,
+                "Jogo": f"{c.jogo.mandante.nome} x {c.jogo.visitante.nome} ({c.jogo.data:%d/%m %H:%M})",
+                "Conflita com": f"{c.outro.mandante.nome} x {c.outro.visitante.nome} ({c.outro.data:%d/%m %H:%M})",
+            }
+            for c in conflitos
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+def render(camp: Campeonato):
+    dao = get_dao()
+    st.subheader("Partidas")
+    if len(camp.equipes_inscritas) < 2:
+        st.info("Cadastre pelo menos duas equipes para criar partidas.")
+    else:
+        tab_criar, tab_resultado, tab_lote, tab_correcao, tab_agenda = st.tabs(
+            ["Criar", "Finalizar", "Resultados em lote", "Corrigir/Cancelar", "Agenda"])
+
+        with tab_criar:
+            formulario_criar_jogo(camp.id)
+
+        with tab_resultado:
+            partidas_pendentes = [j for f in camp.fases for j in f.jogos if pendente(j)]
+            if not partidas_pendentes:
+                st.info("Não há partidas pendentes.")
+            else:
+                jogo_sel = st.selectbox(
+                    "Jogo",
+                    partidas_pendentes,
+                    format_func=lambda x: f"{x.mandante.nome} x {x.visitante.nome}",
+                    key="jogo_sel",
+                )
+                # O selectbox devolve uma cópia do objeto; usa o jogo do campeonato
+                jogo_sel = buscar_jogo(camp, jogo_sel.id)
+                
+                if jogo_sel.status == "Agendada":
+                    if st.button("🔴 Iniciar partida (Ao vivo)", key="iniciar_ao_vivo"):
+                        with dao.transacao(camp):
+                            jogo_sel.alterar_status("Ao vivo")
+                            dao.salvar(camp)
+                        canal_partidas.publicar("status", camp.id, jogo_sel)
+                        st.rerun()
+                else:
+                    st.caption(f"Status: {jogo_sel.status}")
+
+                # Abas para resultado e gols
+                tab_placar, tab_gols, tab_cartoes = st.tabs(["Placar", "Gols Marcados", "Cartões"])
+
+                with tab_placar:
+                    formulario_placar(camp.id, jogo_sel.id)
+
+                with tab_gols:
+                    st.write("### Registrar Gols")
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        formulario_gols(camp.id, jogo_sel.id, "mandante")
+                    with col2:
+                        formulario_gols(camp.id, jogo_sel.id, "visitante")
+
+                with tab_cartoes:
+                    formulario_cartoes(camp.id, jogo_sel.id)
+
+        with tab_lote:
+            formulario_lote(camp.id)
+
+        with tab_correcao:
+            formulario_correcao(camp.id)
+
+        with tab_agenda:
+            exibir_auditoria_agenda(camp)
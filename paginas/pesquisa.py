@@ -0,0 +1,113 @@
+"""Página "Pesquisa"."""
+import streamlit as st
+
+from models.campeonato import Campeonato
+from paginas.comum import get_dao, get_registro_jogadores, is_admin
+
+
+def render(camp: Campeonato):
+    dao = get_dao()
+    st.subheader("🔍 Pesquisar")
+    
+    tab1, tab2 = st.tabs(["Equipes", "Jogadores"])
+    
+    with tab1:
+        termo = st.text_input("Buscar equipe por nome", key="pesq_equipe", placeholder="Digite o nome da equipe...")
+        
+        if termo:
+            resultados = [e for e in camp.equipes_inscritas if termo.lower() in e.nome.lower()]
+            
+            if not resultados:
+                st.info(f"Nenhuma equipe encontrada com '{termo}'")
+            else:
+                for equipe in resultados:
+                    with st.container():
+                        col1, col2, col3 = st.columns([2, 1, 1])
+                        with col1:
+                            st.write(f"### {equipe.nome}")
+                            st.caption(f"Técnico: {equipe.tecnico}")
+                        with col2:
+                            st.metric("Pontos", equipe.pontos)
+                            st.metric("Jogadores", len(equipe.elenco))
+                        with col3:
+                            st.metric("Vitórias", equipe.vitorias)
+                            st.metric("Saldo", equipe.saldo_gols)
+                        st.divider()
+        else:
+            st.info("Digite o nome de uma equipe para buscar")
+    
+    with tab2:
+        termo = st.text_input("Buscar jogador por nome", key="pesq_jogador", placeholder="Digite o nome do jogador...")
+        
+        if termo:
+            resultados = []
+            for equipe in camp.equipes_inscritas:
+                for jogador in equipe.elenco:
+                    if termo.lower() in jogador.nome.lower():
+                        resultados.append((equipe, jogador))
+            
+            if not resultados:
+                st.info(f"Nenhum jogador encontrado com '{termo}'")
+            else:
+                for equipe, jogador in resultados:
+                    with st.container():
+                        col1, col2, col3 = st.columns([2, 1, 1])
+                        with col1:
+                            st.write(f"**{jogador.nome}** (#{jogador.numero})")
+                            st.caption(f"Posição: {jogador.posicao} | Equipe: {equipe.nome}")
+                        with col2:
+                            est = camp.estatisticas_jogador(jogador.id)
+                            st.metric("Gols", est['gols'])
+                            st.caption(f"{est['jogos']} jogos ({est['titular']} como titular, {est['reserva']} como reserva) | "
+                                       f"{est['gols_por_jogo']} gols/jogo")
+                            pessoa = get_registro_jogadores().pessoa_do_jogador(jogador.id)
+                            if pessoa:
+                                st.caption(f"Carreira: {pessoa.jogos} jogos, {pessoa.gols} gols em {len(pessoa.temporadas)} temporada(s)")
+                        with col3:
+                            st.warning("⚠️ Ação destrutiva")
+                            confirma_rem = st.checkbox("Confirmar remoção", key=f"rem_jog_conf_{jogador.id}")
+                            if st.button("Remover", key=f"rem_jog_{jogador.id}", disabled=not confirma_rem):
+                                try:
+                                    with dao.transacao(camp):
+                                        equipe.remover_jogador(jogador.id)
+                                        dao.salvar(camp)
+                                    st.success(f"✅ Jogador {jogador.nome} removido com sucesso!")
+                                    st.rerun()
+                                except Exception as e:
+                                    st.error(f"❌ Erro: {e}")
+                        if pessoa and pessoa.temporadas:
+                            with st.expander("Carreira por temporada"):
+                                st.dataframe(
+                                    [
+                                        {
+                                            "Campeonato": f"{t.campeonato} ({t.ano})",
+                                            "Equipe": t.equipe,
+                                            "Jogos": t.jogos,
+                                            "Titular": t.titular,
+                                            "Reserva": t.reserva,
+                                            "Gols": t.gols,
+                                        }
+                                        for t in sorted(pessoa.temporadas.values(), key=lambda t: t.ano)
+                                    ],
+                                    use_container_width=True,
+                                    hide_index=True,
+                                )
+                        homonimos = get_registro_jogadores().sugestoes(pessoa.id) if pessoa and is_admin() else []
+                        if homonimos:
+                            with st.expander(f"Possíveis homônimos ({len(homonimos)})"):
+                                st.caption("Jogadores de mesmo nome não são unidos automaticamente. "
+                                           "Unifique apenas se for a mesma pessoa.")
+                                for outra in homonimos:
+                                    col_a, col_b = st.columns([3, 1])
+                                    temporadas = ", ".join(f"{t.equipe} - {t.campeonato} ({t.ano})"
+                                                           for t in outra.temporadas.values())
+                                    col_a.write(f"{outra.nome}: {temporadas or 'sem jogos registrados'}")
+                                    if col_b.button("Unificar", key=f"unif_{jogador.id}_{outra.id}"):
+                                        campeonatos = dao.listar_todos()
+                                        with dao.transacao(*campeonatos):
+                                            for c in get_registro_jogadores().unificar(pessoa.id, outra.id, campeonatos):
+                                                dao.salvar(c)
+                                        st.rerun()
+                        st.divider()
+        else:
+            st.info("Digite o nome de um jogador para buscar")
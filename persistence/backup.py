@@ -0,0 +1,203 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List
+import hashlib
+import json
+import lzma
+import os
+import threading
+import zlib
+from models.campeonato import Campeonato
+from utils.exceptions import BackupNaoEncontrado
+
+COMPRESSORES = {
+    'zlib': (lambda b: zlib.compress(b, 6), zlib.decompress, '.z'),
+    'lzma': (lambda b: lzma.compress(b, preset=6), lzma.decompress, '.xz'),
+}
+
+
+@dataclass
+class Snapshot:
+    """Estado de todos os campeonatos em um instante: id do campeonato -> hash do conteúdo."""
+    id: str
+    momento: datetime
+    campeonatos: Dict[str, str] = field(default_factory=dict)
+    nomes: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'momento': self.momento.isoformat(),
+            'campeonatos': self.campeonatos,
+            'nomes': self.nomes
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            id=data['id'],
+            momento=datetime.fromisoformat(data['momento']),
+            campeonatos=dict(data.get('campeonatos', {})),
+            nomes=dict(data.get('nomes', {}))
+        )
+
+
+class BackupStore:
+    """Backups endereçados por conteúdo e comprimidos, por campeonato.
+
+    Cada versão de um campeonato é gravada uma única vez em `objetos/`, com
+    nome igual ao SHA-256 do seu JSON; os snapshots apenas referenciam esses
+    hashes. Um campeonato que não mudou entre snapshots não ocupa espaço
+    adicional. A retenção mantém tudo dos últimos `minutos_recentes`,
+    um snapshot por hora nas últimas `horas` e um por dia nos últimos `dias`.
+    O codec de cada objeto fica registrado na extensão do seu arquivo, então
+    trocar a `compressao` só afeta os objetos novos; os antigos continuam legíveis.
+    """
+
+    def __init__(self, diretorio: str = 'data/backups', compressao: str = 'zlib',
+                 minutos_recentes: int = 10, horas: int = 24, dias: int = 30):
+        if compressao not in COMPRESSORES:
+            raise ValueError(f"Compressão inválida: {compressao}")
+        self.diretorio = diretorio
+        self.compressao = compressao
+        self.minutos_recentes = minutos_recentes
+        self.horas = horas
+        self.dias = dias
+        self._dir_objetos = os.path.join(diretorio, 'objetos')
+        self._manifesto = os.path.join(diretorio, 'snapshots.json')
+        self._snapshots: List[Snapshot] = []
+        self._lock = threading.Lock()
+        self.sincronizado = False # registrar_todos já rodou neste processo
+        os.makedirs(self._dir_objetos, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self._manifesto, 'r', encoding='utf-8') as f:
+                self._snapshots = [Snapshot.from_dict(s) for s in json.load(f)]
+        except (json.JSONDecodeError, FileNotFoundError):
+            self._snapshots = []
+
+    def _save(self):
+        temporario = self._manifesto + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump([s.to_dict() for s in self._snapshots], f, ensure_ascii=False)
+        os.replace(temporario, self._manifesto)
+
+    def _caminho_objeto(self, digest: str, compressao: str | None = None) -> str:
+        return os.path.join(self._dir_objetos, digest + COMPRESSORES[compressao or self.compressao][2])
+
+    def _localizar_objeto(self, digest: str) -> tuple | None:
+        """(caminho, compressão) do objeto gravado, com qualquer codec; o atual é tentado primeiro."""
+        for compressao in sorted(COMPRESSORES, key=lambda c: c != self.compressao):
+            caminho = self._caminho_objeto(digest, compressao)
+            if os.path.exists(caminho):
+                return caminho, compressao
+        return None
+
+    def _gravar_objeto(self, campeonato: Campeonato) -> str:
+        conteudo = json.dumps(campeonato.to_dict(), ensure_ascii=False, sort_keys=True).encode('utf-8')
+        digest = hashlib.sha256(conteudo).hexdigest()
+        if self._localizar_objeto(digest) is None:
+            caminho = self._caminho_objeto(digest)
+            temporario = caminho + '.tmp'
+            with open(temporario, 'wb') as f:
+                f.write(COMPRESSORES[self.compressao][0](conteudo))
+            os.replace(temporario, caminho)
+        return digest
+
+    def registrar(self, campeonato_id: str, campeonato: Campeonato | None) -> Snapshot | None:
+        """Cria um snapshot com o novo estado de um campeonato (None = excluído).
+        Pode ser ligado diretamente como ouvinte do DAO."""
+        with self._lock:
+            return self._registrar(campeonato_id, campeonato)
+
+    def _registrar(self, campeonato_id: str, campeonato: Campeonato | None) -> Snapshot | None:
+        anterior = self._snapshots[-1] if self._snapshots else None
+        campeonatos = dict(anterior.campeonatos) if anterior else {}
+        nomes = dict(anterior.nomes) if anterior else {}
+
+        if campeonato is None:
+            if campeonato_id not in campeonatos:
+                return None
+            del campeonatos[campeonato_id]
+        else:
+            digest = self._gravar_objeto(campeonato)
+            if campeonatos.get(campeonato_id) == digest:
+                return None
+            campeonatos[campeonato_id] = digest
+            nomes[campeonato_id] = f"{campeonato.nome} ({campeonato.ano})"
+
+        momento = datetime.now()
+        snapshot = Snapshot(id=momento.strftime('%Y%m%dT%H%M%S%f'), momento=momento,
+                            campeonatos=campeonatos, nomes=nomes)
+        self._snapshots.append(snapshot)
+        self._aplicar_retencao(momento)
+        self._save()
+        return snapshot
+
+    def registrar_todos(self, campeonatos: List[Campeonato]) -> None:
+        for campeonato in campeonatos:
+            self.registrar(campeonato.id, campeonato)
+        self.sincronizado = True
+
+    def _aplicar_retencao(self, agora: datetime) -> None:
+        mantidos, baldes = [], set()
+        # Do mais recente para o mais antigo: o primeiro snapshot visto em cada hora/dia é mantido
+        for snapshot in reversed(self._snapshots):
+            idade = agora - snapshot.momento
+            if idade <= timedelta(minutes=self.minutos_recentes):
+                balde = ('r', snapshot.id)
+            elif idade <= timedelta(hours=self.horas):
+                balde = ('h', snapshot.momento.strftime('%Y%m%d%H'))
+            elif idade <= timedelta(days=self.dias):
+                balde = ('d', snapshot.momento.strftime('%Y%m%d'))
+            else:
+                continue
+            if balde not in baldes:
+                baldes.add(balde)
+                mantidos.append(snapshot)
+        mantidos.reverse()
+        if len(mantidos) == len(self._snapshots):
+            return
+        self._snapshots = mantidos
+        self._coletar_objetos()
+
+    def _coletar_objetos(self) -> None:
+        """Remove objetos que nenhum snapshot retido referencia."""
+        referenciados = {d for s in self._snapshots for d in s.campeonatos.values()}
+        sufixos = tuple(c[2] for c in COMPRESSORES.values())
+        for nome in os.listdir(self._dir_objetos):
+            digest, sufixo = os.path.splitext(nome)
+            if sufixo in sufixos and digest not in referenciados:
+                os.remove(os.path.join(self._dir_objetos, nome))
+
+    def listar_snapshots(self, campeonato_id: str | None = None) -> List[Snapshot]:
+        """Snapshots do mais recente ao mais antigo, opcionalmente só os que mudaram o campeonato."""
+        resultado, ultimo = [], None
+        for snapshot in self._snapshots:
+            if campeonato_id is None:
+                resultado.append(snapshot)
+                continue
+            digest = snapshot.campeonatos.get(campeonato_id)
+            if digest and digest != ultimo:
+                resultado.append(snapshot)
+            ultimo = digest
+        return list(reversed(resultado))
+
+    def restaurar(self, campeonato_id: str, snapshot_id: str) -> Campeonato:
+        """Reconstrói o campeonato como estava no snapshot indicado."""
+        with self._lock:
+            snapshot = next((s for s in self._snapshots if s.id == snapshot_id), None)
+        if snapshot is None:
+            raise BackupNaoEncontrado(f"Snapshot {snapshot_id} não encontrado.")
+        digest = snapshot.campeonatos.get(campeonato_id)
+        if digest is None:
+            raise BackupNaoEncontrado(f"Campeonato {campeonato_id} não existe no snapshot {snapshot_id}.")
+        objeto = self._localizar_objeto(digest)
+        if objeto is None:
+            raise BackupNaoEncontrado(f"Arquivo do backup {digest[:12]} não encontrado.")
+        caminho, compressao = objeto
+        with open(caminho, 'rb') as f:
+            conteudo = COMPRESSORES[compressao][1](f.read())
+        return Campeonato.from_dict(json.loads(conteudo))
@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import contextmanager
+from typing import Callable, Dict, List
 import json
+import logging
 import os
+import threading
 from models.campeonato import Campeonato
+from persistence.escrita_assincrona import EscritaAssincrona
+
+logger = logging.getLogger(__name__)
 
 
 class CampeonatoDAO(ABC):
@@ -27,10 +33,31 @@ class CampeonatoFileDAO(CampeonatoDAO):
     def __init__(self, path: str = 'data/campeonatos.json'):
         self.path = path
         self._db = {} # Cache em memória
-        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.versao = 0 # Incrementada a cada alteração dos dados
+        self._mtime = None
+        self._ouvintes: List[Callable[[str, Campeonato | None], None]] = []
+        self._ouvintes_reversao: List[Callable[[List[Campeonato]], None]] = []
+        self._sujos: Dict[str, Campeonato | None] | None = None # Alterados na transação aberta
+        self._rastreados: Dict[int, Campeonato] = {} # Informados à transação aberta, por id(objeto)
+        self._db_inicial = {}
+        self._escrita: EscritaAssincrona | None = None
+        self._trava = threading.RLock() # Protege o estado compartilhado com a escrita assíncrona
+        self._dados: Dict[str, dict] | None = None # Últimos dicts agendados (escrita assíncrona)
+        self.fsync = False
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
         self._load()
 
+    def _mtime_arquivo(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
     def _load(self):
+        self._db = {}
+        self._dados = None
+        self.versao += 1
+        self._mtime = self._mtime_arquivo()
         try:
             with open(self.path, 'r', encoding='utf-8') as f:
                 raw_list = json.load(f)
@@ -41,13 +68,160 @@ class CampeonatoFileDAO(CampeonatoDAO):
             self._db = {}
 
     def _save(self):
+        self._escrever([c.to_dict() for c in list(self._db.values())])
+
+    def _escrever(self, dados: List[dict]):
         with open(self.path, 'w', encoding='utf-8') as f:
-            json.dump([c.to_dict() for c in self._db.values()], f, ensure_ascii=False, indent=2)
+            json.dump(dados, f, ensure_ascii=False, indent=2)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self._apos_gravar()
+
+    def _apos_gravar(self):
+        with self._trava:
+            self.versao += 1
+            self._mtime = self._mtime_arquivo()
+
+    def _gravar(self, campeonato: Campeonato):
+        """Persiste um campeonato alterado; no arquivo único, regrava tudo."""
+        self._save()
+
+    def _apagar(self, id: str):
+        self._save()
+
+    def _gravar_lote(self, sujos: Dict[str, Campeonato | None]):
+        """Persiste de uma vez os campeonatos alterados em uma transação."""
+        self._save()
+
+    def _guardar_dados(self, dados: Dict[str, dict | None]):
+        """Atualiza os dicts de que o arquivo único é regravado pela escrita
+        assíncrona; na primeira vez, serializa os demais campeonatos."""
+        if self._dados is None:
+            self._dados = {c.id: c.to_dict() for c in self._db.values() if c.id not in dados}
+        for id, d in dados.items():
+            if d is None:
+                self._dados.pop(id, None)
+            else:
+                self._dados[id] = d
+
+    def _gravar_dados(self, lote: Dict[str, dict | None]):
+        """Chamado pela escrita assíncrona com dicts já serializados."""
+        with self._trava:
+            dados = None if self._dados is None else list(self._dados.values())
+        if dados is not None:  # None: recarregado do disco depois do agendamento
+            self._escrever(dados)
+
+    def _agendar(self, sujos: Dict[str, Campeonato | None]) -> None:
+        """Serializa os campeonatos agora, na thread de quem salvou, e entrega
+        só os dicts à escrita assíncrona."""
+        with self._trava:
+            dados = {id: camp.to_dict() if camp is not None else None for id, camp in sujos.items()}
+            self._guardar_dados(dados)
+            self.versao += 1
+        self._escrita.agendar(self, dados)
+
+    def adicionar_ouvinte(self, ouvinte: Callable[[str, Campeonato | None], None]) -> None:
+        """Registra uma função chamada após cada gravação com (id, campeonato);
+        o campeonato é None quando ele foi excluído."""
+        self._ouvintes.append(ouvinte)
+
+    def adicionar_ouvinte_reversao(self, ouvinte: Callable[[List[Campeonato]], None]) -> None:
+        """Registra uma função chamada com os campeonatos restaurados quando uma
+        transação é desfeita: equipes, jogadores e jogos deles passam a ser
+        objetos novos, então índices montados sobre os antigos devem ser descartados."""
+        self._ouvintes_reversao.append(ouvinte)
+
+    def _notificar(self, id: str, campeonato: Campeonato | None) -> None:
+        for ouvinte in self._ouvintes:
+            ouvinte(id, campeonato)
+
+    def ativar_escrita_assincrona(self, intervalo: float = 1.0, escrita: EscritaAssincrona | None = None) -> None:
+        """Passa a gravar em segundo plano: `salvar` e `excluir` retornam sem esperar o disco.
+        `escrita` permite compartilhar uma mesma thread de gravação entre vários DAOs."""
+        if self._escrita is None:
+            self.fsync = True
+            self._escrita = escrita or EscritaAssincrona(intervalo)
+
+    def escritas_pendentes(self) -> int:
+        return self._escrita.pendentes(self) if self._escrita else 0
+
+    def descarregar(self, timeout: float | None = None) -> bool:
+        """Aguarda a gravação de tudo que está pendente na escrita assíncrona."""
+        return self._escrita.descarregar(timeout) if self._escrita else True
+
+    def _ler_gravados(self, ids: set) -> Dict[str, dict]:
+        """Últimos dicts gravados dos campeonatos indicados (os ausentes do disco ficam de fora)."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return {d['id']: d for d in json.load(f) if d.get('id') in ids}
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def _reverter(self, rastreados: List[Campeonato]) -> List[Campeonato]:
+        """Volta os objetos, no próprio lugar, ao último estado gravado."""
+        self.descarregar()
+        gravados = self._ler_gravados({camp.id for camp in rastreados})
+        restaurados = []
+        for camp in rastreados:
+            if camp.id in gravados:
+                camp.__dict__.update(Campeonato.from_dict(gravados[camp.id]).__dict__)
+                restaurados.append(camp)
+        return restaurados
+
+    @contextmanager
+    def transacao(self, *campeonatos: Campeonato):
+        """Unidade de trabalho: dentro do bloco, `salvar` e `excluir` só marcam os
+        campeonatos como alterados e tudo é gravado uma única vez ao final. Se o
+        bloco lançar exceção, nada é gravado e os campeonatos passados a `salvar`
+        (e os informados aqui) voltam, no próprio objeto, ao último estado
+        gravado. Nenhuma cópia é feita antes: o disco só é lido na reversão."""
+        if self._sujos is not None:
+            # Transação aninhada participa da externa
+            self._rastreados.update((id(c), c) for c in campeonatos)
+            yield self
+            return
+
+        self._sujos, self._db_inicial = {}, dict(self._db)
+        self._rastreados = {id(c): c for c in campeonatos}
+        try:
+            yield self
+        except BaseException:
+            rastreados, self._db = self._rastreados, self._db_inicial
+            for camp_id in self._sujos:
+                if camp_id in self._db:
+                    rastreados.setdefault(id(self._db[camp_id]), self._db[camp_id])
+            self._sujos, self._rastreados, self._db_inicial = None, {}, {}
+            restaurados = self._reverter(list(rastreados.values()))
+            self.versao += 1
+            for ouvinte in self._ouvintes_reversao:
+                ouvinte(restaurados)
+            raise
+
+        sujos = self._sujos
+        self._sujos, self._rastreados, self._db_inicial = None, {}, {}
+        if not sujos:
+            return
+        if self._escrita:
+            self._agendar(sujos)
+            return
+        self._gravar_lote(sujos)
+        logger.debug("%d campeonato(s) gravado(s) em %s.", len(sujos), self.path)
+        for camp_id, camp in sujos.items():
+            self._notificar(camp_id, camp)
 
     def salvar(self, campeonato: Campeonato) -> None:
         self._db[campeonato.id] = campeonato
-        self._save()
-        print(f"[BD] Campeonato '{campeonato.nome}' salvo em {self.path}.")
+        if self._sujos is not None:
+            self._sujos[campeonato.id] = campeonato
+            self._rastreados.setdefault(id(campeonato), campeonato)
+            return
+        if self._escrita:
+            self._agendar({campeonato.id: campeonato})
+            return
+        self._gravar(campeonato)
+        logger.debug("Campeonato '%s' salvo em %s.", campeonato.nome, self.path)
+        self._notificar(campeonato.id, campeonato)
 
     def listar_todos(self) -> List[Campeonato]:
         return list(self._db.values())
@@ -55,7 +229,14 @@ class CampeonatoFileDAO(CampeonatoDAO):
     def excluir(self, id: str) -> bool:
         if id in self._db:
             del self._db[id]
-            self._save()
+            if self._sujos is not None:
+                self._sujos[id] = None
+                return True
+            if self._escrita:
+                self._agendar({id: None})
+                return True
+            self._apagar(id)
+            self._notificar(id, None)
             return True
         return False
         
@@ -64,4 +245,157 @@ class CampeonatoFileDAO(CampeonatoDAO):
     
     def reload(self):
         """Recarrega os dados do arquivo, útil quando o cache do Streamlit precisa ser atualizado."""
-        self._load()
\ No newline at end of file
+        self.descarregar()
+        self._load()
+
+    def recarregar_se_alterado(self) -> bool:
+        """Recarrega se outro processo gravou o arquivo desde a última leitura/escrita."""
+        if self.escritas_pendentes() or self._mtime_arquivo() == self._mtime:
+            return False
+        self._load()
+        return True
+
+
+class CampeonatoShardDAO(CampeonatoFileDAO):
+    """Armazenamento em diretório: um arquivo por campeonato mais um manifesto.
+
+    `salvar` regrava só o arquivo do campeonato alterado (e o manifesto, que
+    é pequeno), e um arquivo corrompido afeta apenas o seu campeonato. Na
+    primeira abertura, importa o arquivo único legado, se existir.
+    """
+
+    MANIFESTO = 'manifesto.json'
+
+    def __init__(self, diretorio: str = 'data/campeonatos', legado: str | None = 'data/campeonatos.json'):
+        self.legado = legado
+        self._resumo = {}
+        os.makedirs(diretorio, exist_ok=True)
+        super().__init__(diretorio)
+
+    def _caminho(self, id: str) -> str:
+        return os.path.join(self.path, f"{id}.json")
+
+    def _gravar_atomico(self, caminho: str, dados) -> None:
+        temporario = caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=2)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+
+    def _load(self):
+        self._db = {}
+        self.versao += 1
+        try:
+            with open(os.path.join(self.path, self.MANIFESTO), 'r', encoding='utf-8') as f:
+                self._resumo = {r['id']: r for r in json.load(f)}
+        except FileNotFoundError:
+            self._resumo = {}
+            if self.legado and os.path.exists(self.legado):
+                self._importar_legado()
+                return
+        except json.JSONDecodeError:
+            # Manifesto corrompido: reconstruído a partir dos arquivos existentes
+            self._resumo = {n[:-5]: {'id': n[:-5]} for n in os.listdir(self.path)
+                            if n.endswith('.json') and n != self.MANIFESTO}
+
+        for id in list(self._resumo):
+            try:
+                with open(self._caminho(id), 'r', encoding='utf-8') as f:
+                    dados = json.load(f)
+                camp = Campeonato.from_dict(dados)
+                self._db[camp.id] = camp
+                self._atualizar_resumo(dados)
+            except (json.JSONDecodeError, FileNotFoundError, KeyError, TypeError, ValueError) as e:
+                logger.warning("Arquivo do campeonato %s ignorado: %s", id, e)
+                del self._resumo[id]
+        self._mtime = self._mtime_arquivo()
+
+    def _importar_legado(self):
+        arquivo_unico = CampeonatoFileDAO(self.legado)
+        for camp in arquivo_unico.listar_todos():
+            self._db[camp.id] = camp
+        self._save()
+        logger.info("%d campeonato(s) importado(s) de %s para %s.", len(self._db), self.legado, self.path)
+
+    def _salvar_manifesto(self):
+        self._gravar_atomico(os.path.join(self.path, self.MANIFESTO), list(self._resumo.values()))
+
+    def _atualizar_resumo(self, dados: dict) -> bool:
+        resumo = {k: dados.get(k) for k in ('id', 'nome', 'ano', 'tipo')}
+        alterado = self._resumo.get(dados['id']) != resumo
+        self._resumo[dados['id']] = resumo
+        return alterado
+
+    def _save(self):
+        for camp in list(self._db.values()):
+            dados = camp.to_dict()
+            self._gravar_atomico(self._caminho(camp.id), dados)
+            self._atualizar_resumo(dados)
+        self._salvar_manifesto()
+        self._apos_gravar()
+
+    def _gravar(self, campeonato: Campeonato):
+        dados = campeonato.to_dict()
+        self._gravar_atomico(self._caminho(campeonato.id), dados)
+        if self._atualizar_resumo(dados):
+            self._salvar_manifesto()
+        self._apos_gravar()
+
+    def _apagar(self, id: str):
+        self._resumo.pop(id, None)
+        self._salvar_manifesto()
+        try:
+            os.remove(self._caminho(id))
+        except FileNotFoundError:
+            pass
+        self._apos_gravar()
+
+    def _gravar_lote(self, sujos: Dict[str, Campeonato | None]):
+        self._gravar_dados({id: camp.to_dict() if camp is not None else None for id, camp in sujos.items()})
+
+    def _guardar_dados(self, dados: Dict[str, dict | None]):
+        pass  # Cada campeonato tem seu arquivo: basta o lote
+
+    def _gravar_dados(self, lote: Dict[str, dict | None]):
+        for id, dados in lote.items():
+            if dados is None:
+                try:
+                    os.remove(self._caminho(id))
+                except FileNotFoundError:
+                    pass
+            else:
+                self._gravar_atomico(self._caminho(id), dados)
+        with self._trava:
+            manifesto_alterado = False
+            for id, dados in lote.items():
+                if dados is None:
+                    manifesto_alterado |= self._resumo.pop(id, None) is not None
+                else:
+                    manifesto_alterado |= self._atualizar_resumo(dados)
+            manifesto = list(self._resumo.values())
+        if manifesto_alterado:
+            self._gravar_atomico(os.path.join(self.path, self.MANIFESTO), manifesto)
+        self._apos_gravar()
+
+    def _ler_gravados(self, ids: set) -> Dict[str, dict]:
+        gravados = {}
+        for camp_id in ids:
+            try:
+                with open(self._caminho(camp_id), 'r', encoding='utf-8') as f:
+                    gravados[camp_id] = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                continue
+        return gravados
+
+    def listar_resumo(self) -> List[dict]:
+        """Id, nome, ano e tipo de cada campeonato, lidos do manifesto."""
+        return list(self._resumo.values())
+
+
+def abrir_dao(caminho: str = 'data/campeonatos.json') -> CampeonatoFileDAO:
+    """Abre o arquivo único (.json) ou o diretório com um arquivo por campeonato."""
+    if caminho.endswith('.json'):
+        return CampeonatoFileDAO(caminho)
+    return CampeonatoShardDAO(caminho)
@@ -0,0 +1,93 @@
+from typing import Dict
+import atexit
+import logging
+import threading
+import time
+from models.campeonato import Campeonato
+
+logger = logging.getLogger(__name__)
+
+
+class EscritaAssincrona:
+    """Gravação em segundo plano (write-behind) para os DAOs em arquivo.
+
+    `agendar` recebe o dict do campeonato já serializado pelo DAO (na thread
+    de quem salvou) e retorna; a thread só grava esses dicts, nunca os objetos
+    vivos, a cada `intervalo` segundos, com fsync. Salvamentos seguidos do
+    mesmo campeonato dentro do intervalo viram uma única escrita. Uma mesma
+    instância pode atender vários DAOs (uma por processo no app). No
+    encerramento do processo, os pendentes são gravados antes de sair.
+    """
+
+    def __init__(self, intervalo: float = 1.0):
+        self.intervalo = intervalo
+        self.ultimo_erro: Exception | None = None
+        self._pendentes: Dict[object, Dict[str, dict | None]] = {}  # dao -> id -> dict (None = excluído)
+        self._gravando: Dict[object, int] = {}
+        self._parar = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._executar, name="dao-escrita-assincrona", daemon=True)
+        self._thread.start()
+        atexit.register(self.encerrar)
+
+    def agendar(self, dao, dados: Dict[str, dict | None]) -> None:
+        with self._cond:
+            self._pendentes.setdefault(dao, {}).update(dados)
+            self._cond.notify_all()
+
+    def pendentes(self, dao=None) -> int:
+        """Campeonatos salvos na memória que ainda não chegaram ao disco (de um DAO ou de todos)."""
+        with self._cond:
+            if dao is not None:
+                return len(self._pendentes.get(dao, ())) + self._gravando.get(dao, 0)
+            return sum(map(len, self._pendentes.values())) + sum(self._gravando.values())
+
+    def _executar(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pendentes and not self._parar:
+                    self._cond.wait()
+                if self._parar and not self._pendentes:
+                    return
+                if not self._parar:
+                    # Janela de agrupamento: novos salvamentos no intervalo entram no mesmo lote
+                    limite = time.monotonic() + self.intervalo
+                    while not self._parar and (restante := limite - time.monotonic()) > 0:
+                        self._cond.wait(restante)
+                lotes, self._pendentes = self._pendentes, {}
+                self._gravando = {dao: len(lote) for dao, lote in lotes.items()}
+            for dao, lote in lotes.items():
+                self._gravar(dao, lote)
+
+    def _gravar(self, dao, lote: Dict[str, dict | None]) -> None:
+        try:
+            dao._gravar_dados(lote)
+            self.ultimo_erro = None
+            if dao._ouvintes:
+                # Os ouvintes recebem cópias montadas do que foi gravado, não os objetos da sessão
+                for id, dados in lote.items():
+                    dao._notificar(id, Campeonato.from_dict(dados) if dados is not None else None)
+        except Exception as e:
+            self.ultimo_erro = e
+            logger.exception("Erro na gravação assíncrona: %s", e)
+            with self._cond:
+                # Devolve o lote sem sobrescrever salvamentos mais novos
+                pendentes = self._pendentes.setdefault(dao, {})
+                for id, dados in lote.items():
+                    pendentes.setdefault(id, dados)
+        finally:
+            with self._cond:
+                self._gravando.pop(dao, None)
+                self._cond.notify_all()
+
+    def descarregar(self, timeout: float | None = None) -> bool:
+        """Bloqueia até que não haja gravações pendentes. Retorna False se esgotar o tempo."""
+        with self._cond:
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pendentes and not self._gravando, timeout)
+
+    def encerrar(self) -> None:
+        with self._cond:
+            self._parar = True
+            self._cond.notify_all()
+        self._thread.join()
@@ -0,0 +1,237 @@
+"""API HTTP somente leitura (JSON) sobre os modelos e o DAO.
+
+Uso: python -m services.api --porta 8080
+
+As respostas são serializadas uma única vez por versão dos dados e servidas
+com ETag forte; clientes que enviam If-None-Match recebem 304 sem corpo. O
+cache guarda as `TAMANHO_CACHE` respostas usadas mais recentemente, com chave
+na rota e nos parâmetros conhecidos (os demais são ignorados). Recarga dos
+dados e serialização rodam numa thread à parte, uma requisição por vez, para
+não travar o laço de eventos enquanto outras conexões são atendidas.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from models.campeonato import Campeonato
+from persistence.dao import CampeonatoFileDAO, abrir_dao
+
+PARAMETROS = ('campeonato_id', 'data_ini', 'data_fim', 'status', 'equipe_id', 'fase')
+TAMANHO_CACHE = 256
+
+STATUS_HTTP = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class ErroHTTP(Exception):
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+
+
+def equipe_json(posicao: int, e) -> dict:
+    return {
+        'posicao': posicao,
+        'id': e.id,
+        'nome': e.nome,
+        'pontos': e.pontos,
+        'jogos': e.vitorias + e.empates + e.derrotas,
+        'vitorias': e.vitorias,
+        'empates': e.empates,
+        'derrotas': e.derrotas,
+        'gols_marcados': e.gols_marcados,
+        'gols_sofridos': e.gols_sofridos,
+        'saldo_gols': e.saldo_gols,
+    }
+
+
+def jogo_json(camp: Campeonato, fase, jogo) -> dict:
+    return {
+        'id': jogo.id,
+        'campeonato_id': camp.id,
+        'fase': fase.nome,
+        'data': jogo.data.isoformat(),
+        'local': jogo.local,
+        'mandante': {'id': jogo.mandante.id, 'nome': jogo.mandante.nome},
+        'visitante': {'id': jogo.visitante.id, 'nome': jogo.visitante.nome},
+        'placar_mandante': jogo.placar_mandante,
+        'placar_visitante': jogo.placar_visitante,
+        'status': jogo.status,
+        'finalizada': jogo.finalizada,
+    }
+
+
+class ServidorAPI:
+    def __init__(self, dao: CampeonatoFileDAO, tamanho_cache: int = TAMANHO_CACHE):
+        self.dao = dao
+        self.tamanho_cache = tamanho_cache
+        self._versao_cache = None
+        self._cache: OrderedDict[str, Tuple[bytes, str]] = OrderedDict()
+        # Uma thread só: o DAO e o cache nunca são acessados em paralelo
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='api')
+
+    # Rotas -----------------------------------------------------------------
+
+    def _campeonato(self, camp_id: str) -> Campeonato:
+        camp = self.dao.buscar_por_id(camp_id)
+        if not camp:
+            raise ErroHTTP(404, f"Campeonato {camp_id} não encontrado.")
+        return camp
+
+    def _campeonatos_filtrados(self, params: dict):
+        camp_id = params.get('campeonato_id')
+        return [self._campeonato(camp_id)] if camp_id else self.dao.listar_todos()
+
+    def _listar_campeonatos(self, params: dict):
+        return [{'id': c.id, 'nome': c.nome, 'ano': c.ano, 'tipo': c.tipo} for c in self.dao.listar_todos()]
+
+    def _classificacao(self, camp_id: str):
+        camp = self._campeonato(camp_id)
+        return [equipe_json(i, e) for i, e in enumerate(camp.obter_classificacao(), 1)]
+
+    def _jogos(self, params: dict):
+        try:
+            data_ini = date.fromisoformat(params['data_ini']) if 'data_ini' in params else None
+            data_fim = date.fromisoformat(params['data_fim']) if 'data_fim' in params else None
+        except ValueError:
+            raise ErroHTTP(400, "Datas devem estar no formato AAAA-MM-DD.")
+        status = params.get('status')
+        equipe = params.get('equipe_id')
+        fase_nome = params.get('fase')
+
+        jogos = []
+        for camp in self._campeonatos_filtrados(params):
+            for fase in camp.fases:
+                if fase_nome and fase.nome != fase_nome:
+                    continue
+                for jogo in fase.jogos:
+                    if status and jogo.status != status:
+                        continue
+                    if equipe and equipe not in (jogo.mandante.id, jogo.visitante.id):
+                        continue
+                    dia = jogo.data.date()
+                    if (data_ini and dia < data_ini) or (data_fim and dia > data_fim):
+                        continue
+                    jogos.append(jogo_json(camp, fase, jogo))
+        return sorted(jogos, key=lambda j: j['data'])
+
+    def _artilharia(self, params: dict):
+        artilharia = []
+        for camp in self._campeonatos_filtrados(params):
+            artilharia += [dict(a, campeonato_id=camp.id) for a in camp.obter_artilharia()]
+        return sorted(artilharia, key=lambda a: (-a['gols'], a['jogador']))
+
+    def _rotear(self, caminho: str, params: dict):
+        partes = [unquote(p) for p in caminho.strip('/').split('/') if p]
+        if partes == ['campeonatos']:
+            return self._listar_campeonatos(params)
+        if len(partes) == 3 and partes[0] == 'campeonatos' and partes[2] == 'classificacao':
+            return self._classificacao(partes[1])
+        if partes == ['jogos']:
+            return self._jogos(params)
+        if partes == ['artilharia']:
+            return self._artilharia(params)
+        raise ErroHTTP(404, f"Rota {caminho} não encontrada.")
+
+    # Cache -----------------------------------------------------------------
+
+    def _corpo(self, alvo: str) -> Tuple[bytes, str]:
+        """Retorna (corpo, etag) pré-serializados para a versão atual dos dados."""
+        self.dao.recarregar_se_alterado()
+        if self._versao_cache != self.dao.versao:
+            self._cache.clear()
+            self._versao_cache = self.dao.versao
+
+        url = urlsplit(alvo)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items() if k in PARAMETROS}
+        chave = url.path.rstrip('/') + '?' + '&'.join(f"{k}={params[k]}" for k in sorted(params))
+        em_cache = self._cache.get(chave)
+        if em_cache is not None:
+            self._cache.move_to_end(chave)
+            return em_cache
+        corpo = json.dumps(self._rotear(url.path, params), ensure_ascii=False).encode('utf-8')
+        em_cache = (corpo, '"' + hashlib.sha1(corpo).hexdigest() + '"')
+        self._cache[chave] = em_cache
+        if len(self._cache) > self.tamanho_cache:
+            self._cache.popitem(last=False)  # Descarta a usada há mais tempo
+        return em_cache
+
+    def responder(self, metodo: str, alvo: str, cabecalhos: dict) -> Tuple[int, dict, bytes]:
+        if metodo not in ('GET', 'HEAD'):
+            return self._erro(405, "Somente GET é suportado.")
+        try:
+            corpo, etag = self._corpo(alvo)
+        except ErroHTTP as e:
+            return self._erro(e.status, str(e))
+
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Content-Type': 'application/json; charset=utf-8'}
+        etags_cliente = [t.strip() for t in cabecalhos.get('if-none-match', '').split(',')]
+        if etag in etags_cliente or '*' in etags_cliente:
+            return 304, headers, b''
+        # HEAD informa o tamanho que o GET teria
+        headers['Content-Length'] = str(len(corpo))
+        return 200, headers, corpo if metodo == 'GET' else b''
+
+    @staticmethod
+    def _erro(status: int, mensagem: str) -> Tuple[int, dict, bytes]:
+        corpo = json.dumps({'erro': mensagem}, ensure_ascii=False).encode('utf-8')
+        return status, {'Content-Type': 'application/json; charset=utf-8'}, corpo
+
+    # Servidor --------------------------------------------------------------
+
+    async def _tratar_conexao(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                linha = await reader.readline()
+                if not linha:
+                    break
+                try:
+                    metodo, alvo, versao_http = linha.decode('latin-1').split()
+                except ValueError:
+                    status, headers, corpo = self._erro(400, "Requisição inválida.")
+                    versao_http, cabecalhos = 'HTTP/1.0', {}
+                else:
+                    cabecalhos = {}
+                    while (cab := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        nome, _, valor = cab.decode('latin-1').partition(':')
+                        cabecalhos[nome.strip().lower()] = valor.strip()
+                    status, headers, corpo = await asyncio.get_running_loop().run_in_executor(
+                        self._executor, self.responder, metodo, alvo, cabecalhos)
+
+                manter = versao_http == 'HTTP/1.1' and cabecalhos.get('connection', '').lower() != 'close'
+                headers.setdefault('Content-Length', str(len(corpo)))
+                headers['Connection'] = 'keep-alive' if manter else 'close'
+                cabecalho = f"HTTP/1.1 {status} {STATUS_HTTP[status]}\r\n"
+                cabecalho += ''.join(f"{k}: {v}\r\n" for k, v in headers.items()) + "\r\n"
+                writer.write(cabecalho.encode('latin-1') + corpo)
+                await writer.drain()
+                if not manter:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def servir(self, host: str = '0.0.0.0', porta: int = 8080):
+        servidor = await asyncio.start_server(self._tratar_conexao, host, porta)
+        print(f"[API] Servindo em http://{host}:{porta}")
+        async with servidor:
+            await servidor.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API HTTP somente leitura do campeonato.")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--porta', type=int, default=8080)
+    parser.add_argument('--arquivo', default='data/campeonatos.json',
+                        help="Arquivo .json único ou diretório com um arquivo por campeonato")
+    args = parser.parse_args()
+    asyncio.run(ServidorAPI(abrir_dao(args.arquivo)).servir(args.host, args.porta))
+
+
+if __name__ == '__main__':
+    main()
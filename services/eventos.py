@@ -0,0 +1,91 @@
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List
+from models.campeonato import Campeonato
+from models.partida import Jogo
+
+TIPOS_EVENTO = ("gol", "status")
+
+
+@dataclass
+class EventoPartida:
+    """Evento publicado para uma partida, com o estado completo após a mudança."""
+    tipo: str
+    campeonato_id: str
+    jogo_id: str
+    versao: int
+    mandante: str
+    visitante: str
+    placar_mandante: int
+    placar_visitante: int
+    status: str
+    momento: datetime = field(default_factory=datetime.now)
+
+
+class CanalPartidas:
+    """Canal em processo para eventos de partidas, lido por polling.
+
+    Mantém o último evento e um contador de versão por jogo e por campeonato,
+    de modo que os leitores só comparam inteiros; `publicar` pode ser chamado
+    de qualquer thread. Como o canal só conhece o que foi publicado, `semear`
+    carrega os jogos que já estavam ao vivo quando o processo começou.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ultimos: Dict[str, EventoPartida] = {}
+        self._versoes_camp: Dict[str, int] = {}
+        self.semeado = False
+
+    def publicar(self, tipo: str, campeonato_id: str, jogo: Jogo) -> EventoPartida:
+        if tipo not in TIPOS_EVENTO:
+            raise ValueError(f"Tipo de evento inválido: {tipo}")
+        with self._lock:
+            anterior = self._ultimos.get(jogo.id)
+            evento = EventoPartida(
+                tipo=tipo,
+                campeonato_id=campeonato_id,
+                jogo_id=jogo.id,
+                versao=(anterior.versao + 1) if anterior else 1,
+                mandante=jogo.mandante.nome,
+                visitante=jogo.visitante.nome,
+                placar_mandante=jogo.placar_mandante,
+                placar_visitante=jogo.placar_visitante,
+                status=jogo.status,
+            )
+            self._ultimos[jogo.id] = evento
+            self._versoes_camp[campeonato_id] = self._versoes_camp.get(campeonato_id, 0) + 1
+        return evento
+
+    def semear(self, campeonatos: Iterable[Campeonato]) -> int:
+        """Publica o estado dos jogos "Ao vivo" gravados que o canal ainda não
+        conhece (ex.: após reiniciar o app). Retorna quantos foram publicados."""
+        publicados = 0
+        for camp in campeonatos:
+            for fase in camp.fases:
+                for jogo in fase.jogos:
+                    if jogo.status == "Ao vivo" and jogo.id not in self._ultimos:
+                        self.publicar("status", camp.id, jogo)
+                        publicados += 1
+        self.semeado = True
+        return publicados
+
+    def versao(self, jogo_id: str) -> int:
+        evento = self._ultimos.get(jogo_id)
+        return evento.versao if evento else 0
+
+    def versao_campeonato(self, campeonato_id: str) -> int:
+        return self._versoes_camp.get(campeonato_id, 0)
+
+    def ultimo(self, jogo_id: str) -> EventoPartida | None:
+        return self._ultimos.get(jogo_id)
+
+    def ao_vivo(self, campeonato_id: str) -> List[EventoPartida]:
+        with self._lock:
+            return [e for e in self._ultimos.values()
+                    if e.campeonato_id == campeonato_id and e.status == "Ao vivo"]
+
+
+# Instância única por processo, compartilhada por todas as sessões do Streamlit
+canal_partidas = CanalPartidas()
@@ -0,0 +1,285 @@
+"""Verificação e reparo da consistência dos campeonatos gravados.
+
+Cada campeonato é lido e verificado em um processo de um pool, direto do
+arquivo (ou do arquivo do campeonato, no armazenamento em diretório), de
+modo que a montagem dos objetos também é feita em paralelo. Os processos
+devolvem só as violações; o reparo é feito depois, nos objetos do DAO, e
+os campeonatos corrigidos são gravados juntos em uma única transação.
+
+O placar é conferido no dict gravado: ao montar o `Jogo`, o placar de uma
+partida em aberto é refeito a partir dos gols e o de uma finalizada é
+completado com gols sem autor, o que esconderia a divergência.
+"""
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List
+from models.campeonato import Campeonato
+from models.partida import TIPOS_GOL
+from models.registro_jogadores import normalizar_nome
+from persistence.dao import CampeonatoFileDAO, CampeonatoShardDAO
+from utils.exceptions import PlacarInconsistente
+
+# tipo -> (descrição, reparável)
+TIPOS = {
+    'equipe_nao_inscrita': ("Equipe do jogo não está entre as inscritas", True),
+    'contadores': ("Contadores da equipe diferentes dos resultados", True),
+    'escalacao_jogador_removido': ("Escalação com jogador que não está no elenco", True),
+    'nome_jogador_desatualizado': ("Evento com nome de jogador desatualizado", True),
+    'placar': ("Placar diferente dos gols registrados", True),
+    'gol_sem_equipe': ("Gol de equipe que não está no jogo", False),
+    'jogo_duplicado': ("Jogo com id repetido", False),
+}
+
+# Dicts do arquivo único; com fork, os processos os herdam sem serialização
+_DADOS: List[dict] = []
+
+
+@dataclass
+class Violacao:
+    tipo: str
+    campeonato_id: str
+    campeonato: str
+    descricao: str
+    reparavel: bool = True
+    jogo_id: str = ""
+
+
+@dataclass
+class RelatorioIntegridade:
+    campeonatos: int = 0
+    violacoes: List[Violacao] = field(default_factory=list)
+    reparos: Dict[str, int] = field(default_factory=dict)  # tipo -> correções aplicadas
+
+    def por_tipo(self) -> Dict[str, int]:
+        contagem: Dict[str, int] = {}
+        for v in self.violacoes:
+            contagem[v.tipo] = contagem.get(v.tipo, 0) + 1
+        return contagem
+
+
+def _descricao_jogo(fase, jogo) -> str:
+    return f"{fase.nome}: {jogo.mandante.nome} x {jogo.visitante.nome}"
+
+
+def _jogadores(camp: Campeonato) -> dict:
+    return {j.id: j for e in camp.equipes_inscritas for j in e.elenco}
+
+
+def _equipe_por_nome(camp: Campeonato, equipe):
+    """A equipe inscrita de mesmo nome, se houver exatamente uma."""
+    nome = normalizar_nome(equipe.nome)
+    candidatas = [e for e in camp.equipes_inscritas if normalizar_nome(e.nome) == nome]
+    return candidatas[0] if len(candidatas) == 1 else None
+
+
+def _placares_gravados(dados: dict) -> Dict[str, tuple]:
+    """jogo_id -> (placar gravado, gols registrados), lidos do dict do campeonato."""
+    placares = {}
+    for fase in dados.get('fases', []):
+        for jogo in fase.get('jogos', []):
+            if 'eventos' in jogo:
+                gols = [e for e in jogo['eventos'] if e.get('tipo') in TIPOS_GOL]
+            else:
+                gols = jogo.get('gols', [])  # Arquivos anteriores ao registro de eventos
+            g_mandante = sum(1 for g in gols if g.get('equipe_id') == jogo['mandante']['id'])
+            placares[jogo['id']] = ((jogo.get('placar_mandante', 0), jogo.get('placar_visitante', 0)),
+                                    (g_mandante, len(gols) - g_mandante))
+    return placares
+
+
+def verificar(camp: Campeonato, dados: dict | None = None) -> List[Violacao]:
+    """Violações de consistência do campeonato. Com `dados` (o dict de que o
+    campeonato foi montado), o placar é conferido no que está gravado."""
+    violacoes = []
+    placares = _placares_gravados(dados) if dados is not None else {}
+
+    def registrar(tipo, descricao, reparavel=True, jogo_id=""):
+        violacoes.append(Violacao(tipo, camp.id, camp.nome, descricao, reparavel and TIPOS[tipo][1], jogo_id))
+
+    inscritas = {e.id for e in camp.equipes_inscritas}
+    jogadores = _jogadores(camp)
+    vistos = set()
+    for fase in camp.fases:
+        for jogo in fase.jogos:
+            descricao = _descricao_jogo(fase, jogo)
+            if jogo.id in vistos:
+                registrar('jogo_duplicado', f"{descricao} ({jogo.id})")
+            vistos.add(jogo.id)
+            for equipe in (jogo.mandante, jogo.visitante):
+                if equipe.id not in inscritas:
+                    inscrita = _equipe_por_nome(camp, equipe)
+                    registrar('equipe_nao_inscrita', f"{descricao}: {equipe.nome} não está inscrita"
+                              + ("" if inscrita else " (sem equipe inscrita de mesmo nome)"), bool(inscrita))
+            for equipe, escalacao in ((jogo.mandante, jogo.escalacao_mandante),
+                                      (jogo.visitante, jogo.escalacao_visitante)):
+                elenco = {j.id for j in equipe.elenco}
+                fora = [i for i in escalacao.titulares + escalacao.reservas if i not in elenco]
+                if fora:
+                    registrar('escalacao_jogador_removido',
+                              f"{descricao}: {len(fora)} jogador(es) de {equipe.nome} fora do elenco")
+            lados = (jogo.mandante.id, jogo.visitante.id)
+            for evento in jogo.eventos:
+                jogador = jogadores.get(evento.jogador_id)
+                if jogador and evento.jogador_nome != jogador.nome:
+                    registrar('nome_jogador_desatualizado',
+                              f"{descricao}: '{evento.jogador_nome}' agora é '{jogador.nome}'")
+            if any(g.equipe_id not in lados for g in jogo.gols):
+                registrar('gol_sem_equipe', descricao)
+            if jogo.id in placares:
+                placar, gols = placares[jogo.id]
+            else:
+                gols_mandante = sum(1 for g in jogo.gols if g.equipe_id == jogo.mandante.id)
+                placar = (jogo.placar_mandante, jogo.placar_visitante)
+                gols = (gols_mandante, len(jogo.gols) - gols_mandante)
+            if placar != gols:
+                registrar('placar', f"{descricao}: placar {placar[0]} x {placar[1]}, gols {gols[0]} x {gols[1]}",
+                          jogo_id=jogo.id)
+    esperados = camp.contadores_esperados()
+    for equipe in camp.equipes_inscritas:
+        diferentes = [f"{k} {getattr(equipe, k)} (esperado {v})" for k, v in esperados[equipe.id].items()
+                      if getattr(equipe, k) != v]
+        if diferentes:
+            registrar('contadores', f"{equipe.nome}: {', '.join(diferentes)}")
+    return violacoes
+
+
+def reparar(camp: Campeonato, placares: set = frozenset()) -> Dict[str, int]:
+    """Corrige as violações reparáveis; retorna a quantidade de correções por tipo.
+    `placares` são os jogos com placar divergente no arquivo, que a montagem
+    dos objetos já conciliou e só precisam ser gravados. Os contadores são
+    refeitos por último, já com placares e equipes corrigidos."""
+    reparos: Dict[str, int] = {}
+
+    def contar(tipo, n=1):
+        if n:
+            reparos[tipo] = reparos.get(tipo, 0) + n
+
+    inscritas = {e.id for e in camp.equipes_inscritas}
+    jogadores = _jogadores(camp)
+    for fase in camp.fases:
+        for jogo in fase.jogos:
+            # Equipe desligada das inscritas: religa pelo nome e leva junto os eventos
+            for lado in ('mandante', 'visitante'):
+                equipe = getattr(jogo, lado)
+                inscrita = _equipe_por_nome(camp, equipe) if equipe.id not in inscritas else None
+                if inscrita:
+                    for evento in jogo.eventos:
+                        if evento.equipe_id == equipe.id:
+                            evento.equipe_id = inscrita.id
+                    setattr(jogo, lado, inscrita)
+                    contar('equipe_nao_inscrita')
+
+            escalacao_alterada = False
+            for equipe, escalacao in ((jogo.mandante, jogo.escalacao_mandante),
+                                      (jogo.visitante, jogo.escalacao_visitante)):
+                elenco = {j.id for j in equipe.elenco}
+                antes = len(escalacao.titulares) + len(escalacao.reservas)
+                escalacao.titulares = [i for i in escalacao.titulares if i in elenco]
+                escalacao.reservas = [i for i in escalacao.reservas if i in elenco]
+                removidos = antes - len(escalacao.titulares) - len(escalacao.reservas)
+                contar('escalacao_jogador_removido', 1 if removidos else 0)
+                escalacao_alterada |= bool(removidos)
+            if escalacao_alterada:
+                camp.indexar_escalacao(jogo)
+
+            for evento in jogo.eventos:
+                jogador = jogadores.get(evento.jogador_id)
+                if jogador and evento.jogador_nome != jogador.nome:
+                    evento.jogador_nome = jogador.nome
+                    contar('nome_jogador_desatualizado')
+
+            oficial = (jogo.placar_mandante, jogo.placar_visitante)
+            if jogo.reprojetar_placar():
+                if jogo.finalizada:
+                    # O placar digitado prevalece se a sobra for de gols sem autor
+                    try:
+                        jogo.corrigir_resultado(*oficial)
+                    except PlacarInconsistente:
+                        pass
+                contar('placar')
+            elif jogo.id in placares:
+                contar('placar')
+
+    contar('contadores', len(camp.recalcular_classificacao()))
+    return reparos
+
+
+def _verificar_campeonato(item: int | dict | str) -> List[Violacao]:
+    """Tarefa de um processo do pool: lê e verifica um campeonato (índice em
+    `_DADOS`, dict ou caminho do arquivo)."""
+    if isinstance(item, int):
+        item = _DADOS[item]
+    elif isinstance(item, str):
+        with open(item, 'r', encoding='utf-8') as f:
+            item = json.load(f)
+    return verificar(Campeonato.from_dict(item), item)
+
+
+def _itens(caminho: str, filtro: str | None = None) -> List[dict | str]:
+    """Campeonatos do armazenamento: os dicts do arquivo único ou os caminhos
+    dos arquivos do diretório (lidos pelos próprios processos). `filtro`
+    restringe a um campeonato pelo id ou nome."""
+    if caminho.endswith('.json'):
+        try:
+            with open(caminho, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+        except FileNotFoundError:
+            return []
+        return [d for d in dados if not filtro or filtro in (d.get('id'), d.get('nome'))]
+    if not os.path.isdir(caminho):
+        return []
+    ids = [n[:-5] for n in os.listdir(caminho) if n.endswith('.json') and n != CampeonatoShardDAO.MANIFESTO]
+    if filtro:
+        try:
+            with open(os.path.join(caminho, CampeonatoShardDAO.MANIFESTO), 'r', encoding='utf-8') as f:
+                nomes = {r['id']: r.get('nome') for r in json.load(f)}
+        except (FileNotFoundError, json.JSONDecodeError):
+            nomes = {}
+        ids = [i for i in ids if filtro in (i, nomes.get(i))]
+    return [os.path.join(caminho, f"{i}.json") for i in sorted(ids)]
+
+
+def verificar_armazenamento(caminho: str, processos: int | None = None,
+                            filtro: str | None = None) -> RelatorioIntegridade:
+    """Verifica os campeonatos do arquivo .json ou diretório. `processos` limita
+    o pool (padrão: um por CPU); com um só processo, roda no próprio."""
+    itens = _itens(caminho, filtro)
+    relatorio = RelatorioIntegridade(campeonatos=len(itens))
+    processos = min(processos or os.cpu_count() or 1, len(itens))
+    if processos <= 1:
+        resultados = map(_verificar_campeonato, itens)
+        for violacoes in resultados:
+            relatorio.violacoes += violacoes
+        return relatorio
+    fork = 'fork' in multiprocessing.get_all_start_methods()
+    if fork and caminho.endswith('.json'):
+        _DADOS[:] = itens
+        itens = list(range(len(itens)))
+    try:
+        with ProcessPoolExecutor(processos, mp_context=multiprocessing.get_context('fork') if fork else None) as pool:
+            for violacoes in pool.map(_verificar_campeonato, itens):
+                relatorio.violacoes += violacoes
+    finally:
+        _DADOS.clear()
+    return relatorio
+
+
+def reparar_campeonatos(dao: CampeonatoFileDAO, relatorio: RelatorioIntegridade) -> List[Campeonato]:
+    """Repara, nos objetos do DAO, os campeonatos com violações reparáveis do
+    relatório e soma as correções em `relatorio.reparos`. Retorna os alterados,
+    para serem gravados juntos."""
+    alterados = []
+    for camp_id in dict.fromkeys(v.campeonato_id for v in relatorio.violacoes if v.reparavel):
+        camp = dao.buscar_por_id(camp_id)
+        if camp is None:
+            continue
+        placares = {v.jogo_id for v in relatorio.violacoes if v.campeonato_id == camp_id and v.tipo == 'placar'}
+        reparos = reparar(camp, placares)
+        for tipo, n in reparos.items():
+            relatorio.reparos[tipo] = relatorio.reparos.get(tipo, 0) + n
+        if reparos:
+            alterados.append(camp)
+    return alterados
@@ -0,0 +1,435 @@
+"""Operações em lote sem a interface, para tarefas agendadas.
+
+Uso: python -m services.operacoes [--arquivo data/campeonatos.json] <comando> [opções]
+
+    exportar    grava campeonatos, equipes, jogadores, jogos, escalações e eventos
+                (gols, cartões e status) em CSV ou JSON Lines
+    importar    lê os mesmos arquivos, criando ou atualizando pelo id
+    recalcular  refaz os contadores das equipes a partir dos jogos finalizados
+    migrar      regrava os dados no formato atual (opcionalmente em outro armazenamento)
+    validar     verifica a consistência dos dados em paralelo e, com --reparar, corrige;
+                sai com código 1 se restarem problemas
+
+Cada comando carrega os dados uma vez, grava uma vez (em uma transação do
+DAO) e informa o tempo de cada etapa. Os arquivos são lidos e escritos linha
+a linha, sem montar o conjunto inteiro em memória.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Tuple
+from models.campeonato import Campeonato, Fase
+from models.equipe import Equipe
+from models.jogador import Jogador
+from models.partida import Escalacao, EventoJogo, Jogo, TIPOS_CARTAO, TIPOS_GOL
+from persistence.dao import CampeonatoFileDAO, CampeonatoShardDAO, abrir_dao
+from services.integridade import TIPOS, reparar_campeonatos, verificar_armazenamento
+from utils.exceptions import AppError
+
+COLUNAS = {
+    'campeonatos': ['id', 'nome', 'ano', 'tipo'],
+    'equipes': ['campeonato_id', 'id', 'nome', 'tecnico'],
+    'jogadores': ['campeonato_id', 'equipe_id', 'id', 'nome', 'numero', 'posicao', 'pessoa_id'],
+    'jogos': ['campeonato_id', 'fase_id', 'fase', 'fase_ordem', 'fase_tipo', 'grupo', 'id', 'mandante_id', 'visitante_id',
+              'data', 'local', 'status', 'placar_mandante', 'placar_visitante', 'publico', 'observacoes'],
+    'escalacoes': ['campeonato_id', 'jogo_id', 'lado', 'id', 'titulares', 'reservas'],
+    'eventos': ['campeonato_id', 'jogo_id', 'id', 'tipo', 'minuto', 'equipe_id', 'jogador_id', 'jogador_nome',
+                'status'],
+}
+# Colunas convertidas na importação -> (conversão, obrigatória); validadas ao ler cada linha
+CONVERSOES = {
+    'campeonatos': {'ano': (int, False)},
+    'jogadores': {'numero': (int, False)},
+    'jogos': {'data': (datetime.fromisoformat, True), 'fase_ordem': (int, False), 'placar_mandante': (int, False),
+              'placar_visitante': (int, False), 'publico': (int, False)},
+    'eventos': {'minuto': (int, False)},
+}
+EXTENSOES = {'csv': '.csv', 'json': '.jsonl'}
+SEPARADOR_IDS = ';'  # Ids de jogadores de titulares/reservas em uma só coluna
+
+
+@dataclass
+class Resultado:
+    relatorio: List[str] = field(default_factory=list)
+    alterados: List[Campeonato] = field(default_factory=list)  # Gravados em uma transação ao final
+    destino: CampeonatoFileDAO | None = None  # Onde gravar, se não no DAO carregado (migrar --destino, validar)
+    codigo: int = 0
+
+
+def _selecionar(dao: CampeonatoFileDAO, filtro: str | None) -> List[Campeonato]:
+    """Todos os campeonatos, ou os de id ou nome igual ao filtro."""
+    camps = dao.listar_todos()
+    if filtro:
+        camps = [c for c in camps if filtro in (c.id, c.nome)]
+        if not camps:
+            raise AppError(f"Campeonato '{filtro}' não encontrado.")
+    return camps
+
+
+# Linhas ------------------------------------------------------------------
+
+def _linhas(entidade: str, camps: List[Campeonato]) -> Iterator[dict]:
+    for camp in camps:
+        if entidade == 'campeonatos':
+            yield {'id': camp.id, 'nome': camp.nome, 'ano': camp.ano, 'tipo': camp.tipo}
+        elif entidade == 'equipes':
+            for e in camp.equipes_inscritas:
+                yield {'campeonato_id': camp.id, 'id': e.id, 'nome': e.nome, 'tecnico': e.tecnico}
+        elif entidade == 'jogadores':
+            for e in camp.equipes_inscritas:
+                for j in e.elenco:
+                    yield {'campeonato_id': camp.id, 'equipe_id': e.id, 'id': j.id, 'nome': j.nome,
+                           'numero': j.numero, 'posicao': j.posicao, 'pessoa_id': j.pessoa_id}
+        else:
+            for fase in camp.fases:
+                for jogo in fase.jogos:
+                    if entidade == 'jogos':
+                        yield {'campeonato_id': camp.id, 'fase_id': fase.id, 'fase': fase.nome, 'fase_ordem': fase.ordem,
+                               'fase_tipo': fase.tipo, 'grupo': fase.grupo, 'id': jogo.id,
+                               'mandante_id': jogo.mandante.id, 'visitante_id': jogo.visitante.id,
+                               'data': jogo.data.isoformat(), 'local': jogo.local, 'status': jogo.status,
+                               'placar_mandante': jogo.placar_mandante, 'placar_visitante': jogo.placar_visitante,
+                               'publico': jogo.publico, 'observacoes': jogo.observacoes}
+                    elif entidade == 'escalacoes':
+                        for lado in ('mandante', 'visitante'):
+                            escalacao = getattr(jogo, 'escalacao_' + lado)
+                            yield {'campeonato_id': camp.id, 'jogo_id': jogo.id, 'lado': lado, 'id': escalacao.id,
+                                   'titulares': SEPARADOR_IDS.join(escalacao.titulares),
+                                   'reservas': SEPARADOR_IDS.join(escalacao.reservas)}
+                    else:
+                        for evento in jogo.eventos:
+                            yield {'campeonato_id': camp.id, 'jogo_id': jogo.id, 'id': evento.id,
+                                   'tipo': evento.tipo, 'minuto': evento.minuto, 'equipe_id': evento.equipe_id,
+                                   'jogador_id': evento.jogador_id, 'jogador_nome': evento.jogador_nome,
+                                   'status': evento.status}
+
+
+def _escrever_linhas(caminho: str, formato: str, colunas: List[str], linhas: Iterable[dict]) -> int:
+    total = 0
+    with open(caminho, 'w', encoding='utf-8', newline='') as f:
+        if formato == 'csv':
+            escritor = csv.DictWriter(f, colunas)
+            escritor.writeheader()
+            for linha in linhas:
+                escritor.writerow(linha)
+                total += 1
+        else:
+            for linha in linhas:
+                f.write(json.dumps(linha, ensure_ascii=False) + '\n')
+                total += 1
+    return total
+
+
+def _ler_linhas(caminho: str, formato: str, entidade: str | None = None) -> Iterator[dict]:
+    """Linhas do arquivo, uma por vez; arquivo ausente não tem linhas. Com a
+    entidade, valida as colunas de `CONVERSOES` e aponta a linha com erro."""
+    if not os.path.exists(caminho):
+        return
+    conversoes = CONVERSOES.get(entidade, {})
+    with open(caminho, 'r', encoding='utf-8', newline='') as f:
+        if formato == 'csv':
+            leitor = csv.DictReader(f)
+            linhas = ((leitor.line_num, linha) for linha in leitor)
+        else:
+            linhas = ((numero, texto) for numero, texto in enumerate(f, 1) if texto.strip())
+        for numero, linha in linhas:
+            if formato != 'csv':
+                try:
+                    linha = json.loads(linha)
+                except json.JSONDecodeError as e:
+                    raise AppError(f"{caminho}, linha {numero}: JSON inválido ({e.msg}).")
+            for coluna, (converter, obrigatoria) in conversoes.items():
+                valor = linha.get(coluna)
+                if valor in (None, '') and not obrigatoria:
+                    continue
+                try:
+                    converter(valor)
+                except (TypeError, ValueError):
+                    raise AppError(f"{caminho}, linha {numero}: valor inválido em '{coluna}': {valor!r}.")
+            yield linha
+
+
+def _inteiro(valor, padrao: int = 0) -> int:
+    return int(valor) if valor not in (None, '') else padrao
+
+
+def _ids(valor) -> List[str]:
+    return [i for i in (valor or '').split(SEPARADOR_IDS) if i]
+
+
+# Comandos ----------------------------------------------------------------
+
+def exportar(dao: CampeonatoFileDAO, args) -> Resultado:
+    camps = _selecionar(dao, args.campeonato)
+    os.makedirs(args.destino, exist_ok=True)
+    resultado = Resultado()
+    for entidade, colunas in COLUNAS.items():
+        caminho = os.path.join(args.destino, entidade + EXTENSOES[args.formato])
+        total = _escrever_linhas(caminho, args.formato, colunas, _linhas(entidade, camps))
+        resultado.relatorio.append(f"{total} linha(s) em {caminho}")
+    return resultado
+
+
+def importar(dao: CampeonatoFileDAO, args) -> Resultado:
+    """Campeonatos, equipes e jogadores existentes são atualizados; jogos já
+    existentes são mantidos (e suas escalações e eventos ignorados). Os novos
+    são montados com escalações, registro de eventos, status e placar do
+    arquivo, e os contadores das equipes dos campeonatos com novos jogos
+    finalizados são refeitos a partir dos resultados."""
+    resultado = Resultado()
+    camps: Dict[str, Campeonato] = {c.id: c for c in dao.listar_todos()}
+    equipes = {(c.id, e.id): e for c in camps.values() for e in c.equipes_inscritas}
+    jogadores = {(e.id, j.id): j for e in equipes.values() for j in e.elenco}
+    fases = {(c.id, f.nome): f for c in camps.values() for f in c.fases}
+    jogos_existentes = {j.id for c in camps.values() for f in c.fases for j in f.jogos}
+    novos: Dict[str, Tuple[Campeonato, Fase, Equipe, Equipe, dict]] = {}
+    escalacoes: Dict[Tuple[str, str], Escalacao] = {}
+    eventos: Dict[str, List[EventoJogo]] = {}
+    alterados: Dict[str, Campeonato] = {}
+    contagem = dict.fromkeys(COLUNAS, 0)
+    ignoradas = dict.fromkeys(COLUNAS, 0)
+
+    def arquivo(entidade):
+        return _ler_linhas(os.path.join(args.origem, entidade + EXTENSOES[args.formato]), args.formato, entidade)
+
+    for linha in arquivo('campeonatos'):
+        camp = camps.get(linha['id'])
+        if camp is None:
+            camp = camps[linha['id']] = Campeonato(linha['nome'], _inteiro(linha['ano']), id=linha['id'])
+        camp.nome, camp.ano = linha['nome'], _inteiro(linha['ano'], camp.ano)
+        camp.tipo = linha.get('tipo') or camp.tipo
+        alterados[camp.id] = camp
+        contagem['campeonatos'] += 1
+
+    for linha in arquivo('equipes'):
+        camp = camps.get(linha['campeonato_id'])
+        if camp is None:
+            ignoradas['equipes'] += 1
+            continue
+        equipe = equipes.get((camp.id, linha['id']))
+        if equipe is None:
+            equipe = equipes[camp.id, linha['id']] = Equipe(linha['nome'], linha.get('tecnico', ''), id=linha['id'])
+            camp.cadastrar_equipe(equipe)
+        equipe.nome, equipe.tecnico = linha['nome'], linha.get('tecnico') or equipe.tecnico
+        alterados[camp.id] = camp
+        contagem['equipes'] += 1
+
+    for linha in arquivo('jogadores'):
+        equipe = equipes.get((linha['campeonato_id'], linha['equipe_id']))
+        if equipe is None:
+            ignoradas['jogadores'] += 1
+            continue
+        jogador = jogadores.get((equipe.id, linha['id']))
+        if jogador is None:
+            jogador = jogadores[equipe.id, linha['id']] = Jogador(linha['nome'], 0, '', id=linha['id'])
+            equipe.contratar_jogador(jogador)
+        jogador.nome, jogador.numero, jogador.posicao = linha['nome'], _inteiro(linha['numero']), linha['posicao']
+        jogador.pessoa_id = linha.get('pessoa_id') or jogador.pessoa_id
+        alterados[linha['campeonato_id']] = camps[linha['campeonato_id']]
+        contagem['jogadores'] += 1
+
+    for linha in arquivo('jogos'):
+        camp = camps.get(linha['campeonato_id'])
+        mandante = equipes.get((linha['campeonato_id'], linha['mandante_id']))
+        visitante = equipes.get((linha['campeonato_id'], linha['visitante_id']))
+        if linha['id'] in jogos_existentes or linha['id'] in novos or not (camp and mandante and visitante):
+            ignoradas['jogos'] += 1
+            continue
+        fase = fases.get((camp.id, linha['fase']))
+        if fase is None:
+            fase = fases[camp.id, linha['fase']] = Fase(linha['fase'], _inteiro(linha.get('fase_ordem'), 1),
+                                                        linha.get('fase_tipo') or "Corridos",
+                                                        linha.get('grupo') or "")
+            fase.id = linha.get('fase_id') or fase.id
+            camp.adicionar_fase(fase)
+        novos[linha['id']] = (camp, fase, mandante, visitante, linha)
+        alterados[camp.id] = camp
+        contagem['jogos'] += 1
+
+    for linha in arquivo('escalacoes'):
+        if linha['jogo_id'] not in novos or linha['lado'] not in ('mandante', 'visitante'):
+            ignoradas['escalacoes'] += 1
+            continue
+        escalacoes[linha['jogo_id'], linha['lado']] = Escalacao(_ids(linha['titulares']), _ids(linha['reservas']),
+                                                                id=linha['id'])
+        contagem['escalacoes'] += 1
+
+    for linha in arquivo('eventos'):
+        novo = novos.get(linha['jogo_id'])
+        valido = novo is not None and (linha['tipo'] == "status" or (
+            linha['tipo'] in TIPOS_GOL + TIPOS_CARTAO and linha['equipe_id'] in (novo[2].id, novo[3].id)))
+        if not valido:
+            ignoradas['eventos'] += 1
+            continue
+        eventos.setdefault(linha['jogo_id'], []).append(EventoJogo(
+            linha['tipo'], minuto=_inteiro(linha['minuto']), equipe_id=linha.get('equipe_id') or "",
+            jogador_id=linha.get('jogador_id') or "", jogador_nome=linha.get('jogador_nome') or "",
+            status=linha.get('status') or "", id=linha['id']))
+        contagem['eventos'] += 1
+
+    # Jogos montados como na leitura do arquivo: o registro de eventos vem inteiro
+    recalcular_ids = set()
+    for jogo_id, (camp, fase, mandante, visitante, linha) in novos.items():
+        status = linha.get('status') or "Agendada"
+        jogo = Jogo(mandante, visitante, datetime.fromisoformat(linha['data']), linha['local'],
+                    placar_mandante=_inteiro(linha.get('placar_mandante')),
+                    placar_visitante=_inteiro(linha.get('placar_visitante')),
+                    finalizada=status == "Finalizada", status=status,
+                    publico=_inteiro(linha.get('publico')), observacoes=linha.get('observacoes') or "",
+                    escalacao_mandante=escalacoes.get((jogo_id, 'mandante'), Escalacao()),
+                    escalacao_visitante=escalacoes.get((jogo_id, 'visitante'), Escalacao()),
+                    eventos=eventos.get(jogo_id, []), id=jogo_id)
+        fase.adicionar_jogo(jogo)
+        camp.indexar_escalacao(jogo)
+        if jogo.finalizada:
+            recalcular_ids.add(camp.id)
+            gols_mandante = sum(1 for g in jogo.gols if g.equipe_id == mandante.id)
+            if (jogo.placar_mandante, jogo.placar_visitante) != (gols_mandante, len(jogo.gols) - gols_mandante):
+                resultado.relatorio.append(f"Jogo {jogo_id}: placar diferente dos gols registrados "
+                                           f"(corrija com validar --reparar)")
+    for camp_id in recalcular_ids:
+        camps[camp_id].recalcular_classificacao()
+
+    resultado.alterados = list(alterados.values())
+    for entidade in COLUNAS:
+        linha = f"{entidade}: {contagem[entidade]} importado(s)"
+        resultado.relatorio.append(linha + (f", {ignoradas[entidade]} ignorado(s)" if ignoradas[entidade] else ""))
+    return resultado
+
+
+def recalcular(dao: CampeonatoFileDAO, args) -> Resultado:
+    resultado = Resultado()
+    for camp in _selecionar(dao, args.campeonato):
+        divergentes = camp.recalcular_classificacao()
+        if divergentes:
+            resultado.alterados.append(camp)
+            resultado.relatorio.append(f"{camp.nome}: {len(divergentes)} equipe(s) corrigida(s) "
+                                       f"({', '.join(e.nome for e in divergentes)})")
+    resultado.relatorio.append(f"{len(resultado.alterados)} campeonato(s) com classificação corrigida")
+    return resultado
+
+
+def migrar(dao: CampeonatoFileDAO, args) -> Resultado:
+    """Os formatos antigos são convertidos na leitura; regravar tudo deixa o
+    armazenamento no formato atual. Com --destino, grava em outro arquivo ou
+    diretório (por exemplo, do arquivo único para um arquivo por campeonato)."""
+    resultado = Resultado(alterados=dao.listar_todos())
+    if args.destino:
+        resultado.destino = (CampeonatoFileDAO(args.destino) if args.destino.endswith('.json')
+                             else CampeonatoShardDAO(args.destino, legado=None))
+    resultado.relatorio.append(f"{len(resultado.alterados)} campeonato(s) no formato atual em "
+                               f"{args.destino or dao.path}")
+    return resultado
+
+
+def validar(dao: CampeonatoFileDAO | None, args) -> Resultado:
+    """Verifica os campeonatos em paralelo, direto do armazenamento; o DAO só
+    é carregado se houver o que reparar (com --reparar)."""
+    relatorio = verificar_armazenamento(args.arquivo, args.processos, args.campeonato)
+    resultado = Resultado()
+    if args.reparar and any(v.reparavel for v in relatorio.violacoes):
+        resultado.destino = abrir_dao(args.arquivo)
+        resultado.alterados = reparar_campeonatos(resultado.destino, relatorio)
+    for v in relatorio.violacoes:
+        resultado.relatorio.append(f"{v.campeonato} [{v.tipo}] {v.descricao}")
+    resultado.relatorio.append(f"{relatorio.campeonatos} campeonato(s) verificado(s), "
+                               f"{len(relatorio.violacoes)} problema(s)")
+    for tipo, n in sorted(relatorio.por_tipo().items()):
+        reparos = f", {relatorio.reparos[tipo]} corrigido(s)" if tipo in relatorio.reparos else ""
+        resultado.relatorio.append(f"  {tipo}: {n}{reparos} - {TIPOS[tipo][0]}")
+    pendentes = [v for v in relatorio.violacoes if not (args.reparar and v.reparavel)]
+    resultado.codigo = 1 if pendentes else 0
+    return resultado
+
+
+COMANDOS = {'exportar': exportar, 'importar': importar, 'recalcular': recalcular, 'migrar': migrar,
+            'validar': validar}
+SEM_CARREGAR = {'validar'}  # Comandos que leem o armazenamento por conta própria
+
+
+class _Parser(argparse.ArgumentParser):
+    """Erros de uso saem como os demais erros: "[CLI] Erro" e código 2."""
+
+    def error(self, message):
+        raise AppError(f"{self.prog}: {message}")
+
+
+def _positivo(valor: str) -> int:
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"inteiro inválido: {valor!r}")
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"deve ser maior que zero: {valor}")
+    return numero
+
+
+@contextmanager
+def _etapa(tempos: Dict[str, float], nome: str):
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        tempos[nome] = time.perf_counter() - inicio
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = _Parser(description="Operações em lote sobre os campeonatos, sem a interface.")
+    parser.add_argument('--arquivo', default='data/campeonatos.json',
+                        help="Arquivo .json único ou diretório com um arquivo por campeonato")
+    comandos = parser.add_subparsers(dest='comando', required=True)
+
+    p = comandos.add_parser('exportar', help="Exporta campeonatos, equipes, jogadores, jogos, escalações e eventos")
+    p.add_argument('--destino', default='data/exportacao', help="Diretório dos arquivos gerados")
+    p.add_argument('--formato', choices=sorted(EXTENSOES), default='csv')
+    p.add_argument('--campeonato', help="Id ou nome (padrão: todos)")
+
+    p = comandos.add_parser('importar', help="Importa arquivos no formato da exportação")
+    p.add_argument('--origem', default='data/exportacao', help="Diretório com os arquivos")
+    p.add_argument('--formato', choices=sorted(EXTENSOES), default='csv')
+
+    p = comandos.add_parser('recalcular', help="Refaz a classificação a partir dos jogos finalizados")
+    p.add_argument('--campeonato', help="Id ou nome (padrão: todos)")
+
+    p = comandos.add_parser('migrar', help="Regrava os dados no formato atual")
+    p.add_argument('--destino', help="Outro arquivo .json ou diretório (padrão: o próprio armazenamento)")
+
+    p = comandos.add_parser('validar', help="Verifica a consistência dos dados")
+    p.add_argument('--campeonato', help="Id ou nome (padrão: todos)")
+    p.add_argument('--processos', type=_positivo, help="Processos em paralelo (padrão: um por CPU)")
+    p.add_argument('--reparar', action='store_true', help="Corrige o que for reparável e grava de uma vez")
+
+    tempos: Dict[str, float] = {}
+    try:
+        args = parser.parse_args(argv)
+        dao = None
+        if args.comando not in SEM_CARREGAR:
+            with _etapa(tempos, 'carregar'):
+                dao = abrir_dao(args.arquivo)
+        with _etapa(tempos, 'executar'):
+            resultado = COMANDOS[args.comando](dao, args)
+        with _etapa(tempos, 'gravar'):
+            destino = resultado.destino or dao
+            if resultado.alterados:
+                with destino.transacao():
+                    for camp in resultado.alterados:
+                        destino.salvar(camp)
+    except AppError as e:
+        print(f"[CLI] Erro: {e}", file=sys.stderr)
+        return 2
+
+    for linha in resultado.relatorio:
+        print(f"[CLI] {linha}")
+    print(f"[CLI] {args.comando}: " + ", ".join(f"{etapa} {t:.3f}s" for etapa, t in tempos.items())
+          + f", total {sum(tempos.values()):.3f}s")
+    return resultado.codigo
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""Exportação estática (HTML + JSON) das páginas públicas.
+
+Uso: python -m services.site_estatico --destino data/site
+
+Gera classificação/chaveamento, calendário, equipes e jogadores de cada
+campeonato. Ligado ao DAO com `GeradorSite.conectar(dao)`, regenera apenas as
+páginas do campeonato alterado após cada `dao.salvar`, e só regrava os
+arquivos cujo conteúdo mudou.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import threading
+from html import escape
+from typing import Dict, List
+from models.campeonato import Campeonato
+from persistence.dao import CampeonatoFileDAO, abrir_dao
+from services.api import equipe_json, jogo_json
+
+MANIFESTO = 'manifesto.json'
+
+ESTILO = """body{font-family:sans-serif;margin:2rem;color:#222}table{border-collapse:collapse}
+td,th{border:1px solid #ccc;padding:.3rem .6rem;text-align:left}nav a{margin-right:1rem}"""
+
+
+def _pagina(titulo: str, corpo: str, raiz: str = '..') -> str:
+    return (
+        f"<!DOCTYPE html><html lang=\"pt-BR\"><head><meta charset=\"utf-8\">"
+        f"<title>{escape(titulo)}</title><style>{ESTILO}</style></head><body>"
+        f"<nav><a href=\"{raiz}/index.html\">Campeonatos</a></nav><h1>{escape(titulo)}</h1>{corpo}</body></html>"
+    )
+
+
+def _tabela(cabecalho: List[str], linhas: List[List]) -> str:
+    th = ''.join(f"<th>{escape(str(c))}</th>" for c in cabecalho)
+    trs = ''.join('<tr>' + ''.join(f"<td>{c}</td>" for c in linha) + '</tr>' for linha in linhas)
+    return f"<table><tr>{th}</tr>{trs}</table>"
+
+
+def _placar(jogo) -> str:
+    return f"{jogo.placar_mandante} x {jogo.placar_visitante}" if jogo.finalizada else "vs"
+
+
+class GeradorSite:
+    """Gerador do site de um destino. O manifesto de hashes é a memória do que
+    está em disco, então deve haver um só gerador por destino (no app, um por
+    processo); as gerações são serializadas por uma trava."""
+
+    def __init__(self, destino: str = 'data/site'):
+        self.destino = destino
+        self._hashes: Dict[str, str] = {}
+        self._campeonatos: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.sincronizado = False # gerar_tudo já rodou com este gerador
+        os.makedirs(self.destino, exist_ok=True)
+        self._carregar_manifesto()
+
+    def _carregar_manifesto(self):
+        try:
+            with open(os.path.join(self.destino, MANIFESTO), 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+            self._hashes = dados.get('hashes', {})
+            self._campeonatos = dados.get('campeonatos', {})
+        except (json.JSONDecodeError, FileNotFoundError):
+            self._hashes, self._campeonatos = {}, {}
+
+    def _salvar_manifesto(self):
+        caminho = os.path.join(self.destino, MANIFESTO)
+        temporario = caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump({'hashes': self._hashes, 'campeonatos': self._campeonatos}, f, ensure_ascii=False)
+        os.replace(temporario, caminho)
+
+    def _escrever(self, relativo: str, conteudo: str) -> bool:
+        """Grava o arquivo apenas se o conteúdo mudou desde a última geração."""
+        digest = hashlib.sha1(conteudo.encode('utf-8')).hexdigest()
+        caminho = os.path.join(self.destino, relativo)
+        if self._hashes.get(relativo) == digest and os.path.exists(caminho):
+            return False
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            f.write(conteudo)
+        self._hashes[relativo] = digest
+        return True
+
+    def _escrever_json(self, relativo: str, dados) -> bool:
+        return self._escrever(relativo, json.dumps(dados, ensure_ascii=False, indent=1))
+
+    # Páginas ---------------------------------------------------------------
+
+    def _paginas_campeonato(self, camp: Campeonato) -> Dict[str, str]:
+        base = camp.id
+        titulo = f"{camp.nome} - {camp.ano}"
+        paginas = {}
+        links = ("<p><a href=\"calendario.html\">Calendário</a> | "
+                 "<a href=\"artilharia.html\">Artilharia</a></p>")
+
+        classificacao = camp.obter_classificacao()
+        paginas[f"{base}/classificacao.json"] = json.dumps(
+            [equipe_json(i, e) for i, e in enumerate(classificacao, 1)], ensure_ascii=False, indent=1)
+
+        if camp.tipo == "Mata-mata":
+            corpo = ''
+            for fase in sorted(camp.fases, key=lambda f: f.ordem):
+                corpo += f"<h2>{escape(fase.nome)}</h2>" + _tabela(
+                    ["Mandante", "Placar", "Visitante", "Local"],
+                    [[escape(j.mandante.nome), _placar(j), escape(j.visitante.nome), escape(j.local)] for j in fase.jogos]
+                )
+        else:
+            corpo = _tabela(
+                ["#", "Equipe", "Pts", "V", "E", "D", "SG"],
+                [[i, f"<a href=\"equipes/{e.id}.html\">{escape(e.nome)}</a>", e.pontos,
+                  e.vitorias, e.empates, e.derrotas, e.saldo_gols] for i, e in enumerate(classificacao, 1)]
+            )
+        paginas[f"{base}/index.html"] = _pagina(titulo, links + corpo)
+
+        jogos = sorted(((f, j) for f in camp.fases for j in f.jogos), key=lambda x: x[1].data)
+        paginas[f"{base}/calendario.json"] = json.dumps(
+            [jogo_json(camp, f, j) for f, j in jogos], ensure_ascii=False, indent=1)
+        paginas[f"{base}/calendario.html"] = _pagina(f"Calendário - {titulo}", _tabela(
+            ["Data", "Fase", "Mandante", "Placar", "Visitante", "Local", "Status"],
+            [[j.data.strftime('%d/%m/%Y %H:%M'), escape(f.nome), escape(j.mandante.nome), _placar(j),
+              escape(j.visitante.nome), escape(j.local), escape(j.status)] for f, j in jogos]
+        ))
+
+        artilharia = camp.obter_artilharia()
+        paginas[f"{base}/artilharia.json"] = json.dumps(artilharia, ensure_ascii=False, indent=1)
+        paginas[f"{base}/artilharia.html"] = _pagina(f"Artilharia - {titulo}", _tabela(
+            ["Jogador", "Equipe", "Gols"],
+            [[f"<a href=\"jogadores/{a['jogador_id']}.html\">{escape(a['jogador'])}</a>",
+              escape(a['equipe']), a['gols']] for a in artilharia]
+        ))
+
+        gols_por_jogador = {a['jogador_id']: a['gols'] for a in artilharia}
+        for posicao, equipe in enumerate(classificacao, 1):
+            dados = equipe_json(posicao, equipe)
+            dados['tecnico'] = equipe.tecnico
+            dados['elenco'] = [
+                {'id': j.id, 'nome': j.nome, 'numero': j.numero, 'posicao': j.posicao,
+                 'gols': gols_por_jogador.get(j.id, 0)}
+                for j in equipe.elenco
+            ]
+            paginas[f"{base}/equipes/{equipe.id}.json"] = json.dumps(dados, ensure_ascii=False, indent=1)
+            paginas[f"{base}/equipes/{equipe.id}.html"] = _pagina(
+                equipe.nome,
+                f"<p>Técnico: {escape(equipe.tecnico)} | Pontos: {equipe.pontos}</p>" + _tabela(
+                    ["#", "Jogador", "Posição", "Gols"],
+                    [[j['numero'], f"<a href=\"../jogadores/{j['id']}.html\">{escape(j['nome'])}</a>",
+                      escape(j['posicao']), j['gols']] for j in dados['elenco']]
+                ),
+                raiz='../..'
+            )
+            for jogador in dados['elenco']:
+                jogador = dict(jogador, equipe={'id': equipe.id, 'nome': equipe.nome})
+                paginas[f"{base}/jogadores/{jogador['id']}.json"] = json.dumps(jogador, ensure_ascii=False, indent=1)
+                paginas[f"{base}/jogadores/{jogador['id']}.html"] = _pagina(
+                    jogador['nome'],
+                    f"<p>#{jogador['numero']} - {escape(jogador['posicao'])} - "
+                    f"<a href=\"../equipes/{equipe.id}.html\">{escape(equipe.nome)}</a></p>"
+                    f"<p>Gols: {jogador['gols']}</p>",
+                    raiz='../..'
+                )
+        return paginas
+
+    def _gerar_indice(self):
+        camps = sorted(self._campeonatos.values(), key=lambda c: (-c['ano'], c['nome']))
+        self._escrever_json('campeonatos.json', camps)
+        self._escrever('index.html', _pagina("Campeonatos", _tabela(
+            ["Campeonato", "Ano", "Formato"],
+            [[f"<a href=\"{c['id']}/index.html\">{escape(c['nome'])}</a>", c['ano'], escape(c['tipo'])] for c in camps]
+        ), raiz='.'))
+
+    # Geração ---------------------------------------------------------------
+
+    def atualizar_campeonato(self, campeonato_id: str, camp: Campeonato | None) -> int:
+        """Regenera as páginas de um campeonato (ou as remove, se camp for None).
+        Retorna a quantidade de arquivos gravados."""
+        with self._lock:
+            return self._atualizar_campeonato(campeonato_id, camp)
+
+    def _atualizar_campeonato(self, campeonato_id: str, camp: Campeonato | None) -> int:
+        prefixo = campeonato_id + '/'
+        antigos = {p for p in self._hashes if p.startswith(prefixo)}
+        gravados = 0
+        if camp is None:
+            shutil.rmtree(os.path.join(self.destino, campeonato_id), ignore_errors=True)
+            self._campeonatos.pop(campeonato_id, None)
+        else:
+            paginas = self._paginas_campeonato(camp)
+            for relativo, conteudo in paginas.items():
+                gravados += self._escrever(relativo, conteudo)
+            for relativo in antigos - paginas.keys():
+                try:
+                    os.remove(os.path.join(self.destino, relativo))
+                except FileNotFoundError:
+                    pass
+            antigos -= paginas.keys()
+            self._campeonatos[campeonato_id] = {'id': camp.id, 'nome': camp.nome, 'ano': camp.ano, 'tipo': camp.tipo}
+        for relativo in antigos:
+            self._hashes.pop(relativo, None)
+        self._gerar_indice()
+        self._salvar_manifesto()
+        return gravados
+
+    def gerar_tudo(self, campeonatos: List[Campeonato]) -> int:
+        ids = {c.id for c in campeonatos}
+        gravados = 0
+        for camp_id in list(self._campeonatos):
+            if camp_id not in ids:
+                self.atualizar_campeonato(camp_id, None)
+        for camp in campeonatos:
+            gravados += self.atualizar_campeonato(camp.id, camp)
+        self.sincronizado = True
+        return gravados
+
+    def conectar(self, dao: CampeonatoFileDAO) -> None:
+        """Regenera incrementalmente após cada gravação do DAO. Na primeira
+        conexão, gera tudo, para levar ao site o que mudou enquanto ele estava
+        desligado; as conexões seguintes (outras sessões) só ouvem."""
+        if not self.sincronizado:
+            self.gerar_tudo(dao.listar_todos())
+        dao.adicionar_ouvinte(self.atualizar_campeonato)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta as páginas públicas em HTML e JSON.")
+    parser.add_argument('--arquivo', default='data/campeonatos.json',
+                        help="Arquivo .json único ou diretório com um arquivo por campeonato")
+    parser.add_argument('--destino', default='data/site')
+    args = parser.parse_args()
+    gravados = GeradorSite(args.destino).gerar_tudo(abrir_dao(args.arquivo).listar_todos())
+    print(f"[SITE] {gravados} arquivos atualizados em {args.destino}.")
+
+
+if __name__ == '__main__':
+    main()
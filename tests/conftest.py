@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+
+from models.campeonato import Campeonato, Fase
+from models.equipe import Equipe
+from models.jogador import Jogador
+from models.partida import Escalacao, Jogo
+
+
+@pytest.fixture
+def campeonato() -> Campeonato:
+    """Três equipes (Casa, Fora, Terceiro) com quatro jogadores cada e uma
+    rodada de três jogos agendados: Casa x Fora, Fora x Terceiro e Terceiro x Casa."""
+    camp = Campeonato("Liga", 2025, "Pontos corridos")
+    for nome in ("Casa", "Fora", "Terceiro"):
+        equipe = Equipe(nome, "Técnico")
+        for k in range(4):
+            equipe.contratar_jogador(Jogador(f"{nome} {k}", k + 1, "Atacante"))
+        camp.cadastrar_equipe(equipe)
+    casa, fora, terceiro = camp.equipes_inscritas
+    fase = Fase("Rodada 1", 1, "Corridos")
+    camp.adicionar_fase(fase)
+    for mandante, visitante, dia, local in ((casa, fora, 1, "Estádio"), (fora, terceiro, 8, "Estádio B"),
+                                            (terceiro, casa, 15, "Estádio C")):
+        fase.adicionar_jogo(Jogo(mandante, visitante, datetime(2025, 3, dia, 16), local))
+    return camp
+
+
+@pytest.fixture
+def campeonato_com_eventos(campeonato: Campeonato) -> Campeonato:
+    """O `campeonato` com o primeiro jogo finalizado em 3 x 0 (gol, gol contra,
+    gol sem autor, amarelo e vermelho, escalações e público) e o segundo ao vivo."""
+    casa, fora, terceiro = campeonato.equipes_inscritas
+    finalizado, ao_vivo, _ = campeonato.fases[0].jogos
+
+    finalizado.publico = 1200
+    finalizado.escalacao_mandante = Escalacao([j.id for j in casa.elenco[:3]], [casa.elenco[3].id])
+    finalizado.escalacao_visitante = Escalacao([j.id for j in fora.elenco[:3]], [])
+    campeonato.indexar_escalacao(finalizado)
+    finalizado.alterar_status("Ao vivo")
+    finalizado.registrar_gol(casa.id, casa.elenco[0], minuto=12)
+    finalizado.registrar_cartao(fora.id, fora.elenco[1], minuto=30)
+    finalizado.registrar_gol(casa.id, fora.elenco[2], minuto=58, contra=True)
+    finalizado.registrar_cartao(casa.id, casa.elenco[1], minuto=77, vermelho=True)
+    finalizado.finalizar_partida(3, 0)  # um gol sem autor
+
+    ao_vivo.escalacao_mandante = Escalacao([fora.elenco[0].id], [fora.elenco[1].id])
+    campeonato.indexar_escalacao(ao_vivo)
+    ao_vivo.alterar_status("Ao vivo")
+    ao_vivo.registrar_cartao(terceiro.id, terceiro.elenco[0], minuto=5)
+    return campeonato
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+from models.agenda import AgendaJogos
+from models.partida import Jogo
+
+
+def _agenda(camp) -> AgendaJogos:
+    agenda = AgendaJogos()
+    agenda.reconstruir(camp)
+    return agenda
+
+
+def test_local_ocupado_compara_nomes_normalizados(campeonato):
+    _, fora, terceiro = campeonato.equipes_inscritas
+    agenda = _agenda(campeonato)
+    assert agenda.auditar() == []
+
+    mesmo_local = Jogo(terceiro, fora, datetime(2025, 3, 1, 17, 30), "  ESTÁDIO ")
+    conflitos = agenda.conflitos(mesmo_local)
+    assert [(c.tipo, c.alvo) for c in conflitos] == [("local", "  ESTÁDIO "), ("descanso", "Fora")]
+    assert all(c.outro is campeonato.fases[0].jogos[0] for c in conflitos)
+
+    # A janela de ocupação é aberta: duas horas depois o local está livre
+    mesmo_local.data = datetime(2025, 3, 1, 18)
+    assert [c.tipo for c in agenda.conflitos(mesmo_local)] == ["descanso"]
+
+
+def test_descanso_minimo_entre_jogos_da_equipe(campeonato):
+    casa, _, terceiro = campeonato.equipes_inscritas
+    agenda = _agenda(campeonato)
+    primeiro = campeonato.fases[0].jogos[0]
+
+    jogo = Jogo(casa, terceiro, primeiro.data + timedelta(hours=47), "Outro estádio")
+    conflitos = agenda.conflitos(jogo)
+    assert [(c.tipo, c.alvo) for c in conflitos] == [("descanso", "Casa")]
+    assert "Casa joga duas vezes" in conflitos[0].descricao()
+
+    jogo.data = primeiro.data + timedelta(hours=48)
+    assert agenda.conflitos(jogo) == []
+
+
+def test_conflitos_de_uma_rodada_nao_ficam_na_agenda(campeonato):
+    casa, fora, terceiro = campeonato.equipes_inscritas
+    agenda = _agenda(campeonato)
+    data = datetime(2025, 4, 1, 16)
+    rodada = [Jogo(casa, fora, data, "Arena"), Jogo(terceiro, casa, data + timedelta(days=1), "Arena")]
+
+    conflitos = agenda.conflitos_de(rodada)
+
+    assert [(c.tipo, c.jogo, c.outro) for c in conflitos] == [("descanso", rodada[1], rodada[0])]
+    assert all(agenda.conflitos(j) == [] for f in campeonato.fases for j in f.jogos)
+    assert agenda.auditar() == []
+
+
+def test_jogo_cancelado_ou_remarcado_libera_a_agenda(campeonato):
+    _, fora, terceiro = campeonato.equipes_inscritas
+    primeiro, segundo, _ = campeonato.fases[0].jogos
+    agenda = _agenda(campeonato)
+
+    segundo.data = primeiro.data
+    segundo.local = "estádio"
+    agenda.atualizar(segundo)
+    assert {c.tipo for c in agenda.auditar()} == {"local", "descanso"}
+
+    primeiro.cancelar()
+    agenda.atualizar(primeiro)
+    assert agenda.auditar() == []
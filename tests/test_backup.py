@@ -0,0 +1,18 @@
+from models.campeonato import Campeonato
+from models.equipe import Equipe
+from persistence.backup import BackupStore
+
+
+def test_trocar_compressao_mantem_backups_antigos_legiveis(tmp_path):
+    camp = Campeonato("Liga", 2025, "Pontos corridos")
+    camp.cadastrar_equipe(Equipe("Casa", "Técnico"))
+    antigo = BackupStore(str(tmp_path), compressao='zlib').registrar(camp.id, camp)
+
+    store = BackupStore(str(tmp_path), compressao='lzma')
+    camp.cadastrar_equipe(Equipe("Fora", "Técnico"))
+    novo = store.registrar(camp.id, camp)
+
+    assert [e.nome for e in store.restaurar(camp.id, antigo.id).equipes_inscritas] == ["Casa"]
+    assert [e.nome for e in store.restaurar(camp.id, novo.id).equipes_inscritas] == ["Casa", "Fora"]
+    extensoes = sorted(p.suffix for p in (tmp_path / 'objetos').iterdir())
+    assert extensoes == ['.xz', '.z']
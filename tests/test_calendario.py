@@ -0,0 +1,39 @@
+import random
+from datetime import date, time
+
+import pytest
+
+from models.calendario import OtimizadorTabela, datas_rodadas, rodizio_duplo
+from models.equipe import Equipe
+
+
+def _otimizador(n: int, semente: int) -> OtimizadorTabela:
+    equipes = [Equipe(nome=f"Time {i}", tecnico="Técnico") for i in range(n)]
+    datas = datas_rodadas(date(2025, 1, 5), len(rodizio_duplo(n)))
+    estadios = {e.id: f"Estádio {i // 2}" for i, e in enumerate(equipes[:8])}
+    rnd = random.Random(semente)
+    bloqueios = {e.id: rnd.sample(datas, 3) for e in equipes[::3]}
+    return OtimizadorTabela(equipes, datas, estadios, bloqueios)
+
+
+@pytest.mark.parametrize("n, semente", [(20, 1), (16, 2), (10, 3), (9, 4)])
+def test_otimizar_nao_aumenta_quebras(n, semente):
+    otimizador = _otimizador(n, semente)
+    quebras_iniciais, custo_inicial = otimizador.quebras(), otimizador.custo()
+
+    custo = otimizador.otimizar(5000, semente=semente)
+
+    assert otimizador.quebras() <= quebras_iniciais
+    assert custo == otimizador.custo() <= custo_inicial
+
+
+def test_tabela_otimizada_continua_valida():
+    otimizador = _otimizador(10, 5)
+    otimizador.otimizar(5000, semente=5)
+    fases = otimizador.escrever(time(16))
+
+    confrontos = [(j.mandante.id, j.visitante.id) for f in fases for j in f.jogos]
+    assert len(confrontos) == len(set(confrontos)) == 10 * 9
+    for fase in fases:
+        equipes = [e for j in fase.jogos for e in (j.mandante.id, j.visitante.id)]
+        assert len(equipes) == len(set(equipes))
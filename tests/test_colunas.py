@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from models.campeonato import Campeonato, Fase
+from models.colunas import TabelaResultados
+from models.equipe import Equipe
+from models.partida import Jogo
+
+
+def _campeonato(minutos_mandante, minutos_visitante) -> Campeonato:
+    camp = Campeonato("Liga", 2025, "Pontos corridos")
+    casa, fora = Equipe("Casa", "Técnico"), Equipe("Fora", "Técnico")
+    camp.cadastrar_equipe(casa)
+    camp.cadastrar_equipe(fora)
+    fase = Fase("Rodada 1", 1, "Corridos")
+    camp.adicionar_fase(fase)
+    jogo = Jogo(casa, fora, datetime(2025, 3, 1, 16), "Estádio")
+    fase.adicionar_jogo(jogo)
+    for minuto in minutos_mandante:
+        jogo.registrar_gol(casa.id, minuto=minuto)
+    for minuto in minutos_visitante:
+        jogo.registrar_gol(fora.id, minuto=minuto)
+    jogo.finalizar_partida()
+    return camp
+
+
+def test_gols_por_minuto_separa_acrescimos():
+    tabela = TabelaResultados(_campeonato([1, 15, 16, 76, 90], [45, 91, 95]))
+
+    resultado = tabela.gols_por_minuto()
+
+    assert list(resultado['faixas']) == ["1-15", "16-30", "31-45", "46-60", "61-75", "76-90", "90+"]
+    assert list(resultado['gols']) == [2, 1, 1, 0, 0, 2, 2]
+
+
+def test_gols_por_minuto_sem_acrescimos():
+    resultado = TabelaResultados(_campeonato([30, 90], [])).gols_por_minuto()
+
+    assert list(resultado['faixas'])[-2:] == ["76-90", "90+"]
+    assert list(resultado['gols']) == [0, 1, 0, 0, 0, 1, 0]
@@ -0,0 +1,128 @@
+import os
+
+import pytest
+
+from models.campeonato import Campeonato
+from persistence.dao import CampeonatoFileDAO, CampeonatoShardDAO
+
+
+def test_reversao_da_transacao_descarta_indices(tmp_path, campeonato):
+    dao = CampeonatoFileDAO(str(tmp_path / 'campeonatos.json'))
+    camp = campeonato
+    dao.salvar(camp)
+    # Índice da sessão montado sobre os objetos do campeonato (como agenda e disciplina)
+    indices = {'jogos': {j.id: j for f in camp.fases for j in f.jogos}}
+    dao.adicionar_ouvinte_reversao(lambda restaurados: indices.clear())
+    restaurados = []
+    dao.adicionar_ouvinte_reversao(restaurados.extend)
+    versao = dao.versao
+    jogo = camp.fases[0].jogos[0]
+
+    with pytest.raises(RuntimeError):
+        with dao.transacao(camp):
+            jogo.finalizar_partida(2, 1)
+            dao.salvar(camp)
+            raise RuntimeError("falha no meio da transação")
+
+    assert restaurados == [camp]
+    assert indices == {}
+    assert dao.versao > versao
+    restaurado = camp.fases[0].jogos[0]
+    assert restaurado is not jogo and restaurado.id == jogo.id
+    assert not restaurado.finalizada
+    assert camp.equipes_inscritas[0].vitorias == 0
+
+
+def test_transacao_confirmada_nao_chama_ouvintes_de_reversao(tmp_path, campeonato):
+    dao = CampeonatoFileDAO(str(tmp_path / 'campeonatos.json'))
+    camp = campeonato
+    chamadas = []
+    dao.adicionar_ouvinte_reversao(chamadas.append)
+
+    with dao.transacao(camp):
+        camp.fases[0].jogos[0].finalizar_partida(1, 0)
+        dao.salvar(camp)
+
+    assert chamadas == []
+    assert CampeonatoFileDAO(dao.path).buscar_por_id(camp.id).equipes_inscritas[0].vitorias == 1
+
+
+@pytest.mark.parametrize("dao_cls", [CampeonatoFileDAO, CampeonatoShardDAO])
+def test_reversao_restaura_campeonato_salvo_sem_ser_informado(tmp_path, dao_cls, monkeypatch, campeonato):
+    dao = dao_cls(str(tmp_path / 'campeonatos.json'))
+    camp = campeonato
+    dao.salvar(camp)
+    # Sem cópia antecipada: o estado anterior vem do disco, só na reversão
+    monkeypatch.setattr(Campeonato, 'to_dict', lambda self: pytest.fail("cópia antecipada"))
+
+    with pytest.raises(RuntimeError):
+        with dao.transacao():
+            camp.fases[0].jogos[0].finalizar_partida(3, 0)
+            dao.salvar(camp)
+            raise RuntimeError("falha no meio da transação")
+
+    assert not camp.fases[0].jogos[0].finalizada
+    assert camp.equipes_inscritas[0].vitorias == 0
+    assert dao.buscar_por_id(camp.id) is camp
+
+
+def _diretorio(tmp_path, campeonato) -> CampeonatoShardDAO:
+    dao = CampeonatoShardDAO(str(tmp_path / 'campeonatos'), legado=None)
+    dao.salvar(campeonato)
+    dao.salvar(Campeonato("Copa", 2025, "Mata-mata"))
+    return dao
+
+
+def test_diretorio_grava_um_arquivo_por_campeonato(tmp_path, monkeypatch, campeonato):
+    dao = _diretorio(tmp_path, campeonato)
+    copa = next(c for c in dao.listar_todos() if c.nome == "Copa")
+    assert sorted(os.listdir(dao.path)) == sorted([f"{campeonato.id}.json", f"{copa.id}.json", dao.MANIFESTO])
+    assert {r['nome'] for r in dao.listar_resumo()} == {"Liga", "Copa"}
+
+    gravados = []
+    original = dao._gravar_atomico
+    monkeypatch.setattr(dao, '_gravar_atomico', lambda caminho, dados: (gravados.append(caminho), original(caminho, dados)))
+    campeonato.fases[0].jogos[0].finalizar_partida(1, 0)
+    dao.salvar(campeonato)
+    # Só o arquivo do campeonato alterado; o manifesto não muda
+    assert gravados == [os.path.join(dao.path, f"{campeonato.id}.json")]
+
+    reaberto = CampeonatoShardDAO(dao.path, legado=None)
+    assert reaberto.buscar_por_id(campeonato.id).fases[0].jogos[0].finalizada
+    assert reaberto.buscar_por_id(copa.id).nome == "Copa"
+
+
+def test_arquivo_corrompido_afeta_so_o_seu_campeonato(tmp_path, caplog, campeonato):
+    dao = _diretorio(tmp_path, campeonato)
+    with open(os.path.join(dao.path, f"{campeonato.id}.json"), 'w', encoding='utf-8') as f:
+        f.write('{"id": "truncado", ')
+
+    reaberto = CampeonatoShardDAO(dao.path, legado=None)
+
+    assert [c.nome for c in reaberto.listar_todos()] == ["Copa"]
+    assert [r['nome'] for r in reaberto.listar_resumo()] == ["Copa"]
+    assert campeonato.id in caplog.text
+
+
+def test_diretorio_importa_o_arquivo_unico_legado(tmp_path, campeonato):
+    legado = CampeonatoFileDAO(str(tmp_path / 'campeonatos.json'))
+    legado.salvar(campeonato)
+
+    dao = CampeonatoShardDAO(str(tmp_path / 'campeonatos'), legado=legado.path)
+
+    assert [c.id for c in dao.listar_todos()] == [campeonato.id]
+    assert os.path.exists(os.path.join(dao.path, f"{campeonato.id}.json"))
+    # Com o manifesto criado, o legado não é mais lido
+    os.remove(legado.path)
+    assert CampeonatoShardDAO(dao.path, legado=legado.path).buscar_por_id(campeonato.id) is not None
+
+
+def test_excluir_remove_arquivo_e_entrada_do_manifesto(tmp_path, campeonato):
+    dao = _diretorio(tmp_path, campeonato)
+
+    assert dao.excluir(campeonato.id)
+
+    assert not os.path.exists(os.path.join(dao.path, f"{campeonato.id}.json"))
+    assert [r['nome'] for r in dao.listar_resumo()] == ["Copa"]
+    assert [c.nome for c in CampeonatoShardDAO(dao.path, legado=None).listar_todos()] == ["Copa"]
+    assert not dao.excluir(campeonato.id)
@@ -0,0 +1,68 @@
+from models.disciplina import ControleDisciplinar
+
+
+def _livro(ctrl: ControleDisciplinar, camp) -> dict:
+    return {j.id: (ctrl.jogos_suspensao(j.id), ctrl.amarelos(j.id))
+            for e in camp.equipes_inscritas for j in e.elenco}
+
+
+def test_vermelho_suspende_pela_proxima_partida_da_equipe(campeonato_com_eventos):
+    casa, fora, terceiro = campeonato_com_eventos.equipes_inscritas
+    _, segundo, terceiro_jogo = campeonato_com_eventos.fases[0].jogos
+    ctrl = ControleDisciplinar()
+    ctrl.reconstruir(campeonato_com_eventos)
+
+    assert ctrl.suspenso(casa.elenco[1].id) and ctrl.jogos_suspensao(casa.elenco[1].id) == 1
+    assert not ctrl.suspenso(fora.elenco[1].id) and ctrl.amarelos(fora.elenco[1].id) == 1
+
+    segundo.finalizar_partida(1, 0)  # a Casa não joga: segue suspenso
+    ctrl.registrar_partida(campeonato_com_eventos, segundo)
+    assert ctrl.suspenso(casa.elenco[1].id)
+    assert ctrl.amarelos(terceiro.elenco[0].id) == 1
+
+    terceiro_jogo.finalizar_partida(0, 0)
+    ctrl.registrar_partida(campeonato_com_eventos, terceiro_jogo)
+    assert not ctrl.suspenso(casa.elenco[1].id)
+
+
+def test_amarelos_acumulados_e_dois_no_mesmo_jogo(campeonato):
+    casa, fora, terceiro = campeonato.equipes_inscritas
+    primeiro, _, ultimo = campeonato.fases[0].jogos
+    ctrl = ControleDisciplinar(amarelos_para_suspensao=2)
+
+    primeiro.registrar_cartao(casa.id, casa.elenco[0], minuto=10)
+    primeiro.registrar_cartao(fora.id, fora.elenco[0], minuto=20)
+    primeiro.registrar_cartao(fora.id, fora.elenco[0], minuto=40)
+    primeiro.finalizar_partida()
+    ctrl.registrar_partida(campeonato, primeiro)
+
+    assert ctrl.amarelos(casa.elenco[0].id) == 1 and not ctrl.suspenso(casa.elenco[0].id)
+    # Dois amarelos no mesmo jogo expulsam e não entram no acúmulo
+    assert ctrl.jogos_suspensao(fora.elenco[0].id) == 1 and ctrl.amarelos(fora.elenco[0].id) == 0
+
+    ultimo.registrar_cartao(casa.id, casa.elenco[0], minuto=70)
+    ultimo.finalizar_partida()
+    ctrl.registrar_partida(campeonato, ultimo)
+
+    assert ctrl.jogos_suspensao(casa.elenco[0].id) == 1 and ctrl.amarelos(casa.elenco[0].id) == 0
+
+
+def test_jogo_fora_de_ordem_ou_cancelado_reconstroi_o_livro(campeonato_com_eventos):
+    camp = campeonato_com_eventos
+    primeiro, segundo, terceiro_jogo = camp.fases[0].jogos
+    ctrl = ControleDisciplinar()
+    ctrl.reconstruir(camp)
+
+    terceiro_jogo.finalizar_partida(1, 1)
+    ctrl.registrar_partida(camp, terceiro_jogo)
+    segundo.finalizar_partida(0, 2)  # anterior ao último aplicado
+    ctrl.registrar_partida(camp, segundo)
+    novo = ControleDisciplinar()
+    novo.reconstruir(camp)
+    assert _livro(ctrl, camp) == _livro(novo, camp)
+
+    primeiro.cancelar()
+    ctrl.registrar_partida(camp, primeiro)
+    casa, fora, _ = camp.equipes_inscritas
+    assert ctrl.amarelos(fora.elenco[1].id) == 0
+    assert not any(ctrl.suspenso(j.id) for j in casa.elenco)
@@ -0,0 +1,75 @@
+import pytest
+
+from persistence.dao import CampeonatoFileDAO
+from persistence.escrita_assincrona import EscritaAssincrona
+
+
+@pytest.fixture
+def escrita():
+    escrita = EscritaAssincrona(intervalo=0.05)
+    yield escrita
+    escrita.encerrar()
+
+
+class _DAOFalho:
+    """Falha na primeira gravação; enquanto ela acontece, chega um salvamento mais novo."""
+
+    def __init__(self, escrita):
+        self.escrita = escrita
+        self._ouvintes = []
+        self.gravados = []
+
+    def _gravar_dados(self, lote):
+        if not self.gravados:
+            self.gravados.append(None)
+            self.escrita.agendar(self, {'a': {'versao': 2}})
+            raise OSError("disco cheio")
+        self.gravados.append(dict(lote))
+
+
+def test_salvamentos_seguidos_viram_uma_escrita(tmp_path, monkeypatch, escrita, campeonato):
+    dao = CampeonatoFileDAO(str(tmp_path / 'campeonatos.json'))
+    dao.ativar_escrita_assincrona(escrita=escrita)
+    lotes = []
+    original = dao._gravar_dados
+    monkeypatch.setattr(dao, '_gravar_dados', lambda lote: (lotes.append(set(lote)), original(lote)))
+    escrita.intervalo = 60  # a janela só termina com o descarregar
+
+    for jogo in campeonato.fases[0].jogos:
+        jogo.finalizar_partida(1, 0)
+        dao.salvar(campeonato)
+    assert dao.escritas_pendentes() == 1
+
+    escrita.encerrar()  # grava os pendentes sem esperar o fim da janela
+
+    assert lotes == [{campeonato.id}]
+    assert dao.escritas_pendentes() == 0
+    gravado = CampeonatoFileDAO(dao.path).buscar_por_id(campeonato.id)
+    assert all(j.finalizada for j in gravado.fases[0].jogos)
+
+
+def test_erro_devolve_o_lote_sem_sobrescrever_salvamento_novo(escrita, caplog):
+    dao = _DAOFalho(escrita)
+
+    escrita.agendar(dao, {'a': {'versao': 1}, 'b': {'versao': 1}})
+
+    assert escrita.descarregar(timeout=5)
+    assert dao.gravados == [None, {'a': {'versao': 2}, 'b': {'versao': 1}}]
+    assert escrita.ultimo_erro is None
+    assert "disco cheio" in caplog.text
+
+
+def test_ouvintes_recebem_copias_do_que_foi_gravado(tmp_path, escrita, campeonato):
+    dao = CampeonatoFileDAO(str(tmp_path / 'campeonatos.json'))
+    dao.ativar_escrita_assincrona(escrita=escrita)
+    recebidos = []
+    dao.adicionar_ouvinte(lambda id, camp: recebidos.append((id, camp)))
+
+    dao.salvar(campeonato)
+    campeonato.nome = "Alterado depois do salvar"
+    assert dao.descarregar(timeout=5)
+
+    [(id, copia)] = recebidos
+    assert id == campeonato.id and copia is not campeonato
+    assert copia.nome == "Liga"
+    assert dao.buscar_por_id(campeonato.id) is campeonato
@@ -0,0 +1,43 @@
+import json
+
+from models.campeonato import Campeonato
+from persistence.dao import CampeonatoFileDAO
+from services.integridade import reparar_campeonatos, verificar_armazenamento
+
+
+def _gravar_com_placar_divergente(caminho, camp: Campeonato) -> None:
+    """Grava um jogo finalizado com gols sem autor a mais e um em aberto com placar sem gols."""
+    casa = camp.equipes_inscritas[0]
+    finalizado = camp.fases[0].jogos[0]
+    finalizado.registrar_gol(casa.id, casa.elenco[0], minuto=10)
+    finalizado.finalizar_partida(3, 0)
+
+    dados = camp.to_dict()
+    dados['fases'][0]['jogos'][0]['placar_mandante'] = 2  # Um gol sem autor sobrando no registro
+    dados['fases'][0]['jogos'][1]['placar_mandante'] = 4  # Jogo em aberto sem nenhum gol
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump([dados], f)
+
+
+def test_placar_divergente_do_arquivo_e_detectado_e_reparado_pelo_modelo(tmp_path, campeonato):
+    caminho = str(tmp_path / 'campeonatos.json')
+    _gravar_com_placar_divergente(caminho, campeonato)
+
+    relatorio = verificar_armazenamento(caminho, processos=1)
+    assert relatorio.por_tipo()['placar'] == 2
+
+    dao = CampeonatoFileDAO(caminho)
+    alterados = reparar_campeonatos(dao, relatorio)
+    with dao.transacao():
+        for camp in alterados:
+            dao.salvar(camp)
+
+    assert relatorio.reparos['placar'] == 2
+    assert verificar_armazenamento(caminho, processos=1).violacoes == []
+    camp = CampeonatoFileDAO(caminho).listar_todos()[0]
+    finalizado, aberto, _ = camp.fases[0].jogos
+    # O placar digitado prevalece: a sobra sem autor sai, o gol com autor fica
+    assert (finalizado.placar_mandante, finalizado.placar_visitante) == (2, 0)
+    assert [g.jogador_nome for g in finalizado.gols] == ["Casa 0", ""]
+    assert camp.equipes_inscritas[0].gols_marcados == 2
+    assert (aberto.placar_mandante, aberto.placar_visitante) == (0, 0)
@@ -0,0 +1,45 @@
+import pytest
+
+from persistence.dao import CampeonatoFileDAO
+from services.operacoes import main
+
+
+@pytest.mark.parametrize("formato", ["csv", "json"])
+def test_exportar_e_importar_preserva_o_campeonato(tmp_path, formato, campeonato_com_eventos):
+    origem = str(tmp_path / 'origem.json')
+    camp = campeonato_com_eventos
+    CampeonatoFileDAO(origem).salvar(camp)
+    destino = str(tmp_path / 'destino.json')
+
+    exportacao = str(tmp_path / 'exportacao')
+    assert main(['--arquivo', origem, 'exportar', '--destino', exportacao, '--formato', formato]) == 0
+    assert main(['--arquivo', destino, 'importar', '--origem', exportacao, '--formato', formato]) == 0
+
+    importado = CampeonatoFileDAO(destino).buscar_por_id(camp.id)
+    assert importado.to_dict() == CampeonatoFileDAO(origem).buscar_por_id(camp.id).to_dict()
+    jogo = importado.fases[0].jogos[0]
+    assert [c.tipo for c in jogo.cartoes] == ["amarelo", "vermelho"]
+    assert importado.estatisticas_jogador(camp.equipes_inscritas[0].elenco[3].id)['reserva'] == 1
+    assert [e.vitorias for e in importado.equipes_inscritas] == [1, 0, 0]
+
+
+@pytest.mark.parametrize("formato", ["csv", "json"])
+def test_importar_com_valor_invalido_informa_a_linha(tmp_path, capsys, formato, campeonato):
+    origem = str(tmp_path / 'origem.json')
+    CampeonatoFileDAO(origem).salvar(campeonato)
+    exportacao = tmp_path / 'exportacao'
+    main(['--arquivo', origem, 'exportar', '--destino', str(exportacao), '--formato', formato])
+    jogos = exportacao / f"jogos{'.csv' if formato == 'csv' else '.jsonl'}"
+    texto = jogos.read_text(encoding='utf-8')
+    jogos.write_text(texto.replace('2025-03-08T16:00:00', '08/03/2025'), encoding='utf-8')
+
+    destino = str(tmp_path / 'destino.json')
+    assert main(['--arquivo', destino, 'importar', '--origem', str(exportacao), '--formato', formato]) == 2
+    erro = capsys.readouterr().err
+    linha = 3 if formato == 'csv' else 2  # O CSV tem cabeçalho
+    assert erro.startswith("[CLI] Erro:") and f"linha {linha}:" in erro and "'data'" in erro
+
+
+def test_argumento_invalido_sai_pelo_erro_da_cli(tmp_path, capsys):
+    assert main(['--arquivo', str(tmp_path / 'c.json'), 'validar', '--processos', 'dois']) == 2
+    assert capsys.readouterr().err.startswith("[CLI] Erro:")
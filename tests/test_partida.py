@@ -0,0 +1,143 @@
+import pytest
+
+from models.campeonato import Campeonato
+from models.partida import EventoJogo
+from utils.exceptions import PartidaNaoFinalizada, PlacarInconsistente
+
+
+def _contadores(equipe) -> tuple:
+    return equipe.vitorias, equipe.empates, equipe.derrotas, equipe.gols_marcados, equipe.gols_sofridos
+
+
+def test_corrigir_resultado_troca_o_resultado_nas_equipes(campeonato_com_eventos):
+    casa, fora, _ = campeonato_com_eventos.equipes_inscritas
+    jogo = campeonato_com_eventos.fases[0].jogos[0]
+
+    jogo.corrigir_resultado(2, 2)
+
+    assert (jogo.placar_mandante, jogo.placar_visitante) == (2, 2)
+    assert _contadores(casa) == (0, 1, 0, 2, 2)
+    assert _contadores(fora) == (0, 1, 0, 2, 2)
+    assert campeonato_com_eventos.recalcular_classificacao() == []
+    # O gol sem autor saiu; os com autor ficaram
+    assert [g.jogador_nome for g in jogo.gols if g.equipe_id == casa.id] == ["Casa 0", "Fora 2"]
+
+
+def test_corrigir_resultado_nao_remove_gols_com_autor(campeonato_com_eventos):
+    casa = campeonato_com_eventos.equipes_inscritas[0]
+    jogo = campeonato_com_eventos.fases[0].jogos[0]
+
+    with pytest.raises(PlacarInconsistente):
+        jogo.corrigir_resultado(1, 0)
+
+    assert (jogo.placar_mandante, jogo.placar_visitante) == (3, 0)
+    assert _contadores(casa) == (1, 0, 0, 3, 0)
+
+
+def test_corrigir_resultado_exige_partida_finalizada(campeonato_com_eventos):
+    with pytest.raises(PartidaNaoFinalizada):
+        campeonato_com_eventos.fases[0].jogos[1].corrigir_resultado(1, 0)
+
+
+def test_reabrir_desfaz_o_resultado_e_mantem_os_gols(campeonato_com_eventos):
+    casa, fora, _ = campeonato_com_eventos.equipes_inscritas
+    jogo = campeonato_com_eventos.fases[0].jogos[0]
+
+    jogo.reabrir("Ao vivo")
+
+    assert not jogo.finalizada and jogo.status == "Ao vivo"
+    assert (jogo.placar_mandante, jogo.placar_visitante) == (3, 0)
+    assert _contadores(casa) == _contadores(fora) == (0, 0, 0, 0, 0)
+    assert casa.forma.jogos == 0
+
+    jogo.registrar_gol(fora.id, fora.elenco[0], minuto=90)
+    jogo.finalizar_partida()
+    assert _contadores(casa) == (1, 0, 0, 3, 1)
+    assert campeonato_com_eventos.recalcular_classificacao() == []
+
+
+def test_partida_cancelada_nao_conta_na_tabela_nem_na_artilharia(campeonato_com_eventos):
+    casa = campeonato_com_eventos.equipes_inscritas[0]
+    jogo = campeonato_com_eventos.fases[0].jogos[0]
+    assert campeonato_com_eventos.obter_artilharia()[0]['jogador'] == "Casa 0"
+
+    jogo.cancelar()
+
+    assert jogo.status == "Cancelada" and not jogo.finalizada
+    assert _contadores(casa) == (0, 0, 0, 0, 0)
+    assert campeonato_com_eventos.obter_artilharia() == []
+    assert campeonato_com_eventos.recalcular_classificacao() == []
+
+
+def test_correcao_depois_de_recarregar_atualiza_as_equipes_inscritas(campeonato_com_eventos):
+    camp = Campeonato.from_dict(campeonato_com_eventos.to_dict())
+    casa, fora, _ = camp.equipes_inscritas
+    jogo = camp.fases[0].jogos[0]
+    assert jogo.mandante is casa and jogo.visitante is fora
+
+    jogo.corrigir_resultado(2, 3)
+
+    assert _contadores(casa) == (0, 0, 1, 2, 3)
+    assert _contadores(fora) == (1, 0, 0, 3, 2)
+    assert camp.recalcular_classificacao() == []
+
+
+def test_placar_e_projecao_dos_gols_registrados(campeonato):
+    casa, fora, _ = campeonato.equipes_inscritas
+    jogo = campeonato.fases[0].jogos[0]
+
+    jogo.registrar_gol(casa.id, casa.elenco[0], minuto=10)
+    contra = jogo.registrar_gol(fora.id, casa.elenco[1], minuto=20, contra=True)
+    jogo.registrar_cartao(fora.id, fora.elenco[0], minuto=30)
+
+    assert (jogo.placar_mandante, jogo.placar_visitante) == (1, 1)
+    assert [g.tipo for g in jogo.gols] == ["gol", "gol_contra"]
+    assert len(jogo.cartoes) == 1
+
+    jogo.remover_evento(contra.id)
+    assert (jogo.placar_mandante, jogo.placar_visitante) == (1, 0)
+    assert contra not in jogo.eventos
+
+
+def test_remover_gol_de_partida_finalizada_atualiza_as_equipes(campeonato_com_eventos):
+    casa, fora, _ = campeonato_com_eventos.equipes_inscritas
+    jogo = campeonato_com_eventos.fases[0].jogos[0]
+    contra = next(g for g in jogo.gols if g.tipo == "gol_contra")
+
+    jogo.remover_evento(contra.id)
+    jogo.registrar_gol(fora.id, fora.elenco[0], minuto=80)
+    jogo.registrar_gol(fora.id, fora.elenco[1], minuto=85)
+
+    assert (jogo.placar_mandante, jogo.placar_visitante) == (2, 2)
+    assert _contadores(casa) == _contadores(fora) == (0, 1, 0, 2, 2)
+    assert campeonato_com_eventos.recalcular_classificacao() == []
+
+
+def test_evento_de_tipo_desconhecido_e_recusado(campeonato):
+    jogo = campeonato.fases[0].jogos[0]
+
+    with pytest.raises(ValueError):
+        jogo.registrar_evento(EventoJogo("escanteio"))
+    assert jogo.eventos == []
+
+
+def test_dados_antigos_com_lista_de_gols(campeonato):
+    casa, fora, _ = campeonato.equipes_inscritas
+    dados = campeonato.to_dict()
+    jogo = dados['fases'][0]['jogos'][0]
+    del jogo['eventos']
+    jogo.update(finalizada=True, status="Finalizada", placar_mandante=2, placar_visitante=1, gols=[
+        {'minuto': 9, 'equipe_id': casa.id, 'jogador_id': casa.elenco[0].id, 'jogador_nome': "Casa 0"},
+    ])
+
+    camp = Campeonato.from_dict(dados)
+    carregado = camp.fases[0].jogos[0]
+
+    assert (carregado.placar_mandante, carregado.placar_visitante) == (2, 1)
+    # O placar final digitado sem gols vira gols sem autor
+    assert [(g.tipo, g.equipe_id, g.jogador_nome) for g in carregado.gols] == [
+        ("gol", casa.id, "Casa 0"), ("gol", casa.id, ""), ("gol", fora.id, ""),
+    ]
+    # Regravado, passa a guardar o registro de eventos e não cria novos gols
+    regravado = Campeonato.from_dict(camp.to_dict()).fases[0].jogos[0]
+    assert [g.id for g in regravado.gols] == [g.id for g in carregado.gols]
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytest
+
+from models.campeonato import Campeonato, Fase
+from models.equipe import Equipe
+from models.partida import Jogo
+from models.rating import MotorRating
+
+
+def _temporada() -> Campeonato:
+    camp = Campeonato("Liga", 2025)
+    a, b, c = (Equipe(nome, "Técnico") for nome in ("A", "B", "C"))
+    for equipe in (a, b, c):
+        camp.cadastrar_equipe(equipe)
+    fase = Fase("Rodada 1", 1)
+    camp.adicionar_fase(fase)
+    # Dois jogos no mesmo horário: o histórico não pode ser localizado pela data
+    for casa, fora, dia, hora, placar in ((a, b, 1, 16, (2, 0)), (c, a, 1, 16, (1, 1)),
+                                          (b, c, 8, 16, (3, 1)), (a, c, 15, 16, (0, 1))):
+        jogo = Jogo(casa, fora, datetime(2025, 3, dia, hora), "Estádio")
+        fase.adicionar_jogo(jogo)
+        jogo.finalizar_partida(*placar)
+    return camp
+
+
+def _estado(motor: MotorRating, camp: Campeonato):
+    return {e.nome: (motor.elo(e), motor.historico(e)) for e in camp.equipes_inscritas}
+
+
+def _iguais(obtido, esperado):
+    for nome, (elo, historico) in esperado.items():
+        assert obtido[nome][0] == pytest.approx(elo)
+        assert [d for d, _ in obtido[nome][1]] == [d for d, _ in historico]
+        assert [e for _, e in obtido[nome][1]] == pytest.approx([e for _, e in historico])
+
+
+@pytest.mark.parametrize("indice", [0, 1, 2, 3])
+def test_corrigir_jogo_refaz_os_posteriores_como_reconstruir(indice):
+    camp = _temporada()
+    motor = MotorRating()
+    motor.reconstruir([camp])
+    jogo = camp.fases[0].jogos[indice]
+
+    jogo.corrigir_resultado(4, 0)
+    motor.registrar_partida(jogo)
+
+    referencia = MotorRating()
+    referencia.reconstruir([camp])
+    _iguais(_estado(motor, camp), _estado(referencia, camp))
+
+
+def test_cancelar_jogo_no_mesmo_horario_remove_o_ponto_certo():
+    camp = _temporada()
+    motor = MotorRating()
+    motor.reconstruir([camp])
+    jogo = camp.fases[0].jogos[1]
+
+    jogo.cancelar()
+    motor.registrar_partida(jogo)
+
+    referencia = MotorRating()
+    referencia.reconstruir([camp])
+    _iguais(_estado(motor, camp), _estado(referencia, camp))
+    assert len(motor.historico(jogo.mandante)) == 2
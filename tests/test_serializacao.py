@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from models.serializacao import serializavel
+
+
+def _modelos_a():
+    @serializavel()
+    @dataclass
+    class Item:
+        nome: str
+
+    @serializavel()
+    @dataclass
+    class Caixa:
+        itens: List[Item] = field(default_factory=list)
+
+    return Item, Caixa
+
+
+def _modelos_b():
+    @serializavel(decodificar={'valor': lambda data: data.get('valor', 0) * 2})
+    @dataclass
+    class Item:
+        valor: int = 0
+
+    return Item
+
+
+def test_classes_homonimas_mantem_serializadores_proprios():
+    item_a, caixa = _modelos_a()
+    item_b = _modelos_b()
+
+    lida = caixa.from_dict({'itens': [{'nome': 'bola'}]})
+
+    assert type(lida.itens[0]) is item_a
+    assert lida.to_dict() == {'itens': [{'nome': 'bola'}]}
+    assert item_a.from_dict({'nome': 'rede'}).nome == 'rede'
+    assert item_b.from_dict({'valor': 2}).valor == 4
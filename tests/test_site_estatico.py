@@ -0,0 +1,26 @@
+import os
+
+from persistence.dao import CampeonatoFileDAO
+from services.site_estatico import MANIFESTO, GeradorSite
+
+
+def test_conectar_gera_o_que_ja_estava_gravado(tmp_path, campeonato):
+    dao = CampeonatoFileDAO(str(tmp_path / 'campeonatos.json'))
+    camp = campeonato
+    dao.salvar(camp)  # Gravado antes de o site ser ligado
+    destino = tmp_path / 'site'
+
+    gerador = GeradorSite(str(destino))
+    gerador.conectar(dao)
+
+    assert (destino / camp.id).is_dir()
+    assert {camp.id, 'index.html', MANIFESTO} <= set(os.listdir(destino))
+    assert not [n for n in os.listdir(destino) if n.endswith('.tmp')]
+
+    # Outra sessão se conectando não gera de novo; a gravação seguinte regenera o campeonato
+    gerado = os.path.getmtime(destino / MANIFESTO)
+    gerador.conectar(CampeonatoFileDAO(dao.path))
+    assert os.path.getmtime(destino / MANIFESTO) == gerado
+    camp.nome = "Liga Renomeada"
+    dao.salvar(camp)
+    assert "Liga Renomeada" in (destino / 'index.html').read_text(encoding='utf-8')
@@ -0,0 +1,70 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from models import suico
+from models.campeonato import Campeonato
+from models.equipe import Equipe
+from models.suico import TIPO_SUICO, PareamentoSuico
+from utils.exceptions import PareamentoImpossivel, RodadaPendente
+
+
+def _torneio(n: int, rodadas: int, semente: int) -> Campeonato:
+    """Campeonato suíço com `rodadas` rodadas jogadas, com resultados sorteados."""
+    rnd = random.Random(semente)
+    camp = Campeonato("Aberto", 2025, TIPO_SUICO)
+    for i in range(n):
+        camp.cadastrar_equipe(Equipe(f"Time {i}", "Técnico"))
+    for r in range(rodadas):
+        fase, _ = PareamentoSuico(camp).gerar_rodada(datetime(2025, 1, 1 + r, 16), ["Quadra 1", "Quadra 2"])
+        camp.adicionar_fase(fase)
+        for jogo in fase.jogos:
+            jogo.finalizar_partida(rnd.randint(0, 3), rnd.randint(0, 3))
+    return camp
+
+
+def _confrontos(camp: Campeonato):
+    return [frozenset((j.mandante.id, j.visitante.id)) for f in camp.fases for j in f.jogos]
+
+
+def test_rodadas_sem_revanche_e_com_folga_rotativa():
+    camp = _torneio(9, 5, semente=1)
+
+    confrontos = _confrontos(camp)
+    assert len(confrontos) == len(set(confrontos)) == 5 * 4
+    folgas = [next(iter({e.id for e in camp.equipes_inscritas}
+                        - {x for j in f.jogos for x in (j.mandante.id, j.visitante.id)})) for f in camp.fases]
+    assert len(set(folgas)) == 5
+
+
+def test_rodada_com_jogos_pendentes_nao_e_gerada():
+    camp = _torneio(4, 1, semente=0)
+    camp.fases[0].jogos[0].reabrir()
+
+    with pytest.raises(RodadaPendente):
+        PareamentoSuico(camp).gerar_rodada(datetime(2025, 2, 1), ["Quadra 1"])
+
+
+def test_sem_pareamento_inedito_so_gera_com_revanche():
+    # 8 equipes: nesta sequência de resultados já não há pareamento inédito na 6ª rodada
+    camp = _torneio(8, 5, semente=2)
+
+    with pytest.raises(PareamentoImpossivel):
+        PareamentoSuico(camp).gerar_rodada(datetime(2025, 2, 1), ["Quadra 1"])
+    fase, folga = PareamentoSuico(camp).gerar_rodada(datetime(2025, 2, 1), ["Quadra 1"], permitir_revanche=True)
+
+    equipes = [x for j in fase.jogos for x in (j.mandante.id, j.visitante.id)]
+    assert folga is None and sorted(equipes) == sorted(e.id for e in camp.equipes_inscritas)
+    anteriores = set(_confrontos(camp))
+    assert 0 < sum(frozenset(p) in anteriores for p in ((j.mandante.id, j.visitante.id) for j in fase.jogos)) < 4
+
+
+def test_busca_limitada(monkeypatch):
+    camp = _torneio(6, 2, semente=3)
+    monkeypatch.setattr(suico, 'LIMITE_TENTATIVAS', 1)
+
+    with pytest.raises(PareamentoImpossivel):
+        PareamentoSuico(camp).parear()
+    pares, _ = PareamentoSuico(camp).parear(permitir_revanche=True)
+    assert len(pares) == 3
@@ -0,0 +1,121 @@
+"""Benchmark de inicialização do app Streamlit.
+
+Uso: python -m utils.bench_inicializacao [--repeticoes 5] [--limite-ms 1500]
+
+Executa o app sem navegador (streamlit.testing) em um processo novo, sobre uma
+cópia temporária de config.json e dos dados, e mede: importação dos módulos do
+app, primeira execução (cold start) e o tempo médio de rerun de cada página.
+Falha (código 1) se a primeira execução passar de --limite-ms ou se a
+inicialização, ou alguma página que não desenha gráficos, carregar
+plotly.express/pandas/numpy.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Páginas que podem importar bibliotecas de gráficos
+PAGINAS_COM_GRAFICOS = {"Estatísticas"}
+# plotly.graph_objects fica de fora: o próprio streamlit o importa (streamlit.elements.plotly_chart)
+MODULOS_PESADOS = ['plotly.express', 'pandas', 'numpy']
+
+_MEDICAO = r'''
+import json, sys, time
+pesados = json.loads(sys.argv[3])
+t0 = time.perf_counter()
+import streamlit, paginas, paginas.comum  # importados pelo topo de app_streamlit.py
+importacao = time.perf_counter() - t0
+pesados_inicio = [m for m in pesados if m in sys.modules]
+
+from streamlit.testing.v1 import AppTest
+from paginas import PAGINAS
+
+app = AppTest.from_file(sys.argv[1], default_timeout=120)
+app.session_state['logged_in'] = True
+app.session_state['user_role'] = 'admin'
+t0 = time.perf_counter()
+app.run()
+primeira = time.perf_counter() - t0
+pesados_primeira = [m for m in pesados if m in sys.modules and m not in pesados_inicio]
+erros = [e.value for e in app.exception]
+
+paginas = {}
+for nome in PAGINAS:
+    app.sidebar.radio[0].set_value(nome)
+    antes = {m for m in pesados if m in sys.modules}
+    t0 = time.perf_counter()
+    app.run()
+    primeiro_acesso = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(int(sys.argv[2])):
+        app.run()
+    paginas[nome] = {
+        'primeiro_acesso': primeiro_acesso,
+        'rerun': (time.perf_counter() - t0) / int(sys.argv[2]),
+        'pesados': [m for m in pesados if m in sys.modules and m not in antes],
+    }
+    erros += [e.value for e in app.exception]
+
+print(json.dumps({'importacao': importacao, 'primeira': primeira,
+                  'pesados_inicio': pesados_inicio, 'pesados_primeira': pesados_primeira,
+                  'paginas': paginas, 'erros': erros}))
+'''
+
+
+def medir(repeticoes: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copy(os.path.join(RAIZ, 'config.json'), tmp)
+        with open(os.path.join(tmp, 'config.json'), 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        caminho = config.get('armazenamento', {}).get('caminho', 'data/campeonatos.json')
+        origem = os.path.join(RAIZ, caminho)
+        destino = os.path.join(tmp, caminho)
+        if os.path.isdir(origem):
+            shutil.copytree(origem, destino)
+        elif os.path.exists(origem):
+            os.makedirs(os.path.dirname(destino), exist_ok=True)
+            shutil.copy(origem, destino)
+
+        env = dict(os.environ, PYTHONPATH=RAIZ)
+        saida = subprocess.run(
+            [sys.executable, '-c', _MEDICAO, os.path.join(RAIZ, 'app_streamlit.py'),
+             str(repeticoes), json.dumps(MODULOS_PESADOS)],
+            cwd=tmp, env=env, capture_output=True, text=True, check=True
+        )
+        return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o tempo de inicialização e de rerun do app.")
+    parser.add_argument('--repeticoes', type=int, default=5, help="Reruns medidos por página")
+    parser.add_argument('--limite-ms', type=float, default=None, help="Tempo máximo da primeira execução")
+    args = parser.parse_args()
+
+    r = medir(args.repeticoes)
+    print(f"Importação dos módulos: {r['importacao'] * 1000:.0f} ms")
+    print(f"Primeira execução:      {r['primeira'] * 1000:.0f} ms")
+    print(f"Módulos pesados após importação: {', '.join(r['pesados_inicio']) or 'nenhum'}")
+    print(f"Carregados na primeira execução: {', '.join(r['pesados_primeira']) or 'nenhum'}")
+    print(f"{'Página':<20}{'1º acesso':>12}{'rerun':>10}  carregou")
+    for nome, p in r['paginas'].items():
+        print(f"{nome:<20}{p['primeiro_acesso'] * 1000:>10.0f}ms{p['rerun'] * 1000:>8.0f}ms  {', '.join(p['pesados'])}")
+
+    falhas = [f"Erro no app: {e}" for e in r['erros']]
+    if r['pesados_inicio'] or r['pesados_primeira']:
+        falhas.append(f"Inicialização carregou {', '.join(r['pesados_inicio'] + r['pesados_primeira'])}")
+    falhas += [f"{nome} carregou {', '.join(p['pesados'])}" for nome, p in r['paginas'].items()
+               if p['pesados'] and nome not in PAGINAS_COM_GRAFICOS]
+    if args.limite_ms is not None and r['primeira'] * 1000 > args.limite_ms:
+        falhas.append(f"Primeira execução acima de {args.limite_ms:.0f} ms")
+    for falha in falhas:
+        print(f"[BENCH] {falha}")
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == '__main__':
+    main()
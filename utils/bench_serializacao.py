@@ -0,0 +1,122 @@
+"""Benchmark dos serializadores gerados por `models.serializacao`.
+
+Uso: python -m utils.bench_serializacao [--temporadas 3] [--equipes 20] [--repeticoes 3]
+
+Monta em memória uma liga sintética (turno e returno, elencos completos,
+escalações e gols registrados) e compara, sobre os mesmos objetos, os
+`to_dict`/`from_dict` gerados com a serialização genérica que eles
+substituíram: `dataclasses.asdict` na ida e leitura dos campos por reflexão
+(anotações consultadas a cada chamada) na volta. O json.dumps/loads fica fora
+da medição. Falha (código 1) se o dict gerado não for estável na ida e volta.
+"""
+import argparse
+import random
+import sys
+import time
+from dataclasses import asdict, fields, is_dataclass
+from datetime import date, datetime, time as hora
+from typing import List, get_args, get_origin, get_type_hints
+
+from models.calendario import datas_rodadas, rodizio_duplo
+from models.campeonato import Campeonato, Fase
+from models.equipe import Equipe
+from models.jogador import Jogador
+from models.partida import Escalacao, Jogo
+
+
+def liga_sintetica(temporadas: int, n_equipes: int, semente: int = 1) -> List[Campeonato]:
+    rnd = random.Random(semente)
+    campeonatos = []
+    for ano in range(2025, 2025 + temporadas):
+        camp = Campeonato(f"Liga {ano}", ano)
+        for i in range(n_equipes):
+            equipe = Equipe(f"Time {i}", f"Técnico {i}")
+            for k in range(25):
+                equipe.contratar_jogador(Jogador(f"Jogador {i}-{k}", k + 1, "Goleiro" if k == 0 else "Atacante"))
+            camp.cadastrar_equipe(equipe)
+        equipes = camp.equipes_inscritas
+        rodadas = rodizio_duplo(n_equipes)
+        for r, (jogos, dia) in enumerate(zip(rodadas, datas_rodadas(date(ano, 2, 1), len(rodadas))), 1):
+            fase = Fase(f"Rodada {r}", r)
+            camp.adicionar_fase(fase)
+            for a, b in jogos:
+                mandante, visitante = equipes[a], equipes[b]
+                jogo = Jogo(mandante, visitante, datetime.combine(dia, hora(16)), f"Estádio {a}")
+                jogo.escalacao_mandante = Escalacao([j.id for j in mandante.elenco[:11]], [j.id for j in mandante.elenco[11:18]])
+                jogo.escalacao_visitante = Escalacao([j.id for j in visitante.elenco[:11]], [j.id for j in visitante.elenco[11:18]])
+                for equipe in (mandante, visitante):
+                    for _ in range(rnd.randint(0, 3)):
+                        jogo.registrar_gol(equipe.id, rnd.choice(equipe.elenco[1:11]), rnd.randint(1, 90))
+                jogo.finalizar_partida()
+                fase.adicionar_jogo(jogo)
+        campeonatos.append(camp)
+    return campeonatos
+
+
+# Referência: serialização genérica, sem código gerado -----------------------
+
+def _sem_datetime(itens) -> dict:
+    return {k: v.isoformat() if isinstance(v, datetime) else v for k, v in itens}
+
+
+def codificar_generico(obj) -> dict:
+    return asdict(obj, dict_factory=_sem_datetime)
+
+
+def _valor_generico(tipo, valor):
+    if is_dataclass(tipo):
+        return decodificar_generico(tipo, valor)
+    if get_origin(tipo) in (list, List) and get_args(tipo):
+        return [_valor_generico(get_args(tipo)[0], v) for v in valor]
+    if tipo is datetime:
+        return datetime.fromisoformat(valor)
+    return valor
+
+
+def decodificar_generico(cls, data: dict):
+    anotacoes = get_type_hints(cls)
+    return cls(**{f.name: _valor_generico(anotacoes[f.name], data[f.name]) for f in fields(cls) if f.name in data})
+
+
+def _tempo(funcao, repeticoes: int) -> float:
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - t0)
+    return melhor
+
+
+def medir(temporadas: int, n_equipes: int, repeticoes: int) -> dict:
+    campeonatos = liga_sintetica(temporadas, n_equipes)
+    dicts = [c.to_dict() for c in campeonatos]
+    return {
+        'jogos': sum(len(f.jogos) for c in campeonatos for f in c.fases),
+        'to_dict': (_tempo(lambda: [codificar_generico(c) for c in campeonatos], repeticoes),
+                    _tempo(lambda: [c.to_dict() for c in campeonatos], repeticoes)),
+        'from_dict': (_tempo(lambda: [decodificar_generico(Campeonato, d) for d in dicts], repeticoes),
+                      _tempo(lambda: [Campeonato.from_dict(d) for d in dicts], repeticoes)),
+        'estavel': [Campeonato.from_dict(d).to_dict() for d in dicts] == dicts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara os serializadores gerados com a serialização genérica.")
+    parser.add_argument('--temporadas', type=int, default=3)
+    parser.add_argument('--equipes', type=int, default=20)
+    parser.add_argument('--repeticoes', type=int, default=3, help="Execuções por medida (vale a melhor)")
+    args = parser.parse_args()
+
+    r = medir(args.temporadas, args.equipes, args.repeticoes)
+    print(f"{args.temporadas} temporada(s), {args.equipes} equipes, {r['jogos']} jogos")
+    print(f"{'':<12}{'antes':>10}{'depois':>10}{'ganho':>8}")
+    for etapa in ('to_dict', 'from_dict'):
+        antes, depois = r[etapa]
+        print(f"{etapa:<12}{antes * 1000:>8.0f}ms{depois * 1000:>8.0f}ms{antes / depois:>7.1f}x")
+    if not r['estavel']:
+        print("[BENCH] from_dict(to_dict()) não reproduz o dict original")
+    sys.exit(0 if r['estavel'] else 1)
+
+
+if __name__ == '__main__':
+    main()
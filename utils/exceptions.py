@@ -13,3 +13,23 @@ class JogadorNaoEncontrado(AppError):
 class PartidaNaoEncontrada(AppError):
     """Lançada quando uma partida não é encontrada."""
     pass
+
+class BackupNaoEncontrado(AppError):
+    """Lançada quando um snapshot de backup não é encontrado."""
+    pass
+
+class PartidaNaoFinalizada(AppError):
+    """Lançada ao corrigir o resultado de uma partida que não foi finalizada."""
+    pass
+
+class PlacarInconsistente(AppError):
+    """Lançada quando o placar informado contradiz os gols registrados na partida."""
+    pass
+
+class RodadaPendente(AppError):
+    """Lançada ao gerar uma rodada suíça antes de a anterior terminar."""
+    pass
+
+class PareamentoImpossivel(AppError):
+    """Lançada quando não há pareamento da rodada sem repetir confrontos."""
+    pass
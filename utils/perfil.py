@@ -0,0 +1,94 @@
+"""Captura de perfil (cProfile e, opcionalmente, tracemalloc) de um trecho de código.
+
+Cada captura grava no diretório o arquivo .prof (para pstats ou snakeviz), um
+resumo em texto com as funções de maior tempo acumulado e, com memória, os
+pontos que mais alocaram, e um .json com as etiquetas (página, tamanho do
+campeonato, duração, pico de memória) usadas para listar as capturas.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import time
+import tracemalloc
+import unicodedata
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, List
+
+FUNCOES_NO_RESUMO = 30
+ALOCACOES_NO_RESUMO = 25
+
+
+def _slug(texto: str) -> str:
+    sem_acento = unicodedata.normalize('NFKD', texto).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', sem_acento.lower()).strip('-')
+
+
+@contextmanager
+def capturar(diretorio: str, nome: str | Callable[[], str], etiquetas: dict, memoria: bool = False):
+    """Perfila o bloco e grava a captura ao final, mesmo que o bloco seja
+    interrompido por exceção (ex.: st.rerun ou st.stop). As etiquetas (e o
+    nome, se for uma função) são lidas só ao gravar, e podem ser completadas
+    dentro do bloco."""
+    memoria = memoria and not tracemalloc.is_tracing()
+    if memoria:
+        tracemalloc.start()
+    perfil = cProfile.Profile()
+    inicio = time.perf_counter()
+    perfil.enable()
+    try:
+        yield
+    finally:
+        perfil.disable()
+        duracao = time.perf_counter() - inicio
+        snapshot = pico = None
+        if memoria:
+            snapshot = tracemalloc.take_snapshot()
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        _gravar(diretorio, nome() if callable(nome) else nome, etiquetas, perfil, duracao, snapshot, pico)
+
+
+def _gravar(diretorio, nome, etiquetas, perfil, duracao, snapshot, pico) -> None:
+    os.makedirs(diretorio, exist_ok=True)
+    momento = datetime.now()
+    base = os.path.join(diretorio, f"{momento:%Y%m%d-%H%M%S-%f}_{_slug(nome)}")
+    perfil.dump_stats(base + '.prof')
+
+    resumo = io.StringIO()
+    resumo.write(f"{nome} - {duracao:.3f}s\n{json.dumps(etiquetas, ensure_ascii=False)}\n\n")
+    pstats.Stats(perfil, stream=resumo).sort_stats('cumulative').print_stats(FUNCOES_NO_RESUMO)
+    if snapshot is not None:
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        resumo.write(f"\nPico de memória: {pico / 1024:.0f} KiB\nMaiores alocações (linha):\n")
+        for estatistica in snapshot.statistics('lineno')[:ALOCACOES_NO_RESUMO]:
+            resumo.write(f"  {estatistica}\n")
+    with open(base + '.txt', 'w', encoding='utf-8') as f:
+        f.write(resumo.getvalue())
+
+    with open(base + '.json', 'w', encoding='utf-8') as f:
+        json.dump(dict(etiquetas, nome=nome, momento=momento.isoformat(timespec='seconds'),
+                       duracao=round(duracao, 4), memoria_pico=pico,
+                       prof=base + '.prof', resumo=base + '.txt'), f, ensure_ascii=False)
+
+
+def listar(diretorio: str) -> List[dict]:
+    """Etiquetas das capturas do diretório, da mais recente para a mais antiga."""
+    try:
+        nomes = sorted((n for n in os.listdir(diretorio) if n.endswith('.json')), reverse=True)
+    except FileNotFoundError:
+        return []
+    capturas = []
+    for nome in nomes:
+        try:
+            with open(os.path.join(diretorio, nome), 'r', encoding='utf-8') as f:
+                capturas.append(json.load(f))
+        except (json.JSONDecodeError, OSError):
+            continue
+    return capturas